@@ -0,0 +1,291 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from itertools import accumulate
+from typing import Callable
+
+from csr_graph import CSRGraph
+from exporters import export_graph
+from graph_lib import AbstractGraph
+from list_graph import AdjacencyListGraph
+from matrix_graph import AdjacencyMatrixGraph
+
+"""
+Benchmarks das implementações de AbstractGraph em grafos sintéticos de colaboração.
+
+Gera grafos com distribuição de atividade em lei de potência (poucos usuários concentram
+a maior parte das interações, como em repositórios do GitHub), mede cada operação da
+interface e o pipeline completo de `build_weighted_graph`, e reporta vazão, percentis de
+latência e pico de memória em JSON, para acompanhamento de regressões.
+
+Uso: python benchmark.py --sizes 1000,5000 --output bench.json
+"""
+
+IMPLEMENTATIONS: dict[str, type[AbstractGraph]] = {
+    "list": AdjacencyListGraph,
+    "matrix": AdjacencyMatrixGraph,
+    "csr": CSRGraph,
+}
+
+# Pesos de interação do grafo integrado (comentário, review, merge) e suas frequências relativas
+INTERACTION_WEIGHTS = (2.0, 4.0, 5.0)
+INTERACTION_FREQUENCIES = (0.75, 0.2, 0.05)
+
+
+class _Names:
+    def get_name(self, i: int) -> str:
+        return f"user{i}"
+
+
+def _power_law_weights(n: int, alpha: float) -> list[float]:
+    # Atividade do usuário de posição r proporcional a 1 / r^alpha
+    return [1.0 / (rank ** alpha) for rank in range(1, n + 1)]
+
+
+def synthetic_interactions(num_users: int, num_interactions: int, rng: random.Random,
+                           alpha: float = 1.2) -> list[tuple[int, int, float]]:
+    """Interações (u, v, peso) com origens e destinos sorteados por lei de potência."""
+    activity = _power_law_weights(num_users, alpha)
+    popularity = activity[:]
+    rng.shuffle(popularity)
+
+    sources = rng.choices(range(num_users), weights=activity, k=num_interactions)
+    targets = rng.choices(range(num_users), weights=popularity, k=num_interactions)
+    weights = rng.choices(INTERACTION_WEIGHTS, weights=INTERACTION_FREQUENCIES, k=num_interactions)
+    return [(u, v, w) for u, v, w in zip(sources, targets, weights) if u != v]
+
+
+def synthetic_dump(num_users: int, num_issues: int, comments_per_issue: float, rng: random.Random,
+                   alpha: float = 1.2) -> dict:
+    """
+    Registros no formato dos JSONs do downloader (issues, comentários e reviews), com
+    autores e comentaristas em lei de potência. Cerca de metade das issues são PRs.
+    """
+    # Pesos acumulados calculados uma vez: cada sorteio custa O(log n), e não O(n)
+    cumulative = list(accumulate(_power_law_weights(num_users, alpha)))
+    users = [{"login": f"user{i}", "id": i + 1, "node_id": f"U_{i}", "type": "User"} for i in range(num_users)]
+    url = "https://api.github.com/repos/sintetico/repo"
+
+    def pick() -> dict:
+        return rng.choices(users, cum_weights=cumulative)[0]
+
+    issues, issue_comments, pulls_comments, pulls_reviews = [], [], [], {}
+    comment_id = 0
+    for number in range(1, num_issues + 1):
+        is_pr = rng.random() < 0.5
+        closed = rng.random() < 0.7
+        issues.append({
+            "id": number, "node_id": f"I_{number}", "user": pick(), "number": number,
+            "title": f"Issue {number}", "state": "closed" if closed else "open", "comments": 0,
+            "closed_at": "2024-01-01T00:00:00Z" if closed else None,
+            "pull_request": {"merged_at": "2024-01-01T00:00:00Z" if closed else None} if is_pr else None,
+            "closed_by": pick() if closed else None,
+        })
+
+        for _ in range(int(rng.expovariate(1.0 / comments_per_issue))):
+            comment_id += 1
+            if is_pr and rng.random() < 0.4:
+                pulls_comments.append({"id": comment_id, "node_id": f"C_{comment_id}", "user": pick(),
+                                       "pull_request_url": f"{url}/pulls/{number}"})
+            else:
+                issue_comments.append({"id": comment_id, "node_id": f"C_{comment_id}", "user": pick(),
+                                       "issue_url": f"{url}/issues/{number}"})
+
+        if is_pr:
+            reviews = []
+            for _ in range(rng.randint(0, 3)):
+                comment_id += 1
+                reviews.append({"id": comment_id, "node_id": f"R_{comment_id}", "user": pick(),
+                                "pull_request_url": f"{url}/pulls/{number}"})
+            pulls_reviews[str(number)] = reviews
+
+    return {"issues": issues, "issues_comments": issue_comments,
+            "pulls_comments": pulls_comments, "pulls_reviews": pulls_reviews}
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summarize(latencies_ns: list[int], total_ns: int) -> dict:
+    latencies_ns.sort()
+    return {
+        "ops": len(latencies_ns),
+        "ops_per_sec": len(latencies_ns) / (total_ns / 1e9) if total_ns else None,
+        "p50_us": _percentile(latencies_ns, 0.50) / 1e3,
+        "p90_us": _percentile(latencies_ns, 0.90) / 1e3,
+        "p99_us": _percentile(latencies_ns, 0.99) / 1e3,
+        "max_us": latencies_ns[-1] / 1e3,
+    }
+
+
+def time_calls(fn: Callable, args_list: list[tuple]) -> dict:
+    """Mede cada chamada individualmente e resume vazão e percentis de latência."""
+    clock = time.perf_counter_ns
+    latencies = []
+    start = clock()
+    for args in args_list:
+        t0 = clock()
+        fn(*args)
+        latencies.append(clock() - t0)
+    return _summarize(latencies, clock() - start)
+
+
+def time_once(fn: Callable, *args) -> dict:
+    """
+    Mede uma chamada única (operações globais) e o pico de memória alocada. O tracemalloc
+    deixa o código várias vezes mais lento, então a memória é medida numa segunda execução,
+    e `fn` precisa ser idempotente.
+    """
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": elapsed, "peak_memory_mb": peak / 2 ** 20}
+
+
+def bench_implementation(cls: type[AbstractGraph], num_users: int, edges: list[tuple[int, int, float]],
+                         num_ops: int, rng: random.Random) -> dict:
+    result: dict = {}
+
+    def build() -> None:
+        result["_graph"] = cls(num_users)
+        result["_graph"].accumulateEdges(edges)
+
+    result["build"] = time_once(build)
+    graph: AbstractGraph = result.pop("_graph")
+    result["edges"] = graph.getEdgeCount()
+
+    pairs = [(rng.randrange(num_users), rng.randrange(num_users)) for _ in range(num_ops)]
+    pairs = [(u, v) for u, v in pairs if u != v]
+    existing = rng.sample(edges, min(num_ops, len(edges)))
+    existing_pairs = [(u, v) for u, v, _ in existing]
+    vertices = [(rng.randrange(num_users),) for _ in range(num_ops)]
+
+    result["hasEdge"] = time_calls(graph.hasEdge, pairs)
+    result["getEdgeWeight"] = time_calls(graph.getEdgeWeight, existing_pairs)
+    result["setEdgeWeight"] = time_calls(graph.setEdgeWeight, [(u, v, w + 1.0) for u, v, w in existing])
+    result["getVertexOutDegree"] = time_calls(graph.getVertexOutDegree, vertices)
+    result["getVertexInDegree"] = time_calls(graph.getVertexInDegree, vertices)
+    result["removeEdge"] = time_calls(graph.removeEdge, existing_pairs)
+    result["addEdge"] = time_calls(graph.addEdge, existing_pairs)
+    result["isConnected"] = time_once(graph.isConnected)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result["export_gdf"] = time_once(export_graph, graph, _Names(), os.path.join(tmp, "g.gdf"))
+
+    return result
+
+
+def bench_pipeline(num_users: int, num_issues: int, comments_per_issue: float, rng: random.Random) -> dict:
+    """Mede a decodificação dos registros e `build_weighted_graph` sobre um dump sintético."""
+    import main
+    from data_format import Issue, IssueComment, PullComment
+
+    dump = synthetic_dump(num_users, num_issues, comments_per_issue, rng)
+    decoded: dict = {}
+
+    def decode() -> None:
+        decoded["issues"] = main.process_list(Issue, dump["issues"])
+        decoded["issue_comments"] = main.process_list(IssueComment, dump["issues_comments"])
+        decoded["pulls_comments"] = main.process_list(PullComment, dump["pulls_comments"])
+        decoded["pulls_reviews"] = main.process_dict(PullComment, dump["pulls_reviews"])
+
+    def build() -> None:
+        mapper = main.UserMapper()
+        for i in range(num_users):
+            mapper.get_id(f"user{i}")
+        authors = {issue.number: mapper.get_id(issue.user.login) for issue in decoded["issues"]}
+        decoded["result"] = main.build_weighted_graph(
+            mapper, decoded["issues"], decoded["issue_comments"], decoded["pulls_comments"],
+            decoded["pulls_reviews"].items(), authors)
+
+    records = (len(dump["issues"]) + len(dump["issues_comments"]) + len(dump["pulls_comments"])
+               + sum(len(r) for r in dump["pulls_reviews"].values()))
+    # O pipeline registra o progresso na saída padrão, que aqui é reservada ao relatório JSON
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = {"records": records, "decode": time_once(decode), "build_weighted_graph": time_once(build)}
+    result["edges"] = decoded["result"][0].getEdgeCount()
+    for stage in ("decode", "build_weighted_graph"):
+        result[stage]["records_per_sec"] = records / result[stage]["seconds"] if result[stage]["seconds"] else None
+    return result
+
+
+def run_benchmarks(sizes: list[int], edges_per_user: int = 10, num_ops: int = 2000,
+                   implementations: list[str] | None = None, matrix_limit: int = 5000,
+                   csr_mutation_limit: int = 200, seed: int = 0) -> dict:
+    """
+    Executa os benchmarks para cada número de usuários em `sizes`. A matriz é ignorada acima
+    de `matrix_limit` vértices (memória O(V²)); no CSR, addEdge/removeEdge custam O(V + E),
+    então o número dessas operações é limitado a `csr_mutation_limit`.
+    """
+    implementations = implementations or list(IMPLEMENTATIONS)
+    report = {
+        "python": sys.version.split()[0],
+        "seed": seed,
+        "edges_per_user": edges_per_user,
+        "results": [],
+    }
+
+    for size in sizes:
+        rng = random.Random(seed + size)
+        edges = synthetic_interactions(size, size * edges_per_user, rng)
+        entry: dict = {"users": size, "interactions": len(edges), "implementations": {}}
+
+        for name in implementations:
+            if name == "matrix" and size > matrix_limit:
+                entry["implementations"][name] = {"skipped": f"mais de {matrix_limit} vértices"}
+                continue
+            ops = min(num_ops, csr_mutation_limit) if name == "csr" else num_ops
+            entry["implementations"][name] = bench_implementation(
+                IMPLEMENTATIONS[name], size, edges, ops, random.Random(seed))
+
+        entry["pipeline"] = bench_pipeline(size, size * 2, edges_per_user / 2, random.Random(seed + size))
+        report["results"].append(entry)
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks das implementações de grafos.")
+    parser.add_argument("--sizes", default="1000,5000", help="Números de usuários, separados por vírgula")
+    parser.add_argument("--edges-per-user", type=int, default=10)
+    parser.add_argument("--ops", type=int, default=2000, help="Chamadas medidas por operação")
+    parser.add_argument("--impls", default=",".join(IMPLEMENTATIONS),
+                        help=f"Implementações ({', '.join(IMPLEMENTATIONS)})")
+    parser.add_argument("--matrix-limit", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Arquivo JSON de saída (padrão: saída padrão)")
+    args = parser.parse_args()
+
+    report = run_benchmarks(
+        sizes=[int(size) for size in args.sizes.split(",")],
+        edges_per_user=args.edges_per_user,
+        num_ops=args.ops,
+        implementations=[name.strip() for name in args.impls.split(",")],
+        matrix_limit=args.matrix_limit,
+        seed=args.seed,
+    )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
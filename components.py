@@ -0,0 +1,129 @@
+from array import array
+
+from graph_lib import AbstractGraph
+
+"""
+Componentes conexas de qualquer AbstractGraph em O(V + E).
+
+- Fracamente conexas: union-find (com compressão de caminho e união por tamanho) sobre as arestas.
+- Fortemente conexas: Tarjan iterativo, com pilha explícita (sem limite de recursão).
+
+As funções retornam `(labels, sizes)`: `labels[v]` é o rótulo da componente do vértice v
+(0..k-1) e `sizes[c]` é o número de vértices da componente c.
+"""
+
+
+def _successor_arrays(graph: AbstractGraph) -> tuple[array, array]:
+    # Sucessores em formato CSR (offsets, targets), montados vértice a vértice em O(V + E)
+    n = graph.getVertexCount()
+    offsets, targets = array('q', [0]), array('i')
+    for u in range(n):
+        targets.extend(v for v, _ in graph.iterSuccessors(u))
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def _relabel(roots: list[int]) -> tuple[list[int], list[int]]:
+    # Converte identificadores arbitrários de componente em rótulos 0..k-1, na ordem dos vértices
+    labels: list[int] = []
+    sizes: list[int] = []
+    mapping: dict[int, int] = {}
+    for root in roots:
+        label = mapping.get(root)
+        if label is None:
+            label = mapping[root] = len(sizes)
+            sizes.append(0)
+        labels.append(label)
+        sizes[label] += 1
+    return labels, sizes
+
+
+def weak_components(graph: AbstractGraph) -> tuple[list[int], list[int]]:
+    """Componentes fracamente conexas (ignorando a direção das arestas)."""
+    n = graph.getVertexCount()
+    parent = list(range(n))
+    size = [1] * n
+
+    def find(x: int) -> int:
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    for u, v, _ in graph.iterEdges():
+        ru, rv = find(u), find(v)
+        if ru != rv:
+            if size[ru] < size[rv]:
+                ru, rv = rv, ru
+            parent[rv] = ru
+            size[ru] += size[rv]
+
+    return _relabel([find(v) for v in range(n)])
+
+
+def strong_components(graph: AbstractGraph) -> tuple[list[int], list[int]]:
+    """Componentes fortemente conexas (Tarjan iterativo)."""
+    n = graph.getVertexCount()
+    offsets, targets = _successor_arrays(graph)
+
+    index = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    stack: list[int] = []
+    component = [-1] * n
+    counter = 0
+    num_components = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        # Cada quadro guarda o vértice e a posição do próximo sucessor a visitar
+        work = [[root, offsets[root]]]
+
+        while work:
+            frame = work[-1]
+            v, i = frame
+            if i < offsets[v + 1]:
+                frame[1] = i + 1
+                w = targets[i]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append([w, offsets[w]])
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[v] < low[parent]:
+                    low[parent] = low[v]
+
+            if low[v] == index[v]:
+                while True:
+                    x = stack.pop()
+                    on_stack[x] = 0
+                    component[x] = num_components
+                    if x == v:
+                        break
+                num_components += 1
+
+    return _relabel(component)
+
+
+def largest_component(labels: list[int], sizes: list[int]) -> list[int]:
+    """Vértices da maior componente (útil para separar o núcleo da comunidade)."""
+    if not sizes:
+        return []
+    biggest = max(range(len(sizes)), key=sizes.__getitem__)
+    return [v for v, label in enumerate(labels) if label == biggest]
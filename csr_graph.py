@@ -0,0 +1,330 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+from graph_lib import AbstractGraph
+from list_graph import AdjacencyListGraph
+
+
+class CSRGraph(AbstractGraph):
+    """
+    Grafo direcionado em formato CSR (Compressed Sparse Row).
+
+    As arestas ficam em três buffers contíguos (`array`): `offsets` delimita a faixa de
+    cada vértice em `targets`/`weights`, cujos destinos são mantidos ordenados. Não há
+    um dicionário por vértice nem floats "boxed", o que reduz bastante o uso de memória
+    em relação ao AdjacencyListGraph.
+
+    Pensado para grafos já construídos (ver `fromEdges` e `fromListGraph`): consultas
+    custam O(log grau), mas addEdge/removeEdge custam O(V + E) por deslocarem os buffers.
+    Os predecessores vêm de um índice reverso montado na primeira consulta e descartado
+    a cada mudança estrutural.
+    """
+
+    def __init__(self, numVertices: int):
+        self.num_vertices = numVertices
+        self.offsets = array('q', bytes(8 * (numVertices + 1)))
+        self.targets = array('i')
+        self.weights = array('d')
+        self.in_degrees = array('i', bytes(4 * numVertices))
+        self.vertex_weights = array('d', [1.0]) * numVertices
+        self.num_edges = 0
+        self._reverse = None
+
+    @classmethod
+    def fromEdges(cls, numVertices: int, edges: Iterable[tuple[int, int, float]]) -> "CSRGraph":
+        """
+        Constrói o grafo a partir de triplas (u, v, peso) em O(E log E).
+        Pesos de arestas repetidas são somados.
+        """
+        graph = cls(numVertices)
+        ordered = sorted(edges)
+
+        last_u, last_v = -1, -1
+        for u, v, w in ordered:
+            graph._validate_index(u)
+            graph._validate_index(v)
+            if u == v:
+                raise ValueError("Laços (self-loops) não são permitidos.")
+
+            if u == last_u and v == last_v:
+                graph.weights[-1] += w
+                continue
+
+            graph.targets.append(v)
+            graph.weights.append(w)
+            graph.offsets[u + 1] += 1
+            graph.in_degrees[v] += 1
+            last_u, last_v = u, v
+
+        offsets = graph.offsets
+        for i in range(numVertices):
+            offsets[i + 1] += offsets[i]
+
+        graph.num_edges = len(graph.targets)
+        return graph
+
+    @classmethod
+    def fromListGraph(cls, graph: AdjacencyListGraph) -> "CSRGraph":
+        """Converte um AdjacencyListGraph em CSR, preservando pesos de arestas e vértices."""
+        csr = cls(graph.getVertexCount())
+
+        for u in range(csr.num_vertices):
+            for v, w in sorted(graph.adj[u].items()):
+                csr.targets.append(v)
+                csr.weights.append(w)
+                csr.in_degrees[v] += 1
+            csr.offsets[u + 1] = len(csr.targets)
+            csr.vertex_weights[u] = graph.getVertexWeight(u)
+
+        csr.num_edges = len(csr.targets)
+        return csr
+
+    @classmethod
+    def fromGraph(cls, graph: AbstractGraph) -> "CSRGraph":
+        """Converte qualquer AbstractGraph em CSR, preservando pesos de arestas e vértices."""
+        csr = cls.fromEdges(graph.getVertexCount(), graph.iterEdges())
+        for v in range(csr.num_vertices):
+            csr.vertex_weights[v] = graph.getVertexWeight(v)
+        return csr
+
+    def toListGraph(self) -> AdjacencyListGraph:
+        """Converte de volta para um AdjacencyListGraph (útil para edições frequentes)."""
+        graph = AdjacencyListGraph(self.num_vertices)
+
+        for u in range(self.num_vertices):
+            graph.setVertexWeight(u, self.vertex_weights[u])
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[i]
+                graph.addEdge(u, v)
+                graph.setEdgeWeight(u, v, self.weights[i])
+
+        return graph
+
+    def _validate_index(self, v: int):
+        if v < 0 or v >= self.num_vertices:
+            raise ValueError(f"Vértice {v} inválido. Deve estar entre 0 e {self.num_vertices - 1}.")
+
+    def _find(self, u: int, v: int) -> int:
+        # Posição de v na faixa ordenada de u, ou -1 se a aresta não existir
+        start, end = self.offsets[u], self.offsets[u + 1]
+        i = bisect_left(self.targets, v, start, end)
+        if i < end and self.targets[i] == v:
+            return i
+        return -1
+
+    def _reverse_index(self) -> tuple[array, array, array]:
+        # (in_offsets, origens, posições em weights) por destino, via counting sort em O(V + E)
+        if self._reverse is None:
+            n, offsets, targets = self.num_vertices, self.offsets, self.targets
+            in_offsets = array('q', bytes(8 * (n + 1)))
+            for v in range(n):
+                in_offsets[v + 1] = in_offsets[v] + self.in_degrees[v]
+
+            cursor = in_offsets[:-1]
+            sources = array('i', bytes(4 * len(targets)))
+            positions = array('q', bytes(8 * len(targets)))
+            for u in range(n):
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = targets[i]
+                    p = cursor[v]
+                    sources[p], positions[p] = u, i
+                    cursor[v] = p + 1
+            self._reverse = (in_offsets, sources, positions)
+        return self._reverse
+
+    def getVertexCount(self) -> int:
+        return self.num_vertices
+
+    def getEdgeCount(self) -> int:
+        return self.num_edges
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        self._validate_index(u)
+        self._validate_index(v)
+        return self._find(u, v) != -1
+
+    def addEdge(self, u: int, v: int) -> None:
+        self._validate_index(u)
+        self._validate_index(v)
+
+        if u == v:
+            raise ValueError("Laços (self-loops) não são permitidos.")
+
+        if self._find(u, v) != -1:
+            return
+
+        i = bisect_left(self.targets, v, self.offsets[u], self.offsets[u + 1])
+        self.targets.insert(i, v)
+        self.weights.insert(i, 1.0)
+        for k in range(u + 1, self.num_vertices + 1):
+            self.offsets[k] += 1
+        self.in_degrees[v] += 1
+        self.num_edges += 1
+        self._reverse = None
+
+    def removeEdge(self, u: int, v: int) -> None:
+        self._validate_index(u)
+        self._validate_index(v)
+
+        i = self._find(u, v)
+        if i == -1:
+            return
+
+        del self.targets[i]
+        del self.weights[i]
+        for k in range(u + 1, self.num_vertices + 1):
+            self.offsets[k] -= 1
+        self.in_degrees[v] -= 1
+        self.num_edges -= 1
+        self._reverse = None
+
+    def accumulateEdges(self, edges: Iterable[tuple[int, int, float]]) -> None:
+        edges = self._validate_edges(edges)
+        if not edges:
+            return
+
+        # Ordena só o lote e o intercala com as faixas já ordenadas: O(k log k + V + E)
+        batch = sorted(edges)
+        offsets, targets, weights, in_degrees = self.offsets, self.targets, self.weights, self.in_degrees
+        new_offsets, new_targets, new_weights = array('q', [0]), array('i'), array('d')
+
+        j = 0
+        for u in range(self.num_vertices):
+            i, end = offsets[u], offsets[u + 1]
+            while j < len(batch) and batch[j][0] == u:
+                _, v, w = batch[j]
+                j += 1
+                while i < end and targets[i] < v:
+                    i += 1
+                    new_targets.append(targets[i - 1])
+                    new_weights.append(weights[i - 1])
+
+                if len(new_targets) > new_offsets[-1] and new_targets[-1] == v:
+                    # Aresta repetida no lote
+                    new_weights[-1] += w
+                elif i < end and targets[i] == v:
+                    new_targets.append(v)
+                    new_weights.append(weights[i] + w)
+                    i += 1
+                else:
+                    new_targets.append(v)
+                    new_weights.append(w)
+                    in_degrees[v] += 1
+
+            new_targets.extend(targets[i:end])
+            new_weights.extend(weights[i:end])
+            new_offsets.append(len(new_targets))
+
+        self.offsets, self.targets, self.weights = new_offsets, new_targets, new_weights
+        self.num_edges = len(new_targets)
+        self._reverse = None
+
+    def iterSuccessors(self, u: int) -> Iterator[tuple[int, float]]:
+        self._validate_index(u)
+        start, end = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def iterPredecessors(self, v: int) -> Iterator[tuple[int, float]]:
+        self._validate_index(v)
+        in_offsets, sources, positions = self._reverse_index()
+        weights = self.weights
+        return ((sources[p], weights[positions[p]]) for p in range(in_offsets[v], in_offsets[v + 1]))
+
+    def iterEdges(self) -> Iterator[tuple[int, int, float]]:
+        # Faixas contíguas de targets/weights
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for u in range(self.num_vertices):
+            for i in range(offsets[u], offsets[u + 1]):
+                yield u, targets[i], weights[i]
+
+    def isSucessor(self, u: int, v: int) -> bool:
+        return self.hasEdge(u, v)
+
+    def isPredessor(self, u: int, v: int) -> bool:
+        return self.hasEdge(v, u)
+
+    def isDivergent(self, u1: int, v1: int, u2: int, v2: int) -> bool:
+        if not (self.hasEdge(u1, v1) and self.hasEdge(u2, v2)):
+            return False
+        return u1 == u2 and v1 != v2
+
+    def isConvergent(self, u1: int, v1: int, u2: int, v2: int) -> bool:
+        if not (self.hasEdge(u1, v1) and self.hasEdge(u2, v2)):
+            return False
+        return v1 == v2 and u1 != u2
+
+    def isIncident(self, u: int, v: int, x: int) -> bool:
+        if not self.hasEdge(u, v):
+            return False
+        return x == u or x == v
+
+    def getVertexInDegree(self, u: int) -> int:
+        self._validate_index(u)
+        return self.in_degrees[u]
+
+    def getVertexOutDegree(self, u: int) -> int:
+        self._validate_index(u)
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def setVertexWeight(self, v: int, w: float) -> None:
+        self._validate_index(v)
+        self.vertex_weights[v] = w
+
+    def getVertexWeight(self, v: int) -> float:
+        self._validate_index(v)
+        return self.vertex_weights[v]
+
+    def setEdgeWeight(self, u: int, v: int, w: float) -> None:
+        self._validate_index(u)
+        self._validate_index(v)
+        i = self._find(u, v)
+        if i != -1:
+            self.weights[i] = w
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        self._validate_index(u)
+        self._validate_index(v)
+        i = self._find(u, v)
+        return self.weights[i] if i != -1 else 0.0
+
+    def isConnected(self) -> bool:
+        if self.num_vertices == 0: return False
+
+        # Conectividade fraca via union-find sobre as arestas: O(E α(V))
+        parent = array('i', range(self.num_vertices))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        components = self.num_vertices
+        for u in range(self.num_vertices):
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                ru, rv = find(u), find(self.targets[i])
+                if ru != rv:
+                    parent[ru] = rv
+                    components -= 1
+
+        return components == 1
+
+    def isEmptyGraph(self) -> bool:
+        return self.num_edges == 0
+
+    def isCompleteGraph(self) -> bool:
+        max_edges = self.num_vertices * (self.num_vertices - 1)
+        return self.num_edges == max_edges
+
+    def exportToGEPHI(self, path: str) -> None:
+        with open(path, 'w') as f:
+            f.write("nodedef>name VARCHAR,label VARCHAR,weight DOUBLE\n")
+            for i in range(self.num_vertices):
+                f.write(f"v{i},Node {i},{self.vertex_weights[i]}\n")
+
+            f.write("edgedef>node1 VARCHAR,node2 VARCHAR,weight DOUBLE,directed BOOLEAN\n")
+            for u in range(self.num_vertices):
+                for i in range(self.offsets[u], self.offsets[u + 1]):
+                    f.write(f"v{u},v{self.targets[i]},{self.weights[i]},true\n")
+        print(f"Grafo (CSR) exportado para {path}")
@@ -23,6 +23,12 @@ class PullRequest:
     merged_by: Optional[User]
 
 
+@dataclass
+class IssuePullRequest:
+    # If present it represents it was merged
+    merged_at: Optional[str]
+
+
 @dataclass
 class Issue:
     id: int
@@ -35,7 +41,7 @@ class Issue:
     comments: int
     closed_at: Optional[str]
     # If present this issue is a pull request
-    pull_request: Optional[dict] 
+    pull_request: Optional[IssuePullRequest]
     closed_by: Optional[User]
 
 
@@ -46,6 +52,7 @@ class IssueComment:
     # Is None if the account was deleted, skip if so
     user: Optional[User]
     issue_url: str
+    created_at: Optional[str]
 
 @dataclass
 class PullComment:
@@ -53,4 +60,7 @@ class PullComment:
     node_id: str
     # Is None if the account was deleted, skip if so
     user: Optional[User]
-    pull_request_url: str
\ No newline at end of file
+    pull_request_url: str
+    created_at: Optional[str]
+    # Only present on reviews, which have no created_at
+    submitted_at: Optional[str]
\ No newline at end of file
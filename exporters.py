@@ -0,0 +1,112 @@
+import gzip
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+from graph_lib import AbstractGraph
+
+"""
+Exportação de grafos para arquivos (GDF, GraphML, GEXF e lista de arestas).
+
+Os nomes dos vértices são resolvidos uma única vez, as arestas são percorridas com
+`iterEdges` (o caminho mais direto de cada implementação de grafo) e as linhas são
+escritas em blocos, com saída opcionalmente compactada com gzip.
+"""
+
+CHUNK_LINES = 1 << 16
+BUFFER_SIZE = 1 << 20
+
+
+def iter_graph_edges(graph: AbstractGraph) -> Iterator[tuple[int, int, float]]:
+    """Percorre as arestas (u, v, peso) de qualquer AbstractGraph em O(V + E) (ver `AbstractGraph.iterEdges`)."""
+    return graph.iterEdges()
+
+
+def _write_chunked(f: TextIO, lines: Iterable[str]) -> None:
+    chunk: list[str] = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= CHUNK_LINES:
+            f.write("".join(chunk))
+            chunk.clear()
+    if chunk:
+        f.write("".join(chunk))
+
+
+def _write_gdf(f: TextIO, graph: AbstractGraph, names: list[str]) -> None:
+    f.write("nodedef>name VARCHAR,label VARCHAR\n")
+    _write_chunked(f, (f"{name},{name}\n" for name in names))
+
+    f.write("edgedef>node1 VARCHAR,node2 VARCHAR,weight DOUBLE,directed BOOLEAN\n")
+    _write_chunked(f, (f"{names[u]},{names[v]},{w},true\n" for u, v, w in iter_graph_edges(graph)))
+
+
+def _write_graphml(f: TextIO, graph: AbstractGraph, names: list[str]) -> None:
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+            '  <key id="label" for="node" attr.name="label" attr.type="string"/>\n'
+            '  <key id="weight" for="edge" attr.name="weight" attr.type="double"/>\n'
+            '  <graph id="G" edgedefault="directed">\n')
+    _write_chunked(f, (f'    <node id="n{i}"><data key="label">{escape(name)}</data></node>\n'
+                       for i, name in enumerate(names)))
+    _write_chunked(f, (f'    <edge source="n{u}" target="n{v}"><data key="weight">{w}</data></edge>\n'
+                       for u, v, w in iter_graph_edges(graph)))
+    f.write('  </graph>\n'
+            '</graphml>\n')
+
+
+def _write_gexf(f: TextIO, graph: AbstractGraph, names: list[str]) -> None:
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<gexf xmlns="http://gexf.net/1.2" version="1.2">\n'
+            '  <graph defaultedgetype="directed">\n'
+            '    <nodes>\n')
+    _write_chunked(f, (f'      <node id="{i}" label={quoteattr(name)}/>\n' for i, name in enumerate(names)))
+    f.write('    </nodes>\n'
+            '    <edges>\n')
+    _write_chunked(f, (f'      <edge id="{i}" source="{u}" target="{v}" weight="{w}"/>\n'
+                       for i, (u, v, w) in enumerate(iter_graph_edges(graph))))
+    f.write('    </edges>\n'
+            '  </graph>\n'
+            '</gexf>\n')
+
+
+def _write_edge_list(f: TextIO, graph: AbstractGraph, names: list[str]) -> None:
+    # Lista simples "origem<TAB>destino<TAB>peso", uma aresta por linha
+    _write_chunked(f, (f"{names[u]}\t{names[v]}\t{w}\n" for u, v, w in iter_graph_edges(graph)))
+
+
+WRITERS: dict[str, Callable[[TextIO, AbstractGraph, list[str]], None]] = {
+    "gdf": _write_gdf,
+    "graphml": _write_graphml,
+    "gexf": _write_gexf,
+    "edges": _write_edge_list,
+}
+
+
+def export_graph(graph: AbstractGraph, mapper, path: str, fmt: str | None = None, compress: bool = False) -> str:
+    """
+    Exporta o grafo para `path` no formato `fmt` (inferido pela extensão se omitido).
+    `mapper` fornece o nome de cada vértice via `get_name`. Com `compress`, ou se o caminho
+    terminar em ".gz", a saída é compactada com gzip. Retorna o caminho escrito.
+    """
+    file = Path(path)
+    if compress and file.suffix != ".gz":
+        file = file.with_name(file.name + ".gz")
+    compressed = file.suffix == ".gz"
+
+    if fmt is None:
+        fmt = (file.with_suffix("") if compressed else file).suffix.lstrip(".")
+    if fmt not in WRITERS:
+        raise ValueError(f"Formato de exportação '{fmt}' desconhecido. Use um de: {', '.join(WRITERS)}.")
+
+    names = [mapper.get_name(i) for i in range(graph.getVertexCount())]
+    file.parent.mkdir(parents=True, exist_ok=True)
+
+    if compressed:
+        f = gzip.open(file, 'wt', encoding='utf-8', compresslevel=6)
+    else:
+        f = open(file, 'w', encoding='utf-8', buffering=BUFFER_SIZE)
+    with f:
+        WRITERS[fmt](f, graph, names)
+
+    return str(file)
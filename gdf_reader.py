@@ -0,0 +1,99 @@
+import csv
+import gzip
+from typing import Iterator, Type
+
+from graph_lib import AbstractGraph
+from list_graph import AdjacencyListGraph
+from user_mapper import UserMapper
+
+"""
+Leitura de arquivos GDF (formato do Gephi) exportados pelo pipeline.
+
+O arquivo é lido linha a linha: a seção `nodedef>` registra cada vértice no UserMapper,
+na ordem em que aparece, e a seção `edgedef>` é repassada ao grafo em lotes através de
+`accumulateEdges`, sem manter o arquivo inteiro em memória.
+"""
+
+BATCH_SIZE = 1 << 16
+
+
+def _split(line: str) -> list[str]:
+    # Caminho rápido para linhas sem aspas (o caso dos arquivos gerados pelo exporters)
+    if "'" not in line and '"' not in line:
+        return line.split(',')
+    quote = "'" if line.lstrip().startswith("'") or ",'" in line else '"'
+    return next(csv.reader([line], quotechar=quote, skipinitialspace=True))
+
+
+def _columns(header: str) -> list[str]:
+    # "nodedef>name VARCHAR,label VARCHAR" -> ["name", "label"]
+    definition = header.split('>', 1)[1]
+    return [column.strip().split(' ')[0].lower() for column in _split(definition)]
+
+
+def _lines(path: str) -> Iterator[str]:
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\r\n')
+            if line:
+                yield line
+
+
+def load_gdf(path: str, graph_cls: Type[AbstractGraph] = AdjacencyListGraph,
+             mapper: UserMapper | None = None) -> tuple[AbstractGraph, UserMapper]:
+    """
+    Reconstrói um grafo a partir de um arquivo GDF (opcionalmente .gz).
+
+    Os vértices recebem índices na ordem da seção de nós (ou os índices já existentes no
+    `mapper` informado). Arestas sem coluna `weight` recebem peso 1.0; arestas com
+    `directed` falso são inseridas nos dois sentidos. Arestas repetidas têm os pesos somados.
+    """
+    mapper = mapper if mapper is not None else UserMapper()
+    lines = _lines(path)
+
+    header = next(lines, "")
+    if not header.lower().startswith("nodedef>"):
+        raise ValueError(f"{path}: arquivo GDF deve começar com 'nodedef>'")
+    node_columns = _columns(header)
+    name_col = node_columns.index("name") if "name" in node_columns else 0
+
+    edge_header = None
+    for line in lines:
+        if line.lower().startswith("edgedef>"):
+            edge_header = line
+            break
+        mapper.get_id(_split(line)[name_col].strip())
+
+    graph = graph_cls(mapper.count())
+    if edge_header is None:
+        return graph, mapper
+
+    edge_columns = _columns(edge_header)
+    source_col = edge_columns.index("node1") if "node1" in edge_columns else 0
+    target_col = edge_columns.index("node2") if "node2" in edge_columns else 1
+    weight_col = edge_columns.index("weight") if "weight" in edge_columns else None
+    directed_col = edge_columns.index("directed") if "directed" in edge_columns else None
+
+    known = mapper.user_to_id
+    batch: list[tuple[int, int, float]] = []
+    for line in lines:
+        values = _split(line)
+        try:
+            u = known[values[source_col].strip()]
+            v = known[values[target_col].strip()]
+        except KeyError as e:
+            raise ValueError(f"{path}: aresta referencia vértice não declarado {e}") from None
+
+        w = float(values[weight_col]) if weight_col is not None else 1.0
+        batch.append((u, v, w))
+        if directed_col is not None and values[directed_col].strip().lower() == "false":
+            batch.append((v, u, w))
+
+        if len(batch) >= BATCH_SIZE:
+            graph.accumulateEdges(batch)
+            batch = []
+
+    if batch:
+        graph.accumulateEdges(batch)
+    return graph, mapper
@@ -0,0 +1,90 @@
+import json
+import socket
+from typing import Iterable
+
+"""
+Cliente do servidor de consultas (`graph_server`).
+
+Mantém uma conexão aberta (socket Unix ou TCP) e envia requisições JSON por linha. Cada
+método corresponde a uma operação do servidor; `batch` envia várias requisições de uma
+vez e só então lê as respostas, evitando uma ida e volta por consulta.
+"""
+
+# Requisições enviadas antes de ler as respostas em `batch`. O servidor só lê a próxima
+# requisição depois de entregar a resposta anterior; limitar o lote garante que as
+# requisições pendentes caibam nos buffers do socket e que nenhum dos lados fique bloqueado
+MAX_IN_FLIGHT = 128
+
+
+class GraphClient:
+    def __init__(self, path: str | None = None, host: str = "127.0.0.1", port: int = 8765, timeout: float | None = 30.0):
+        if path is not None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(timeout)
+            self._socket.connect(path)
+        else:
+            self._socket = socket.create_connection((host, port), timeout)
+        self._file = self._socket.makefile('rwb')
+
+    def close(self) -> None:
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self) -> "GraphClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def batch(self, requests: Iterable[dict]) -> list[dict]:
+        """
+        Envia as requisições em sequência e retorna as respostas brutas, na mesma ordem.
+        São enviadas no máximo `MAX_IN_FLIGHT` requisições antes de ler as respostas.
+        """
+        responses: list[dict] = []
+        count = 0
+        for request in requests:
+            self._file.write(json.dumps(request).encode('utf-8') + b"\n")
+            count += 1
+            if count == MAX_IN_FLIGHT:
+                self._read(count, responses)
+                count = 0
+        self._read(count, responses)
+        return responses
+
+    def _read(self, count: int, responses: list[dict]) -> None:
+        self._file.flush()
+        for _ in range(count):
+            line = self._file.readline()
+            if not line:
+                raise ConnectionError("Conexão encerrada pelo servidor.")
+            responses.append(json.loads(line))
+
+    def query(self, op: str, **params):
+        """Executa uma operação e retorna o resultado; erros do servidor viram ValueError."""
+        response = self.batch([{"op": op, **params}])[0]
+        if not response["ok"]:
+            raise ValueError(response["error"])
+        return response["result"]
+
+    def graphs(self) -> dict[str, dict]:
+        return self.query("graphs")
+
+    def hasEdge(self, graph: str, u: int | str, v: int | str) -> bool:
+        return self.query("hasEdge", graph=graph, u=u, v=v)
+
+    def degrees(self, graph: str, v: int | str) -> dict[str, int]:
+        return self.query("degrees", graph=graph, v=v)
+
+    def neighbors(self, graph: str, v: int | str, direction: str = "out") -> list[tuple[str, float]]:
+        return [tuple(pair) for pair in self.query("neighbors", graph=graph, v=v, direction=direction)]
+
+    def weight(self, graph: str, u: int | str, v: int | str) -> float:
+        return self.query("weight", graph=graph, u=u, v=v)
+
+    def top(self, graph: str, k: int = 10, metric: str = "pagerank") -> list[tuple[str, float]]:
+        return [tuple(pair) for pair in self.query("top", graph=graph, k=k, metric=metric)]
+
+    def component(self, graph: str, v: int | str, limit: int | None = None) -> dict:
+        params = {} if limit is None else {"limit": limit}
+        return self.query("component", graph=graph, v=v, **params)
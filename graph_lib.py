@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
 
 
 # A node represents a user, and should hold important user details
@@ -84,5 +85,51 @@ class AbstractGraph(ABC):
     def isCompleteGraph(self) -> bool:
         pass
 
+    def accumulateEdges(self, edges: Iterable[tuple[int, int, float]]) -> None:
+        """
+        Soma o peso w de cada tripla (u, v, w) à aresta u -> v, criando a aresta com
+        peso 0 quando ela ainda não existe. Implementação genérica, feita sobre os
+        métodos da interface; as classes concretas sobrescrevem com versões otimizadas.
+        """
+        for u, v, w in self._validate_edges(edges):
+            if not self.hasEdge(u, v):
+                self.addEdge(u, v)
+                self.setEdgeWeight(u, v, 0.0)
+            self.setEdgeWeight(u, v, self.getEdgeWeight(u, v) + w)
+
+    def iterSuccessors(self, u: int) -> Iterator[tuple[int, float]]:
+        """
+        Percorre os sucessores de u como pares (v, peso da aresta u -> v). Implementação
+        genérica em O(V), testando cada vértice; as classes concretas sobrescrevem com
+        versões em O(grau).
+        """
+        for v in range(self.getVertexCount()):
+            if self.hasEdge(u, v):
+                yield v, self.getEdgeWeight(u, v)
+
+    def iterPredecessors(self, v: int) -> Iterator[tuple[int, float]]:
+        """Percorre os predecessores de v como pares (u, peso da aresta u -> v)."""
+        for u in range(self.getVertexCount()):
+            if self.hasEdge(u, v):
+                yield u, self.getEdgeWeight(u, v)
+
+    def iterEdges(self) -> Iterator[tuple[int, int, float]]:
+        """Percorre todas as arestas (u, v, peso), agrupadas por vértice de origem."""
+        for u in range(self.getVertexCount()):
+            for v, w in self.iterSuccessors(u):
+                yield u, v, w
+
+    def _validate_edges(self, edges: Iterable[tuple[int, int, float]]) -> list[tuple[int, int, float]]:
+        # Valida todo o lote de uma vez, antes de qualquer alteração no grafo
+        edges = edges if isinstance(edges, list) else list(edges)
+        n = self.getVertexCount()
+        for u, v, _ in edges:
+            if u < 0 or u >= n or v < 0 or v >= n:
+                bad = u if u < 0 or u >= n else v
+                raise ValueError(f"Vértice {bad} inválido. Deve estar entre 0 e {n - 1}.")
+            if u == v:
+                raise ValueError("Laços (self-loops) não são permitidos.")
+        return edges
+
     def exportToGEPHI(self, path: str) -> None:
         pass
@@ -0,0 +1,221 @@
+import argparse
+import asyncio
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from components import weak_components
+from link_analysis import pagerank, top_k, weighted_degree
+from mapped_graph import MappedGraph
+
+"""
+Servidor local de consultas sobre grafos já construídos.
+
+Os grafos (arquivos `.graph` gravados com `--formats graph`, ver `mapped_graph`) são
+abertos uma única vez via mmap, e o servidor responde consultas por um socket Unix ou TCP
+em localhost com asyncio, atendendo vários clientes ao mesmo tempo. O protocolo é JSON por
+linha: cada requisição é um objeto `{"op": ..., "graph": ..., ...}` terminado em "\\n" e
+cada resposta, na mesma ordem, é `{"ok": true, "result": ...}` ou `{"ok": false, "error": ...}`.
+Vértices podem ser informados pelo login ou pelo índice; as respostas usam o login.
+
+Operações: graphs, hasEdge (u, v), degrees (v), neighbors (v, direction "out"/"in"),
+weight (u, v), top (k, metric "pagerank"/"in"/"out"/"all") e component (v, limit).
+PageRank, graus ponderados e componentes são calculados na primeira consulta de cada
+grafo (fora do laço de eventos) e reaproveitados nas seguintes.
+
+Ver `graph_client.GraphClient` para o cliente.
+"""
+
+# Consultas que podem disparar um cálculo sobre o grafo inteiro; rodam em uma thread
+SLOW_OPS = {"top", "component"}
+DEFAULT_COMPONENT_LIMIT = 1000
+
+
+class ServedGraph:
+    """Grafo aberto pelo servidor, com os resultados globais calculados sob demanda."""
+
+    def __init__(self, name: str, graph: MappedGraph):
+        self.name = name
+        self.graph = graph
+        self._scores: dict[str, np.ndarray] = {}
+        self._components: tuple[list[int], list[int]] | None = None
+        # Consultas simultâneas ao mesmo grafo esperam o primeiro cálculo em vez de repeti-lo
+        self._lock = threading.Lock()
+
+    def vertex(self, value) -> int:
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            raise ValueError(f"Vértice inválido: {value!r}. Use o login ou o índice.")
+        if isinstance(value, int):
+            n = self.graph.getVertexCount()
+            if value < 0 or value >= n:
+                raise ValueError(f"Vértice {value} inválido. Deve estar entre 0 e {n - 1}.")
+            return value
+        v = self.graph.find_vertex(value)
+        if v == -1:
+            raise ValueError(f"Usuário '{value}' não encontrado no grafo '{self.name}'.")
+        return v
+
+    def scores(self, metric: str) -> np.ndarray:
+        with self._lock:
+            if metric not in self._scores:
+                if metric == "pagerank":
+                    self._scores[metric] = pagerank(self.graph)
+                else:
+                    self._scores[metric] = weighted_degree(self.graph, metric)
+            return self._scores[metric]
+
+    def components(self) -> tuple[list[int], list[int]]:
+        with self._lock:
+            if self._components is None:
+                self._components = weak_components(self.graph)
+            return self._components
+
+
+class GraphServer:
+    def __init__(self, graphs: dict[str, MappedGraph]):
+        self.graphs = {name: ServedGraph(name, graph) for name, graph in graphs.items()}
+        self.operations: dict[str, Callable[[ServedGraph, dict], object]] = {
+            "hasEdge": self._has_edge,
+            "degrees": self._degrees,
+            "neighbors": self._neighbors,
+            "weight": self._weight,
+            "top": self._top,
+            "component": self._component,
+        }
+
+    @classmethod
+    def open(cls, paths: list[str]) -> "GraphServer":
+        """Abre os arquivos `.graph`; cada grafo é identificado pelo nome do arquivo sem extensão."""
+        return cls({Path(path).stem: MappedGraph(path) for path in paths})
+
+    def close(self) -> None:
+        for served in self.graphs.values():
+            served.graph.close()
+
+    def handle(self, request: dict) -> dict:
+        """Responde a uma requisição já decodificada."""
+        try:
+            op = request.get("op")
+            if op == "graphs":
+                result = {name: {"vertices": s.graph.getVertexCount(), "edges": s.graph.getEdgeCount()}
+                          for name, s in self.graphs.items()}
+                return {"ok": True, "result": result}
+            if op not in self.operations:
+                raise ValueError(f"Operação '{op}' desconhecida. Use uma de: graphs, {', '.join(self.operations)}.")
+            served = self.graphs.get(request.get("graph"))
+            if served is None:
+                raise ValueError(f"Grafo '{request.get('graph')}' não carregado. Disponíveis: {', '.join(self.graphs)}.")
+            return {"ok": True, "result": self.operations[op](served, request)}
+        except (ValueError, KeyError, TypeError) as e:
+            message = f"Parâmetro ausente: {e}" if isinstance(e, KeyError) else str(e)
+            return {"ok": False, "error": message}
+        except Exception as e:
+            # Falhas inesperadas (ex.: PageRank sem convergência) também viram uma resposta
+            return {"ok": False, "error": f"Erro interno: {type(e).__name__}: {e}"}
+
+    def _has_edge(self, served: ServedGraph, request: dict) -> bool:
+        return served.graph.hasEdge(served.vertex(request["u"]), served.vertex(request["v"]))
+
+    def _degrees(self, served: ServedGraph, request: dict) -> dict:
+        v = served.vertex(request["v"])
+        return {"in": served.graph.getVertexInDegree(v), "out": served.graph.getVertexOutDegree(v)}
+
+    def _neighbors(self, served: ServedGraph, request: dict) -> list[list]:
+        graph, v = served.graph, served.vertex(request["v"])
+        direction = request.get("direction", "out")
+        if direction == "out":
+            return [[graph.get_name(x), w] for x, w in graph.iterSuccessors(v)]
+        if direction == "in":
+            return [[graph.get_name(x), w] for x, w in graph.iterPredecessors(v)]
+        raise ValueError(f"Direção '{direction}' inválida. Use 'out' ou 'in'.")
+
+    def _weight(self, served: ServedGraph, request: dict) -> float:
+        return served.graph.getEdgeWeight(served.vertex(request["u"]), served.vertex(request["v"]))
+
+    def _top(self, served: ServedGraph, request: dict) -> list[list]:
+        metric = request.get("metric", "pagerank")
+        if metric not in ("pagerank", "in", "out", "all"):
+            raise ValueError(f"Métrica '{metric}' inválida. Use 'pagerank', 'in', 'out' ou 'all'.")
+        ranking = top_k(served.scores(metric), int(request.get("k", 10)))
+        return [[served.graph.get_name(v), score] for v, score in ranking]
+
+    def _component(self, served: ServedGraph, request: dict) -> dict:
+        v = served.vertex(request["v"])
+        limit = int(request.get("limit", DEFAULT_COMPONENT_LIMIT))
+        labels, sizes = served.components()
+        label = labels[v]
+        members = []
+        for x, other in enumerate(labels):
+            if other == label:
+                if len(members) == limit:
+                    break
+                members.append(served.graph.get_name(x))
+        return {"size": sizes[label], "members": members}
+
+    async def _respond(self, line: bytes) -> bytes:
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a requisição deve ser um objeto JSON")
+        except ValueError as e:
+            response = {"ok": False, "error": f"Requisição inválida: {e}"}
+        else:
+            if request.get("op") in SLOW_OPS:
+                response = await asyncio.get_running_loop().run_in_executor(None, self.handle, request)
+            else:
+                response = self.handle(request)
+            if "id" in request:
+                response["id"] = request["id"]
+        return json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n"
+
+    async def _client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    writer.write(await self._respond(line))
+                    await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, path: str | None = None, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """Inicia o servidor no socket Unix `path` ou, sem ele, em TCP `host:port`."""
+        if path is not None:
+            if os.path.exists(path):
+                os.unlink(path)
+            return await asyncio.start_unix_server(self._client, path)
+        return await asyncio.start_server(self._client, host, port)
+
+
+async def serve(server: GraphServer, path: str | None, host: str, port: int) -> None:
+    listener = await server.start(path, host, port)
+    address = path or "{}:{}".format(*listener.sockets[0].getsockname()[:2])
+    print(f"Servindo {len(server.graphs)} grafo(s) em {address}", flush=True)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor de consultas sobre grafos gravados com --formats graph.")
+    parser.add_argument("graphs", nargs="+", help="Arquivos .graph (ex.: out/weighted_dono_projeto.graph)")
+    parser.add_argument("--socket", help="Caminho do socket Unix (padrão: TCP em --host/--port)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = GraphServer.open(args.graphs)
+    try:
+        asyncio.run(serve(server, args.socket, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+import json
+import os
+import struct
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from interaction_table import MISSING, InteractionTable, author_index, join_authors
+from multilayer_graph import LAYER_NAMES, MultiLayerGraph
+from parse_cache import is_fresh
+from user_mapper import UserMapper
+
+"""
+Estado persistido do grafo de um repositório, para atualizações incrementais.
+
+Guarda a tabela de usuários, as contagens de interação por camada de cada aresta, o autor
+de cada issue, as issues cujo fechamento já foi contabilizado, os maiores IDs de
+comentário/review já processados e as interações pendentes (comentários e reviews em
+issues ainda desconhecidas, resolvidos quando a issue aparecer). Uma nova execução aplica apenas os registros novos sobre
+esse estado, em vez de reconstruir os grafos a partir de todo o histórico.
+"""
+
+MAGIC = b"TPGS"
+VERSION = 3
+_HEADER = struct.Struct("<4sIQ")
+
+
+@dataclass
+class GraphState:
+    mapper: UserMapper = field(default_factory=UserMapper)
+    layers: MultiLayerGraph = field(default_factory=lambda: MultiLayerGraph(0))
+    issue_authors: dict[int, int] = field(default_factory=dict)
+    closed_issues: set[int] = field(default_factory=set)
+    # Marcas d'água: maior ID já processado de cada tipo de registro
+    last_issue_comment: int = 0
+    last_pull_comment: int = 0
+    last_review: int = 0
+    # Interações cuja issue ainda não tem autor conhecido: número da issue, origem, camada e data
+    pending_numbers: array = field(default_factory=lambda: array('q'))
+    pending_sources: array = field(default_factory=lambda: array('i'))
+    pending_layers: array = field(default_factory=lambda: array('b'))
+    pending_times: array = field(default_factory=lambda: array('q'))
+    # Impressões digitais dos arquivos de origem na última atualização
+    fingerprints: dict[str, dict] = field(default_factory=dict)
+
+    def is_current(self, source_files: list[str]) -> bool:
+        """Verdadeiro se nenhum arquivo de origem mudou desde a última atualização."""
+        if sorted(self.fingerprints) != sorted(source_files):
+            return False
+        return all(is_fresh(name, self.fingerprints[name]) for name in source_files)
+
+    def grow(self) -> None:
+        """Ajusta o grafo de camadas ao número de usuários conhecidos pelo mapper."""
+        while self.layers.getVertexCount() < self.mapper.count():
+            self.layers.addVertex()
+
+    def defer(self, numbers: np.ndarray, sources: np.ndarray, layer: int, times: np.ndarray) -> None:
+        """Guarda interações de uma camada cuja issue ainda não tem autor conhecido."""
+        self.pending_numbers.frombytes(np.asarray(numbers, dtype=np.int64).tobytes())
+        self.pending_sources.frombytes(np.asarray(sources, dtype=np.int32).tobytes())
+        self.pending_layers.extend([layer] * len(numbers))
+        self.pending_times.frombytes(np.asarray(times, dtype=np.int64).tobytes())
+
+    def resolve_pending(self) -> InteractionTable:
+        """Retorna as interações pendentes cujo autor da issue já é conhecido; as demais continuam pendentes."""
+        numbers = np.frombuffer(self.pending_numbers, dtype=np.int64)
+        sources = np.frombuffer(self.pending_sources, dtype=np.int32)
+        layers = np.frombuffer(self.pending_layers, dtype=np.int8)
+        times = np.frombuffer(self.pending_times, dtype=np.int64)
+
+        targets = join_authors(numbers, author_index(self.issue_authors))
+        found = targets != MISSING
+        keep = found & (sources != targets)
+        resolved = InteractionTable(sources[keep], targets[keep], layers[keep], times[keep])
+
+        self.pending_numbers = array('q', numbers[~found].tobytes())
+        self.pending_sources = array('i', sources[~found].tobytes())
+        self.pending_layers = array('b', layers[~found].tobytes())
+        self.pending_times = array('q', times[~found].tobytes())
+        return resolved
+
+    def save(self, path: str, source_fingerprints: dict[str, dict]) -> None:
+        """
+        Grava o estado de forma atômica, registrando as impressões digitais das origens
+        tiradas antes da leitura dos dados aplicados (ver `parse_cache.fingerprints`).
+        """
+        self.fingerprints = source_fingerprints
+
+        sources, targets, counts = array('i'), array('i'), array('i')
+        for u in range(self.layers.getVertexCount()):
+            for v, layer_counts in self.layers.adj[u].items():
+                sources.append(u)
+                targets.append(v)
+                counts.extend(layer_counts)
+
+        columns = (
+            array('q', self.issue_authors.keys()), array('i', self.issue_authors.values()),
+            array('q', sorted(self.closed_issues)), sources, targets, counts,
+            self.pending_numbers, self.pending_sources, self.pending_layers, self.pending_times,
+        )
+        meta = {
+            "last_issue_comment": self.last_issue_comment,
+            "last_pull_comment": self.last_pull_comment,
+            "last_review": self.last_review,
+            "fingerprints": self.fingerprints,
+            "lengths": [len(column) for column in columns],
+        }
+        meta_bytes = json.dumps(meta).encode('utf-8')
+
+        file = Path(path)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = file.with_name(file.name + ".tmp")
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(meta_bytes)))
+            f.write(meta_bytes)
+            for column in columns:
+                column.tofile(f)
+            self.mapper.write(f)
+        os.replace(tmp, file)
+
+    @classmethod
+    def load(cls, path: str) -> "GraphState | None":
+        """Carrega o estado gravado em `path`, ou None se não existir ou for de outra versão."""
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+
+        with f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                return None
+            magic, version, meta_len = _HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                return None
+
+            meta = json.loads(f.read(meta_len).decode('utf-8'))
+            columns = (array('q'), array('i'), array('q'), array('i'), array('i'), array('i'),
+                       array('q'), array('i'), array('b'), array('q'))
+            try:
+                for column, length in zip(columns, meta["lengths"]):
+                    column.fromfile(f, length)
+            except EOFError:
+                return None
+            mapper = UserMapper.read(f)
+            if mapper is None:
+                return None
+
+        numbers, author_ids, closed, sources, targets, counts, *pending = columns
+        state = cls(
+            mapper=mapper,
+            issue_authors=dict(zip(numbers, author_ids)),
+            closed_issues=set(closed),
+            last_issue_comment=meta["last_issue_comment"],
+            last_pull_comment=meta["last_pull_comment"],
+            last_review=meta["last_review"],
+            fingerprints=meta["fingerprints"],
+            pending_numbers=pending[0],
+            pending_sources=pending[1],
+            pending_layers=pending[2],
+            pending_times=pending[3],
+        )
+        layers = state.layers = MultiLayerGraph(state.mapper.count())
+        num_layers = len(LAYER_NAMES)
+        for i, (u, v) in enumerate(zip(sources, targets)):
+            layer_counts = counts[i * num_layers:(i + 1) * num_layers].tolist()
+            layers.adj[u][v] = layer_counts
+            for layer, count in enumerate(layer_counts):
+                layers.layer_totals[layer] += count
+        layers.num_edges = len(sources)
+
+        return state
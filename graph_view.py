@@ -0,0 +1,186 @@
+from collections import deque
+from typing import Callable, Iterable, Iterator
+
+from components import largest_component, weak_components
+from graph_lib import AbstractGraph
+from list_graph import AdjacencyListGraph
+
+"""
+Visões preguiçosas (somente leitura) sobre um grafo existente.
+
+Uma `SubgraphView` combina uma máscara de vértices com um predicado sobre o peso das
+arestas e responde às consultas de `AbstractGraph` filtrando o grafo base na hora, sem
+copiar arestas. Assim é possível explorar vários limiares sobre o mesmo grafo grande;
+uma cópia só é feita quando pedida explicitamente com `materialize()`.
+
+Os vértices mantêm os índices do grafo base (o mesmo UserMapper continua valendo); os
+vértices fora da máscara ficam isolados e são ignorados por `isConnected` e
+`isCompleteGraph`. As visões podem ser empilhadas, e refletem alterações posteriores
+no grafo base.
+"""
+
+
+class SubgraphView(AbstractGraph):
+    """
+    Subgrafo preguiçoso: mantém apenas os vértices em `vertices` (todos, se None) e as
+    arestas cujo peso satisfaz `edge_filter` (todas, se None).
+
+    Contagens (`getEdgeCount`, graus) são recalculadas a cada consulta, percorrendo as
+    arestas do grafo base; para uso intensivo, materialize a visão.
+    """
+
+    def __init__(self, graph: AbstractGraph, vertices: Iterable[int] | None = None,
+                 edge_filter: Callable[[float], bool] | None = None):
+        self.graph = graph
+        self.num_vertices = graph.getVertexCount()
+        self.edge_filter = edge_filter
+        self.mask: bytearray | None = None
+        if vertices is not None:
+            self.mask = bytearray(self.num_vertices)
+            for v in vertices:
+                self._validate_index(v)
+                self.mask[v] = 1
+
+    def _validate_index(self, v: int):
+        if v < 0 or v >= self.num_vertices:
+            raise ValueError(f"Vértice {v} inválido. Deve estar entre 0 e {self.num_vertices - 1}.")
+
+    def _read_only(self):
+        raise TypeError("Visões são somente leitura; use materialize() para obter um grafo editável.")
+
+    def contains(self, v: int) -> bool:
+        """Verdadeiro se o vértice v pertence à visão."""
+        self._validate_index(v)
+        return self.mask is None or self.mask[v] == 1
+
+    def vertices(self) -> Iterator[int]:
+        """Índices dos vértices que pertencem à visão."""
+        if self.mask is None:
+            return iter(range(self.num_vertices))
+        return (v for v, keep in enumerate(self.mask) if keep)
+
+    def _filter(self, neighbors: Iterator[tuple[int, float]]) -> Iterator[tuple[int, float]]:
+        mask, keep = self.mask, self.edge_filter
+        for x, w in neighbors:
+            if (mask is None or mask[x]) and (keep is None or keep(w)):
+                yield x, w
+
+    def iterSuccessors(self, u: int) -> Iterator[tuple[int, float]]:
+        return self._filter(self.graph.iterSuccessors(u)) if self.contains(u) else iter(())
+
+    def iterPredecessors(self, v: int) -> Iterator[tuple[int, float]]:
+        return self._filter(self.graph.iterPredecessors(v)) if self.contains(v) else iter(())
+
+    def iterEdges(self) -> Iterator[tuple[int, int, float]]:
+        # Na ordem do grafo base
+        for u in self.vertices():
+            for v, w in self.iterSuccessors(u):
+                yield u, v, w
+
+    def getVertexCount(self) -> int:
+        return self.num_vertices
+
+    def getEdgeCount(self) -> int:
+        return sum(1 for _ in self.iterEdges())
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        if not (self.contains(u) and self.contains(v)) or not self.graph.hasEdge(u, v):
+            return False
+        return self.edge_filter is None or self.edge_filter(self.graph.getEdgeWeight(u, v))
+
+    def addEdge(self, u: int, v: int) -> None:
+        self._read_only()
+
+    def removeEdge(self, u: int, v: int) -> None:
+        self._read_only()
+
+    def accumulateEdges(self, edges: Iterable[tuple[int, int, float]]) -> None:
+        self._read_only()
+
+    def isSucessor(self, u: int, v: int) -> bool:
+        return self.hasEdge(u, v)
+
+    def isPredessor(self, u: int, v: int) -> bool:
+        return self.hasEdge(v, u)
+
+    def isDivergent(self, u1: int, v1: int, u2: int, v2: int) -> bool:
+        if not (self.hasEdge(u1, v1) and self.hasEdge(u2, v2)):
+            return False
+        return u1 == u2 and v1 != v2
+
+    def isConvergent(self, u1: int, v1: int, u2: int, v2: int) -> bool:
+        if not (self.hasEdge(u1, v1) and self.hasEdge(u2, v2)):
+            return False
+        return v1 == v2 and u1 != u2
+
+    def isIncident(self, u: int, v: int, x: int) -> bool:
+        if not self.hasEdge(u, v):
+            return False
+        return x == u or x == v
+
+    def getVertexInDegree(self, u: int) -> int:
+        return sum(1 for _ in self.iterPredecessors(u))
+
+    def getVertexOutDegree(self, u: int) -> int:
+        return sum(1 for _ in self.iterSuccessors(u))
+
+    def setVertexWeight(self, v: int, w: float) -> None:
+        self._read_only()
+
+    def getVertexWeight(self, v: int) -> float:
+        return self.graph.getVertexWeight(v)
+
+    def setEdgeWeight(self, u: int, v: int, w: float) -> None:
+        self._read_only()
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        return self.graph.getEdgeWeight(u, v) if self.hasEdge(u, v) else 0.0
+
+    def isConnected(self) -> bool:
+        start = next(self.vertices(), None)
+        if start is None: return False
+
+        visited = {start}
+        queue = deque([start])
+        while queue:
+            u = queue.popleft()
+            for v, _ in self.iterSuccessors(u):
+                if v not in visited:
+                    visited.add(v)
+                    queue.append(v)
+            for v, _ in self.iterPredecessors(u):
+                if v not in visited:
+                    visited.add(v)
+                    queue.append(v)
+
+        return len(visited) == sum(1 for _ in self.vertices())
+
+    def isEmptyGraph(self) -> bool:
+        return next(self.iterEdges(), None) is None
+
+    def isCompleteGraph(self) -> bool:
+        k = sum(1 for _ in self.vertices())
+        return self.getEdgeCount() == k * (k - 1)
+
+    def materialize(self, graph_cls: type = AdjacencyListGraph) -> AbstractGraph:
+        """Copia a visão para um grafo independente (e editável) de `graph_cls`, com os mesmos índices."""
+        graph = graph_cls(self.num_vertices)
+        graph.accumulateEdges(list(self.iterEdges()))
+        for v in range(self.num_vertices):
+            graph.setVertexWeight(v, self.graph.getVertexWeight(v))
+        return graph
+
+
+def weight_at_least(graph: AbstractGraph, min_weight: float) -> SubgraphView:
+    """Visão apenas com as arestas de peso >= `min_weight`."""
+    return SubgraphView(graph, edge_filter=lambda w: w >= min_weight)
+
+
+def induced_subgraph(graph: AbstractGraph, vertices: Iterable[int]) -> SubgraphView:
+    """Visão induzida pelos vértices dados (ex.: apenas os mantenedores principais)."""
+    return SubgraphView(graph, vertices)
+
+
+def largest_component_view(graph: AbstractGraph) -> SubgraphView:
+    """Visão restrita à maior componente fracamente conexa."""
+    return SubgraphView(graph, largest_component(*weak_components(graph)))
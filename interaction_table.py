@@ -0,0 +1,105 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+"""
+Tabela colunar de interações entre usuários.
+
+Em vez de listas de tuplas, as interações ficam em vetores NumPy paralelos (origem,
+destino, camada). O destino de comentários e reviews é resolvido por uma junção
+vetorizada do número da issue com a tabela de autores (`join_authors`), e pares (u, v)
+repetidos são agregados com ordenação/`np.unique` e uma redução por soma (`aggregate`),
+de forma que os grafos recebem apenas uma entrada por aresta.
+
+Cada interação guarda também o instante em que ocorreu (segundos desde a época, UTC),
+usado pelas janelas de tempo de `temporal_graph`; `NO_TIME` indica data desconhecida.
+"""
+
+MISSING = -1
+NO_TIME = np.iinfo(np.int64).min
+
+
+@dataclass
+class InteractionTable:
+    sources: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    targets: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    layers: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int8))
+    times: np.ndarray | None = None
+
+    def __post_init__(self):
+        if self.times is None:
+            self.times = np.full(len(self.sources), NO_TIME, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    @classmethod
+    def concat(cls, tables: list["InteractionTable"]) -> "InteractionTable":
+        """Concatena as tabelas, preservando a ordem das interações."""
+        if not tables:
+            return cls()
+        return cls(
+            np.concatenate([t.sources for t in tables]).astype(np.int32, copy=False),
+            np.concatenate([t.targets for t in tables]).astype(np.int32, copy=False),
+            np.concatenate([t.layers for t in tables]).astype(np.int8, copy=False),
+            np.concatenate([t.times for t in tables]).astype(np.int64, copy=False),
+        )
+
+    @classmethod
+    def build(cls, sources, targets, layer: int, times=None) -> "InteractionTable":
+        """Interações de uma única camada, descartando destinos ausentes e laços (u == v)."""
+        sources = np.asarray(sources, dtype=np.int32)
+        targets = np.asarray(targets, dtype=np.int32)
+        keep = (targets != MISSING) & (sources != targets)
+        times = None if times is None else np.asarray(times, dtype=np.int64)[keep]
+        return cls(sources[keep], targets[keep], np.full(int(keep.sum()), layer, dtype=np.int8), times)
+
+    def select(self, index) -> "InteractionTable":
+        """Subconjunto das interações (fatia, máscara ou vetor de posições)."""
+        return InteractionTable(self.sources[index], self.targets[index], self.layers[index], self.times[index])
+
+    def aggregate(self, num_vertices: int, num_layers: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Agrega as interações por aresta. Retorna `(u, v, counts)`, com uma linha por par
+        (u, v) distinto na ordem da primeira ocorrência e `counts[i, camada]` com o número
+        de interações daquela camada.
+        """
+        if len(self) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros((0, num_layers), dtype=np.int64)
+
+        keys = self.sources.astype(np.int64) * num_vertices + self.targets
+        unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        counts = np.bincount(inverse * num_layers + self.layers, minlength=len(unique_keys) * num_layers)
+        counts = counts.reshape(len(unique_keys), num_layers)
+
+        order = np.argsort(first, kind='stable')
+        unique_keys = unique_keys[order]
+        return unique_keys // num_vertices, unique_keys % num_vertices, counts[order]
+
+
+def parse_times(values: list[str | None]) -> np.ndarray:
+    """Converte datas ISO 8601 do GitHub ("2024-01-02T03:04:05Z") em segundos; None vira `NO_TIME`."""
+    stamps = np.array(["NaT" if value is None else value.rstrip("Z") for value in values], dtype="datetime64[s]")
+    return stamps.astype(np.int64)
+
+
+def author_index(issue_authors: dict[int, int]) -> tuple[np.ndarray, np.ndarray]:
+    """Tabela de autores ordenada pelo número da issue, pronta para `join_authors`."""
+    numbers = np.fromiter(issue_authors.keys(), dtype=np.int64, count=len(issue_authors))
+    author_ids = np.fromiter(issue_authors.values(), dtype=np.int32, count=len(issue_authors))
+    order = np.argsort(numbers, kind='stable')
+    return numbers[order], author_ids[order]
+
+
+def join_authors(numbers, index: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """Autor de cada número de issue em `numbers` (`MISSING` se a issue não for conhecida)."""
+    sorted_numbers, author_ids = index
+    numbers = np.asarray(numbers, dtype=np.int64)
+    if len(sorted_numbers) == 0:
+        return np.full(len(numbers), MISSING, dtype=np.int32)
+
+    position = np.searchsorted(sorted_numbers, numbers)
+    position[position == len(sorted_numbers)] = 0
+    found = sorted_numbers[position] == numbers
+    return np.where(found, author_ids[position], MISSING).astype(np.int32)
@@ -0,0 +1,102 @@
+import json
+from typing import Any, Iterator, TextIO
+
+"""
+Leitura incremental (streaming) de arquivos JSON grandes.
+
+Os dumps do downloader são um único array (ou objeto) no nível raiz, que pode ter vários
+GB. Em vez de `json.load`, que materializa o documento inteiro, os elementos do nível
+raiz são decodificados um a um a partir de um buffer de tamanho limitado.
+"""
+
+CHUNK_SIZE = 1 << 20
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class _Scanner:
+    """Buffer deslizante sobre o arquivo, com decodificação de um valor JSON por vez."""
+
+    def __init__(self, file: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        # Lê pelo menos o tamanho do que está pendente, para que valores maiores que um
+        # chunk sejam re-decodificados apenas O(log n) vezes
+        pending = len(self.buf) - self.pos
+        chunk = self.file.read(max(self.chunk_size, pending))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Pula espaços e retorna o próximo caractere, ou '' no fim do arquivo."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Esperado '{char}'", self.buf, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+                # Um valor que termina exatamente no fim do buffer pode estar truncado (ex.: números)
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+
+def iter_array(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Produz, um a um, os elementos de um arquivo cujo valor raiz é um array JSON."""
+    with open(path, 'r', encoding='utf-8') as file:
+        scanner = _Scanner(file, chunk_size)
+        scanner.expect('[')
+        if scanner.peek() == ']':
+            return
+
+        while True:
+            yield scanner.value()
+            char = scanner.peek()
+            if char == ']':
+                return
+            scanner.expect(',')
+
+
+def iter_object(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """Produz, um a um, os pares (chave, valor) de um arquivo cujo valor raiz é um objeto JSON."""
+    with open(path, 'r', encoding='utf-8') as file:
+        scanner = _Scanner(file, chunk_size)
+        scanner.expect('{')
+        if scanner.peek() == '}':
+            return
+
+        while True:
+            key = scanner.value()
+            scanner.expect(':')
+            yield key, scanner.value()
+            char = scanner.peek()
+            if char == '}':
+                return
+            scanner.expect(',')
@@ -0,0 +1,127 @@
+import logging
+
+import numpy as np
+
+from csr_graph import CSRGraph
+from graph_lib import AbstractGraph
+
+"""
+Análise de links (ranking de influência) sobre qualquer AbstractGraph.
+
+As arestas são extraídas uma única vez para vetores NumPy (origem, destino, peso) e os
+algoritmos de iteração de potência (PageRank ponderado e HITS) fazem cada produto
+matriz-vetor esparso com `np.bincount`, sem laços em Python por aresta.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def edge_arrays(graph: AbstractGraph) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Retorna as arestas do grafo como vetores (origem, destino, peso)."""
+    # Importado aqui porque mapped_graph depende deste módulo
+    from mapped_graph import MappedGraph
+
+    if isinstance(graph, (CSRGraph, MappedGraph)):
+        # CSR: os buffers já estão no formato certo, basta expandir os offsets
+        offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+        src = np.repeat(np.arange(graph.getVertexCount(), dtype=np.int64), np.diff(offsets))
+        dst = np.frombuffer(graph.targets, dtype=np.int32).astype(np.int64)
+        weights = np.frombuffer(graph.weights, dtype=np.float64).copy()
+        return src, dst, weights
+
+    edges = np.fromiter(graph.iterEdges(), dtype=[('u', np.int64), ('v', np.int64), ('w', np.float64)],
+                        count=graph.getEdgeCount())
+    return edges['u'].copy(), edges['v'].copy(), edges['w'].copy()
+
+
+def weighted_degree(graph: AbstractGraph, direction: str = "out") -> np.ndarray:
+    """Soma dos pesos das arestas de saída ("out"), entrada ("in") ou ambas ("all") de cada vértice."""
+    n = graph.getVertexCount()
+    src, dst, weights = edge_arrays(graph)
+
+    if direction == "out":
+        return np.bincount(src, weights=weights, minlength=n)
+    if direction == "in":
+        return np.bincount(dst, weights=weights, minlength=n)
+    if direction == "all":
+        return np.bincount(src, weights=weights, minlength=n) + np.bincount(dst, weights=weights, minlength=n)
+    raise ValueError(f"Direção '{direction}' inválida. Use 'out', 'in' ou 'all'.")
+
+
+def pagerank(graph: AbstractGraph, damping: float = 0.85, tol: float = 1e-6, max_iter: int = 100,
+             weighted: bool = True) -> np.ndarray:
+    """
+    PageRank ponderado: cada vértice distribui seu score entre os sucessores na proporção
+    do peso das arestas. Vértices sem saída (ou só com peso 0) redistribuem uniformemente.
+    Converge quando a variação L1 entre iterações fica abaixo de `tol * n`; se isso não
+    acontecer em `max_iter` iterações, registra um aviso e retorna a última iteração.
+    """
+    n = graph.getVertexCount()
+    if n == 0:
+        return np.zeros(0)
+
+    src, dst, weights = edge_arrays(graph)
+    if not weighted:
+        weights = np.ones_like(weights)
+
+    out_strength = np.bincount(src, weights=weights, minlength=n)
+    dangling = out_strength == 0
+    # Fração do score de src que segue por cada aresta
+    transfer = np.divide(weights, out_strength[src], out=np.zeros_like(weights), where=out_strength[src] != 0)
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = rank
+        spread = np.bincount(dst, weights=rank[src] * transfer, minlength=n)
+        rank = damping * (spread + previous[dangling].sum() / n) + (1.0 - damping) / n
+        if np.abs(rank - previous).sum() < tol * n:
+            return rank
+
+    logger.warning("PageRank não convergiu em %d iterações; usando a última iteração.", max_iter)
+    return rank
+
+
+def hits(graph: AbstractGraph, tol: float = 1e-6, max_iter: int = 100,
+         weighted: bool = True) -> tuple[np.ndarray, np.ndarray]:
+    """
+    HITS (hubs e authorities) ponderado. Hubs apontam para boas authorities e authorities
+    recebem arestas de bons hubs. Os dois vetores retornados somam 1. Sem convergência em
+    `max_iter` iterações, registra um aviso e retorna a última iteração.
+    """
+    n = graph.getVertexCount()
+    if n == 0:
+        return np.zeros(0), np.zeros(0)
+
+    src, dst, weights = edge_arrays(graph)
+    if not weighted:
+        weights = np.ones_like(weights)
+
+    hubs = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = hubs
+        authorities = np.bincount(dst, weights=hubs[src] * weights, minlength=n)
+        hubs = np.bincount(src, weights=authorities[dst] * weights, minlength=n)
+
+        total = hubs.sum()
+        if total == 0:
+            # Grafo sem arestas com peso: não há estrutura de links
+            return np.full(n, 1.0 / n), np.full(n, 1.0 / n)
+        hubs = hubs / total
+
+        if np.abs(hubs - previous).sum() < tol * n:
+            break
+    else:
+        logger.warning("HITS não convergiu em %d iterações; usando a última iteração.", max_iter)
+
+    authorities = np.bincount(dst, weights=hubs[src] * weights, minlength=n)
+    return hubs, authorities / authorities.sum()
+
+
+def top_k(scores: np.ndarray, k: int) -> list[tuple[int, float]]:
+    """Os k vértices de maior score, em ordem decrescente, como pares (vértice, score)."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return []
+    best = np.argpartition(-scores, k - 1)[:k]
+    best = best[np.argsort(-scores[best], kind='stable')]
+    return [(int(v), float(scores[v])) for v in best]
@@ -1,9 +1,16 @@
+from collections import deque
+from typing import Iterable, Iterator
+
 from graph_lib import AbstractGraph
 
 class AdjacencyListGraph(AbstractGraph):
     def __init__(self, numVertices: int):
         self.num_vertices = numVertices
         self.adj = [{} for _ in range(numVertices)]
+        # Índice reverso: pred[v] guarda os vértices u com aresta u -> v
+        self.pred = [set() for _ in range(numVertices)]
+        self.in_degrees = [0] * numVertices
+        self.out_degrees = [0] * numVertices
         self.vertex_weights = [1.0] * numVertices
         self.num_edges = 0
 
@@ -31,6 +38,9 @@ class AdjacencyListGraph(AbstractGraph):
 
         if not self.hasEdge(u, v):
             self.adj[u][v] = 1.0 
+            self.pred[v].add(u)
+            self.out_degrees[u] += 1
+            self.in_degrees[v] += 1
             self.num_edges += 1
 
     def removeEdge(self, u: int, v: int) -> None:
@@ -38,8 +48,43 @@ class AdjacencyListGraph(AbstractGraph):
         self._validate_index(v)
         if self.hasEdge(u, v):
             del self.adj[u][v]
+            self.pred[v].discard(u)
+            self.out_degrees[u] -= 1
+            self.in_degrees[v] -= 1
             self.num_edges -= 1
 
+    def accumulateEdges(self, edges: Iterable[tuple[int, int, float]]) -> None:
+        edges = self._validate_edges(edges)
+        adj, pred = self.adj, self.pred
+        in_degrees, out_degrees = self.in_degrees, self.out_degrees
+
+        new_edges = 0
+        for u, v, w in edges:
+            row = adj[u]
+            if v in row:
+                row[v] += w
+            else:
+                row[v] = 0.0 + w
+                pred[v].add(u)
+                out_degrees[u] += 1
+                in_degrees[v] += 1
+                new_edges += 1
+        self.num_edges += new_edges
+
+    def iterSuccessors(self, u: int) -> Iterator[tuple[int, float]]:
+        self._validate_index(u)
+        return iter(self.adj[u].items())
+
+    def iterPredecessors(self, v: int) -> Iterator[tuple[int, float]]:
+        self._validate_index(v)
+        adj = self.adj
+        return ((u, adj[u][v]) for u in self.pred[v])
+
+    def iterEdges(self) -> Iterator[tuple[int, int, float]]:
+        for u, row in enumerate(self.adj):
+            for v, w in row.items():
+                yield u, v, w
+
     def isSucessor(self, u: int, v: int) -> bool:
         # v é sucessor de u se existe aresta u -> v
         return self.hasEdge(u, v)
@@ -68,15 +113,11 @@ class AdjacencyListGraph(AbstractGraph):
 
     def getVertexInDegree(self, u: int) -> int:
         self._validate_index(u)
-        degree = 0
-        for i in range(self.num_vertices):
-            if u in self.adj[i]:
-                degree += 1
-        return degree
+        return self.in_degrees[u]
 
     def getVertexOutDegree(self, u: int) -> int:
         self._validate_index(u)
-        return len(self.adj[u])
+        return self.out_degrees[u]
 
     def setVertexWeight(self, v: int, w: float) -> None:
         self._validate_index(v)
@@ -100,25 +141,25 @@ class AdjacencyListGraph(AbstractGraph):
     def isConnected(self) -> bool:
         if self.num_vertices == 0: return False
         
-        visited = set()
-        queue = [0]
-        visited.add(0)
+        visited = [False] * self.num_vertices
+        queue = deque([0])
+        visited[0] = True
         
         count = 0
         while queue:
-            u = queue.pop(0)
+            u = queue.popleft()
             count += 1
             
             # Vizinhos "saindo" (u -> v)
             for v in self.adj[u]:
-                if v not in visited:
-                    visited.add(v)
+                if not visited[v]:
+                    visited[v] = True
                     queue.append(v)
             
-            # Vizinhos "entrando" (v -> u)
-            for i in range(self.num_vertices):
-                if u in self.adj[i] and i not in visited:
-                    visited.add(i)
+            # Vizinhos "entrando" (v -> u), via índice reverso
+            for i in self.pred[u]:
+                if not visited[i]:
+                    visited[i] = True
                     queue.append(i)
 
         return count == self.num_vertices
@@ -1,13 +1,36 @@
+import argparse
+import contextlib
 import json
-import sys
+import os
+import time
+import traceback
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import TypeVar, Type
+from typing import Callable, Iterable, Iterator, TypeVar, Type
 
 from data_format import Issue, IssueComment, PullComment
-from dacite import from_dict
+import numpy as np
+from dacite import Config, from_dict
 
+from components import strong_components, weak_components
+from exporters import WRITERS, export_graph
 from graph_lib import AbstractGraph
-from list_graph import AdjacencyListGraph
+from graph_state import GraphState
+from interaction_table import MISSING, InteractionTable, author_index, join_authors, parse_times
+from json_stream import iter_array, iter_object
+from link_analysis import hits, pagerank, top_k
+from mapped_graph import write_mapped
+from multilayer_graph import CLOSE, COMMENT, LAYER_NAMES, MERGE, REVIEW, MultiLayerGraph
+import parse_cache
+from parse_cache import ParsedData
+import profiling
+from profiling import NULL_PROFILER, Profiler
+from records import record_decoder
+from shortest_paths import betweenness_centrality
+from temporal_graph import DAY, TemporalEdgeStore
+from user_mapper import UserMapper
 
 """
 Módulo de Análise de Redes de Colaboração do GitHub.
@@ -18,41 +41,130 @@ de um grafo, pondera as interações (comentários, reviews, merges) e exporta o
 para visualização no Gephi.
 """
 
-repo = ""
+T = TypeVar('T')
+K = TypeVar('K')
+V = TypeVar('V')
 
-class UserMapper:
-    """
-    Classe utilitária responsável pelo mapeamento bidirecional entre identificadores
-    de usuários (strings/login do GitHub) e índices numéricos (inteiros).
+DACITE_CONFIG = Config()
 
-    Necessária pois a implementação do Grafo (AdjacencyListGraph) opera sobre
-    índices inteiros para otimização de memória, enquanto os dados brutos utilizam
-    strings.
-    """
+DOWNLOADS_DIR = "downloader/downloads"
+DATA_FILES = ("issues", "issues_comments", "pulls_comments", "pulls_reviews")
+# Formato binário para mmap (ver mapped_graph), aceito em --formats além dos de exporters.WRITERS
+MAPPED_FORMAT = "graph"
+EXPORT_FORMATS = (*WRITERS, MAPPED_FORMAT)
 
-    def __init__(self):
-        self.user_to_id = {}
-        self.id_to_user = {}
-        self.counter = 0
+# Pesos por camada de interação usados para derivar cada grafo exportado
+WEIGHTED_SCHEME = {COMMENT: 2.0, REVIEW: 4.0, MERGE: 5.0}
+COMMENT_SCHEME = {COMMENT: 0.0}
+CLOSING_SCHEME = {CLOSE: 0.0}
+PRS_SCHEME = {REVIEW: 0.0, MERGE: 0.0}
 
-    def get_id(self, username: str) -> int:
-        """
-        Recupera o ID numérico de um usuário. Se o usuário não existir,
-        gera um novo ID incremental e o registra.
-        """
-        if username not in self.user_to_id:
-            self.user_to_id[username] = self.counter
-            self.id_to_user[self.counter] = username
-            self.counter += 1
-        return self.user_to_id[username]
 
-    def get_name(self, user_id: int) -> str:
-        """Retorna o login original do GitHub associado a um ID numérico."""
-        return self.id_to_user.get(user_id, "Unknown")
+@dataclass
+class RunOptions:
+    """
+    Configuração de uma execução do pipeline para um repositório. É passada explicitamente
+    às funções (em vez de variáveis globais do módulo), de forma que vários repositórios
+    possam ser processados ao mesmo tempo.
+    """
+    repo: str
+    stream: bool = False
+    # Se verdadeiro, cada registro é validado por completo com dacite (mais lento)
+    validate: bool = False
+    use_cache: bool = True
+    incremental: bool = False
+    # Formatos de saída dos grafos (ver EXPORT_FORMATS) e compactação com gzip
+    export_formats: list[str] = field(default_factory=lambda: ["gdf"])
+    compress_output: bool = False
+    top: int = 0
+    betweenness: int | None = None
+    # Linha do tempo (--window/--step): tamanho e passo das janelas, em dias
+    window_days: int | None = None
+    step_days: int | None = None
+    # Instrumentação das etapas (--profile / GRAPH_PROFILE); desativada por padrão
+    profiler: Profiler = field(default_factory=Profiler)
+
+    @property
+    def slug(self) -> str:
+        return self.repo.replace('/', '_')
+
+
+@dataclass
+class BatchResult:
+    """Resultado do processamento de um repositório no modo em lote."""
+    repo: str
+    ok: bool
+    seconds: float
+    error: str | None = None
+    vertices: int = 0
+    edges: int = 0
+    # Preenchidos apenas quando o grafo combinado foi solicitado
+    logins: list[str] | None = None
+    layers: MultiLayerGraph | None = None
+
+
+class RepoData:
+    """
+    Fonte dos artefatos JSON de um repositório para os construtores de grafos.
 
-    def count(self) -> int:
-        """Retorna o número total de usuários únicos mapeados."""
-        return self.counter
+    Em modo normal, cada arquivo é carregado uma única vez e mantido em memória. Em modo
+    streaming (`stream=True`), cada chamada relê o arquivo e produz os registros um a um,
+    de forma que o consumo de memória fica limitado ao maior registro, e não ao dump.
+    """
+
+    def __init__(self, options: RunOptions):
+        self.repo = options.repo
+        self.stream = options.stream
+        self.validate = options.validate
+        self.profiler = options.profiler
+
+        if self.stream:
+            for file in DATA_FILES:
+                path = data_path(self.repo, file)
+                if not Path(path).exists():
+                    raise FileNotFoundError(path)
+            return
+
+        self._issues: list[Issue] = self._load(Issue, "issues", process_list)
+        self._issue_comments: list[IssueComment] = self._load(IssueComment, "issues_comments", process_list)
+        self._pulls_comments: list[PullComment] = self._load(PullComment, "pulls_comments", process_list)
+        self._pulls_reviews: dict[str, list[PullComment]] = self._load(PullComment, "pulls_reviews", process_dict)
+
+    def _load(self, cls: Type[T], file: str, process: Callable):
+        """Lê e decodifica um arquivo de dados, medindo as duas etapas separadamente."""
+        with self.profiler.stage(f"read:{file}") as stage:
+            raw = read(self.repo, file)
+            stage.records = record_count(raw)
+        with self.profiler.stage(f"decode:{file}", records=stage.records):
+            return process(cls, raw, self.validate)
+
+    def issues(self) -> Iterable[Issue]:
+        if self.stream: return stream_list(Issue, self.repo, "issues", self.validate)
+        return self._issues
+
+    def issue_comments(self) -> Iterable[IssueComment]:
+        if self.stream: return stream_list(IssueComment, self.repo, "issues_comments", self.validate)
+        return self._issue_comments
+
+    def pulls_comments(self) -> Iterable[PullComment]:
+        if self.stream: return stream_list(PullComment, self.repo, "pulls_comments", self.validate)
+        return self._pulls_comments
+
+    def pulls_reviews(self) -> Iterable[tuple[str, list[PullComment]]]:
+        """Pares (número do PR, reviews), como em `dict.items()`."""
+        if self.stream: return stream_dict(PullComment, self.repo, "pulls_reviews", self.validate)
+        return self._pulls_reviews.items()
+
+
+def positive_int(text: str) -> int:
+    """Tipo do argparse para quantidades que precisam ser inteiros positivos (ex.: dias da janela)."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}' não é um número inteiro")
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"deve ser maior que zero (recebido {value})")
+    return value
 
 
 def main():
@@ -61,16 +173,64 @@ def main():
 
     Executa o pipeline de processamento:
     1. Validação de entrada e arquivos.
-    2. Carregamento de dados JSON (Issues, PRs, Comentários).
+    2. Carregamento de dados JSON (Issues, PRs, Comentários), ou do cache se os arquivos não mudaram.
     3. Mapeamento preliminar de autores para indexação de vértices.
     4. Construção do Grafo Ponderado baseado em regras de negócio.
     5. Exportação para formato GDF.
-    """
-    global repo
 
+    Com --all, executa o pipeline para todos os repositórios baixados, em paralelo.
+    """
     # 1. Tratamento de Argumentos
-    if len(sys.argv) > 1:
-        repo = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Constrói grafos de colaboração a partir dos dados do GitHub.")
+    parser.add_argument("repo", nargs="?", help="Repositório no formato {owner}/{repository}")
+    parser.add_argument("--stream", action="store_true",
+                        help="Lê os JSONs de forma incremental, sem carregar os arquivos inteiros em memória")
+    parser.add_argument("--validate", action="store_true",
+                        help="Valida todos os campos dos registros com dacite em vez do decodificador rápido")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignora o cache de dados decodificados e relê todos os JSONs")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Atualiza o estado persistido do grafo aplicando apenas os registros novos")
+    parser.add_argument("--formats", default="gdf",
+                        help=f"Formatos de exportação separados por vírgula ({', '.join(EXPORT_FORMATS)})")
+    parser.add_argument("--gzip", action="store_true", help="Compacta os arquivos exportados com gzip")
+    parser.add_argument("--top", type=int, default=0, metavar="N",
+                        help="Lista os N usuários mais influentes (PageRank e HITS do grafo ponderado)")
+    parser.add_argument("--betweenness", type=int, nargs="?", const=0, default=None, metavar="K",
+                        help="Com --top, lista também a centralidade de intermediação; K > 0 usa uma amostra de K origens")
+    parser.add_argument("--window", type=positive_int, default=None, metavar="DIAS",
+                        help="Gera out/timeline_<repo>.csv com o grafo ponderado de cada janela de DIAS dias")
+    parser.add_argument("--step", type=positive_int, default=None, metavar="DIAS",
+                        help="Com --window, avanço entre janelas consecutivas (padrão: o tamanho da janela)")
+    parser.add_argument("--profile", action="store_true",
+                        help=f"Mede tempo, CPU, memória e vazão de cada etapa e grava out/profile_<repo>.json "
+                             f"(também ativado pela variável {profiling.ENV_VAR})")
+    parser.add_argument("--cprofile", action="store_true",
+                        help="Com --profile, grava também um dump do cProfile por etapa em out/profile_<repo>/")
+    parser.add_argument("--all", action="store_true",
+                        help=f"Processa todos os repositórios baixados em {DOWNLOADS_DIR}, em paralelo")
+    parser.add_argument("--workers", type=int, default=None, metavar="N",
+                        help="Com --all, número máximo de processos simultâneos (padrão: número de CPUs)")
+    parser.add_argument("--merge", action="store_true",
+                        help="Com --all, exporta também um grafo ponderado combinando todos os repositórios")
+    args = parser.parse_args()
+
+    export_formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    unknown = [fmt for fmt in export_formats if fmt not in EXPORT_FORMATS]
+    if unknown:
+        error(f"Formatos desconhecidos: {', '.join(unknown)}")
+        return
+
+    if args.all:
+        repos = discover_repos()
+        if not repos:
+            error(f"Nenhum repositório encontrado em {DOWNLOADS_DIR}")
+            return
+        run_batch([run_options(args, r, export_formats) for r in repos], args.workers, args.merge)
+        return
+
+    if args.repo:
+        repo = args.repo
     else:
         info("Qual o repositorio?")
         repo = input()
@@ -81,179 +241,468 @@ def main():
         print()
 
     # 2. Verificação de integridade dos dados
-    base_path = Path(f"downloader/downloads/{repo}")
+    base_path = Path(f"{DOWNLOADS_DIR}/{repo}")
     if not base_path.exists():
-        error(f"Dados não encontrados na pasta downloader/downloads/{repo}")
+        error(f"Dados não encontrados na pasta {DOWNLOADS_DIR}/{repo}")
         error(f"Faça o download com: bun run index.ts {repo}")
         return
 
-    # 3. Carregamento dos artefatos (JSONs)
     try:
-        issues: list[Issue] = process_list(Issue, read("issues"))
-        issue_comments: list[IssueComment] = process_list(IssueComment, read("issues_comments"))
-        pulls_comments: list[PullComment] = process_list(PullComment, read("pulls_comments"))
-        pulls_reviews: dict[str, list[PullComment]] = process_dict(PullComment, read("pulls_reviews"))
+        run_repo(run_options(args, repo, export_formats))
     except FileNotFoundError as e:
         error(f"Arquivo crítico faltando: {e}")
         return
 
-    # 4. Pré-processamento e Indexação
-    info("Indexando autores de Issues e PRs...")
-    user_mapper = UserMapper()
-
-    # Mapeia Autores de Issues (Necessário para identificar o alvo dos comentários)
-    issue_authors: dict[int, int] = {}
-    for issue in issues:
-        user = issue.user
-        if user is not None:
-            u_id = user_mapper.get_id(user.login)
-            issue_authors[issue.number] = u_id
-
-    # Varredura completa para registro de todos os nós (Vértices) antes da criação do grafo
-    info("Mapeando espaço de usuários...")
-
-    for c in issue_comments:
-        if c.user is not None: user_mapper.get_id(c.user.login)
+    info("Pipeline finalizado com sucesso.")
 
-    for c in pulls_comments:
-        if c.user is not None: user_mapper.get_id(c.user.login)
 
-    for pr_num, reviews in pulls_reviews.items():
-        for r in reviews:
-            if r.user is not None: user_mapper.get_id(r.user.login)
-            
-    # Mapear quem fechou issues/PRs (Merges)
-    for issue in issues:
-        if issue.closed_by is not None: user_mapper.get_id(issue.closed_by.login)
+def run_options(args: argparse.Namespace, repo: str, export_formats: list[str]) -> RunOptions:
+    return RunOptions(
+        repo=repo,
+        stream=args.stream,
+        validate=args.validate,
+        use_cache=not args.no_cache,
+        incremental=args.incremental,
+        export_formats=export_formats,
+        compress_output=args.gzip,
+        top=args.top,
+        betweenness=args.betweenness,
+        window_days=args.window,
+        step_days=args.step,
+        profiler=Profiler.from_env(args.profile, args.cprofile, cprofile_dir=profile_path(repo)),
+    )
+
+
+def run_repo(options: RunOptions) -> tuple[UserMapper, MultiLayerGraph]:
+    """Executa o pipeline completo de um repositório: carga, construção, relatórios e exportação."""
+    # 3. Carregamento dos artefatos (estado incremental, cache ou JSONs)
+    sources = [data_path(options.repo, file) for file in DATA_FILES]
+    interactions = None
+    if options.incremental:
+        user_mapper, layers = load_incremental(options, sources)
+    else:
+        user_mapper, layers, interactions = load_full(options, sources)
 
-    num_users = user_mapper.count()
-    info(f"Total de usuários únicos (Vértices): {num_users}")
+    info(f"Total de usuários únicos (Vértices): {user_mapper.count()}")
 
     # Construir um grafo ponderado
-    log_weighted_graph(build_weighted_graph(user_mapper, issues, issue_comments, pulls_comments, pulls_reviews, issue_authors), user_mapper)
+    weighted = weighted_graph(layers, options.profiler)
+    log_weighted_graph(weighted, user_mapper, options)
+    if options.top > 0:
+        log_ranking(weighted[0], user_mapper, options.top, options.profiler)
+        if options.betweenness is not None:
+            log_betweenness(weighted[0], user_mapper, options.top, options.betweenness or None, options.profiler)
+    if options.window_days:
+        if interactions is None:
+            warn("A linha do tempo (--window) não está disponível no modo incremental.")
+        else:
+            log_timeline(interactions, user_mapper, options)
 
     # Grafo 1: comentários em issues ou pull requests;
-    log_graph(comment_graph(user_mapper, issue_comments, pulls_comments, issue_authors), "grafo1_comentarios", user_mapper)
+    log_graph(derived_graph(layers, COMMENT_SCHEME, "grafo1_comentarios", options.profiler),
+              "grafo1_comentarios", user_mapper, options)
 
     # Grafo 2: fechamento de issue por outro usuário;
-    log_graph(closing_graph(user_mapper, issues), "grafo2_fechamento", user_mapper)
+    log_graph(derived_graph(layers, CLOSING_SCHEME, "grafo2_fechamento", options.profiler),
+              "grafo2_fechamento", user_mapper, options)
 
     # Grafo 3: revisões/aprovações/merges de pull requests;
-    log_graph(prs_graph(user_mapper, issues, pulls_reviews, issue_authors), "grafo3_reviews_merges", user_mapper)
+    log_graph(derived_graph(layers, PRS_SCHEME, "grafo3_reviews_merges", options.profiler),
+              "grafo3_reviews_merges", user_mapper, options)
 
-    info("Pipeline finalizado com sucesso.")
+    if options.profiler.enabled:
+        options.profiler.save(f"{profile_path(options.repo)}.json")
+        info(f"Perfil de execução gravado em {profile_path(options.repo)}.json")
 
+    return user_mapper, layers
 
-# noinspection DuplicatedCode
-def comment_graph(user_mapper: UserMapper, issue_comments: list[IssueComment], pulls_comments: list[PullComment],
-                  issue_authors: dict[int, int]) -> AbstractGraph:
-    num_users = user_mapper.count()
-    graph = AdjacencyListGraph(num_users)
 
-    # --- A: Processamento de Comentários em Issues ---
+def discover_repos(root: str = DOWNLOADS_DIR) -> list[str]:
+    """Repositórios ({owner}/{repository}) em `root` com todos os arquivos de dados baixados."""
+    repos = []
+    for repo_dir in sorted(Path(root).glob("*/*")):
+        if repo_dir.is_dir() and all((repo_dir / f"{file}.json").exists() for file in DATA_FILES):
+            repos.append(f"{repo_dir.parent.name}/{repo_dir.name}")
+    return repos
+
+
+def batch_worker(options: RunOptions, merge: bool) -> BatchResult:
+    """
+    Processa um repositório em um processo do lote. A saída vai para out/logs/<repo>.log e
+    qualquer exceção é registrada no resultado, sem interromper os demais repositórios.
+    """
+    log_path = Path(f"out/logs/{options.slug}.log")
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+
+    with open(log_path, 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+        try:
+            user_mapper, layers = run_repo(options)
+        except Exception as e:
+            traceback.print_exc(file=log)
+            return BatchResult(options.repo, False, time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+
+    result = BatchResult(options.repo, True, time.perf_counter() - start,
+                         vertices=user_mapper.count(), edges=layers.getEdgeCount())
+    if merge:
+        result.logins = [user_mapper.get_name(i) for i in range(user_mapper.count())]
+        result.layers = layers
+    return result
+
+
+def run_batch(repo_options: list[RunOptions], workers: int | None = None, merge: bool = False) -> list[BatchResult]:
+    """
+    Processa vários repositórios em até `workers` processos simultâneos. Com `merge`, soma as
+    camadas de todos os repositórios (usuários identificados pelo login) e exporta o grafo
+    ponderado combinado em out/weighted_merged.<formato>.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(repo_options)))
+    info(f"Processando {len(repo_options)} repositórios com {workers} processos...")
+
+    merged_mapper = UserMapper()
+    merged = MultiLayerGraph(0)
+    results: list[BatchResult] = []
+
+    with ProcessPoolExecutor(workers) as pool:
+        futures = {pool.submit(batch_worker, options, merge): options.repo for options in repo_options}
+        for future in as_completed(futures):
+            repo = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # O processo do worker terminou de forma anormal (ex.: falta de memória)
+                result = BatchResult(repo, False, 0.0, error=f"{type(e).__name__}: {e}")
+
+            if result.ok:
+                info(f"{repo}: {result.vertices} vértices, {result.edges} arestas ({result.seconds:.1f}s)")
+            else:
+                error(f"{repo}: {result.error} (ver out/logs/{repo.replace('/', '_')}.log)")
+
+            if merge and result.ok:
+                mapping = [merged_mapper.get_id(login) for login in result.logins]
+                while merged.getVertexCount() < merged_mapper.count():
+                    merged.addVertex()
+                merged.merge(result.layers, mapping)
+                result.logins = result.layers = None
+            results.append(result)
+
+    failures = sum(not result.ok for result in results)
+    info(f"Lote finalizado: {len(results) - failures} repositórios processados, {failures} com falha.")
+
+    if merge:
+        base = replace(repo_options[0], repo="merged", top=0, betweenness=None, profiler=Profiler())
+        info(f"Grafo combinado: {merged_mapper.count()} usuários de {len(results) - failures} repositórios")
+        log_weighted_graph(weighted_graph(merged), merged_mapper, base)
+
+    return results
+
+
+def load_full(options: RunOptions, sources: list[str]) -> tuple[UserMapper, MultiLayerGraph, InteractionTable]:
+    """
+    Reconstrói usuários e camadas a partir de todo o histórico (ou do cache de dados
+    decodificados). Retorna também a tabela de interações, usada pela linha do tempo.
+    """
+    profiler, cache_file = options.profiler, cache_path(options.repo)
+    parsed = None
+    if options.use_cache and not options.validate:
+        with profiler.stage("cache_load") as stage:
+            parsed = parse_cache.load(cache_file, sources)
+            if parsed is not None: stage.records = len(parsed.sources)
+
+    # A tabela de usuários persistida mantém os IDs dos vértices estáveis entre execuções
+    users_file = users_path(options.repo)
+    user_mapper = UserMapper.load(users_file)
+
+    if parsed is not None:
+        info(f"Dados carregados do cache {cache_file}")
+        # O cache guarda a tabela completa (IDs do GitHub e apelidos) com que as interações
+        # foram numeradas; uma tabela persistida divergente é substituída por ela
+        if user_mapper is None or not user_mapper.matches(parsed.users):
+            user_mapper = parsed.users
+            user_mapper.save(users_file)
+    else:
+        if user_mapper is None:
+            user_mapper = UserMapper()
+        # Tiradas antes do parse: um arquivo reescrito durante a leitura invalida o cache
+        fingerprints = parse_cache.fingerprints(sources) if options.use_cache else {}
+        parsed = parse_repo(RepoData(options), user_mapper)
+        user_mapper.save(users_file)
+        if options.use_cache:
+            with profiler.stage("cache_save", records=len(parsed.sources)):
+                parse_cache.save(cache_file, fingerprints, parsed)
+
+    with profiler.stage("build_layers", records=len(parsed.sources)):
+        # Os grafos exportados são derivados das camadas de interação
+        interactions = parsed.table()
+        layers = MultiLayerGraph(user_mapper.count())
+        layers.accumulateTable(interactions)
+    return user_mapper, layers, interactions
+
+
+def load_incremental(options: RunOptions, sources: list[str]) -> tuple[UserMapper, MultiLayerGraph]:
+    """Carrega o estado persistido e aplica apenas os registros ainda não processados."""
+    profiler, state_file = options.profiler, state_path(options.repo)
+    with profiler.stage("state_load"):
+        state = GraphState.load(state_file)
+    if state is None:
+        info("Nenhum estado anterior encontrado; processando todo o histórico.")
+        state = GraphState()
+
+    if state.is_current(sources):
+        info(f"Nenhum dado novo desde a última atualização ({state_file})")
+    else:
+        fingerprints = parse_cache.fingerprints(sources)
+        data = RepoData(options)
+        with profiler.stage("update_state") as stage:
+            new = stage.records = update_state(state, data)
+        info(f"Novas interações aplicadas: {new}")
+        with profiler.stage("state_save", records=state.layers.getEdgeCount()):
+            state.save(state_file, fingerprints)
+
+    return state.mapper, state.layers
+
+
+def update_state(state: GraphState, data: RepoData) -> int:
+    """
+    Aplica ao estado somente os registros novos: comentários e reviews com ID acima da marca
+    d'água, e fechamentos/merges de issues ainda não contabilizados. Comentários e reviews em
+    issues ainda desconhecidas ficam pendentes no estado e são aplicados quando a issue
+    aparecer. Retorna o número de interações acrescentadas.
+    """
+    user_mapper, issue_authors = state.mapper, state.issue_authors
+
+    newly_closed: list[Issue] = []
+    for issue in data.issues():
+        if issue.user is not None and issue.number not in issue_authors:
+            issue_authors[issue.number] = user_mapper.get_id(issue.user.login, issue.user.id)
+        if issue.closed_by is not None and issue.number not in state.closed_issues:
+            state.closed_issues.add(issue.number)
+            newly_closed.append(issue)
+
+    issue_comments = [c for c in data.issue_comments() if c.id > state.last_issue_comment]
+    pulls_comments = [c for c in data.pulls_comments() if c.id > state.last_pull_comment]
+    pulls_reviews: list[tuple[str, list[PullComment]]] = []
+    for pr_num, reviews in data.pulls_reviews():
+        fresh = [r for r in reviews if r.id > state.last_review]
+        if fresh: pulls_reviews.append((pr_num, fresh))
+
+    resolved = state.resolve_pending()
+    interactions = collect_interactions(user_mapper, newly_closed, issue_comments, pulls_comments,
+                                        pulls_reviews, issue_authors, state.defer)
+    interactions = InteractionTable.concat([resolved, interactions])
+
+    state.last_issue_comment = max((c.id for c in issue_comments), default=state.last_issue_comment)
+    state.last_pull_comment = max((c.id for c in pulls_comments), default=state.last_pull_comment)
+    state.last_review = max((r.id for _, reviews in pulls_reviews for r in reviews), default=state.last_review)
+
+    state.grow()
+    state.layers.accumulateTable(interactions)
+    return len(interactions)
+
+
+def parse_repo(data: RepoData, user_mapper: UserMapper | None = None) -> ParsedData:
+    """
+    Decodifica os dados de um repositório: tabela de usuários, autor de cada issue e a
+    lista de interações (origem, destino, camada). É o resultado gravado no cache.
+
+    Com `user_mapper` (ex.: a tabela persistida da execução anterior), os usuários já
+    conhecidos mantêm seus IDs e os novos são acrescentados ao final.
+    """
+    user_mapper = user_mapper if user_mapper is not None else UserMapper()
+    profiler = data.profiler
+
+    with profiler.stage("collect_interactions") as stage:
+        # Os autores das issues são indexados por `collect_interactions`, na mesma passada
+        # sobre as issues que extrai os fechamentos e merges
+        issue_authors: dict[int, int] = {}
+        interactions = collect_interactions(user_mapper, data.issues(), data.issue_comments(), data.pulls_comments(),
+                                            data.pulls_reviews(), issue_authors)
+        stage.records = len(interactions)
+
+    return ParsedData(
+        users=user_mapper,
+        issue_numbers=array('q', issue_authors.keys()),
+        issue_author_ids=array('i', issue_authors.values()),
+        sources=array('i', interactions.sources.tobytes()),
+        targets=array('i', interactions.targets.tobytes()),
+        layers=array('b', interactions.layers.tobytes()),
+        times=array('q', interactions.times.tobytes()),
+    )
+
+
+def build_layers(
+        user_mapper: UserMapper, issues: Iterable[Issue],
+        issue_comments: Iterable[IssueComment], pulls_comments: Iterable[PullComment],
+        pulls_reviews: Iterable[tuple[str, list[PullComment]]], issue_authors: dict[int, int]
+) -> MultiLayerGraph:
+    """
+    Constrói, em uma única passada sobre os dados, o grafo multicamada com as contagens
+    de comentários, fechamentos, reviews e merges entre cada par de usuários. Os quatro
+    grafos exportados são derivados dele (ver `WEIGHTED_SCHEME` e afins).
+    """
+    layers = MultiLayerGraph(user_mapper.count())
+    layers.accumulateTable(
+        collect_interactions(user_mapper, issues, issue_comments, pulls_comments, pulls_reviews, issue_authors))
+    return layers
+
+
+def collect_interactions(
+        user_mapper: UserMapper, issues: Iterable[Issue],
+        issue_comments: Iterable[IssueComment], pulls_comments: Iterable[PullComment],
+        pulls_reviews: Iterable[tuple[str, list[PullComment]]], issue_authors: dict[int, int],
+        on_missing: Callable[[np.ndarray, np.ndarray, int, np.ndarray], None] | None = None
+) -> InteractionTable:
+    """
+    Aplica as regras de negócio e retorna as interações (origem, destino, camada e data)
+    em formato colunar. Cada fonte é percorrida uma única vez. As issues vêm primeiro: seus
+    autores são acrescentados a `issue_authors` (alterado no lugar) junto com os dados de
+    fechamento. Dos comentários e reviews extrai-se (usuário, número da issue), e o autor de
+    cada issue é resolvido depois, em lote, por `join_authors`. Por isso todo comentarista é
+    registrado no `user_mapper`, mesmo em issues sem autor conhecido. Os usuários recebem IDs
+    à medida que aparecem: autores das issues, comentaristas, revisores e, por fim, quem fechou.
+
+    Comentários e reviews em issues sem autor conhecido são descartados; com `on_missing`,
+    eles são repassados antes como `(números das issues, origens, camada, datas)`.
+    """
+    get_id = user_mapper.get_id
+    tables: list[InteractionTable] = []
+
+    def join(sources: array, numbers: array, layer: int, dates: list) -> InteractionTable:
+        targets, times = join_authors(numbers, authors), parse_times(dates)
+        if on_missing is not None:
+            missing = targets == MISSING
+            if missing.any():
+                on_missing(np.asarray(numbers, dtype=np.int64)[missing], np.asarray(sources, dtype=np.int32)[missing],
+                           layer, times[missing])
+        return InteractionTable.build(sources, targets, layer, times)
+
+    # --- Issues: autores (alvo dos comentários) e fechamentos ---
+    # Quem fechou só é registrado depois dos revisores, mantendo a ordem dos IDs
+    closings = []
+    for issue in issues:
+        author = issue.user
+        author_id = None
+        if author is not None:
+            author_id = issue_authors[issue.number] = get_id(author.login, author.id)
+        closer = issue.closed_by
+        if closer is None: continue
+        # Se é PR e foi mergeado, closed_by é usado como proxy para quem fez o merge
+        merged = (issue.pull_request is not None
+                  and issue.pull_request.merged_at is not None
+                  and issue.number in issue_authors)
+        closings.append((closer, author_id, merged, issue.closed_at,
+                         issue.pull_request.merged_at if issue.pull_request is not None else None))
+    authors = author_index(issue_authors)
+
+    # --- A: Comentários em Issues ---
+    commenters, numbers, dates = array('i'), array('q'), []
     for comment in issue_comments:
         user_obj = comment.user
         if user_obj is None: continue
-
-        commenter_id = user_mapper.get_id(user_obj.login)
-        issue_url = comment.issue_url
+        user_id = get_id(user_obj.login, user_obj.id)
 
         try:
-            issue_number = int(issue_url.split('/')[-1])
+            issue_number = int(comment.issue_url.rsplit('/', 1)[-1])
         except ValueError:
             continue
 
-        if issue_number in issue_authors:
-            author_id = issue_authors[issue_number]
-            if commenter_id != author_id:
-                add_interaction(graph, commenter_id, author_id)
+        commenters.append(user_id)
+        numbers.append(issue_number)
+        dates.append(comment.created_at)
+    tables.append(join(commenters, numbers, COMMENT, dates))
 
-    # --- B: Processamento de Comentários em Pull Requests ---
+    # --- B: Comentários em Pull Requests ---
+    commenters, numbers, dates = array('i'), array('q'), []
     for comment in pulls_comments:
         user_obj = comment.user
         if user_obj is None: continue
-
-        commenter_id = user_mapper.get_id(user_obj.login)
-        pr_url = comment.pull_request_url
+        user_id = get_id(user_obj.login, user_obj.id)
 
         try:
-            pr_number = int(pr_url.split('/')[-1])
+            pr_number = int(comment.pull_request_url.rsplit('/', 1)[-1])
         except ValueError:
             continue
 
-        if pr_number in issue_authors:
-            author_id = issue_authors[pr_number]
-            if commenter_id != author_id:
-                add_interaction(graph, commenter_id, author_id)
+        commenters.append(user_id)
+        numbers.append(pr_number)
+        dates.append(comment.created_at)
+    tables.append(join(commenters, numbers, COMMENT, dates))
 
-    return graph
+    # --- C: Code Reviews ---
+    reviewers, numbers, dates = array('i'), array('q'), []
+    for pr_num_str, reviews in pulls_reviews:
+        reviewer_ids = [get_id(r.user.login, r.user.id) for r in reviews if r.user is not None]
+        try:
+            pr_number = int(pr_num_str)
+        except ValueError: continue
 
+        reviewers.extend(reviewer_ids)
+        numbers.extend([pr_number] * len(reviewer_ids))
+        dates.extend(r.submitted_at for r in reviews if r.user is not None)
+    tables.append(join(reviewers, numbers, REVIEW, dates))
 
-# noinspection DuplicatedCode
-def closing_graph(user_mapper: UserMapper, issues: list[Issue]) -> AbstractGraph:
-    num_users = user_mapper.count()
-    graph = AdjacencyListGraph(num_users)
+    # --- D: Fechamentos e Merges (Issues) ---
+    closers, closed_authors, merged = array('i'), array('i'), array('b')
+    closed_dates, merged_dates = [], []
+    for closer, author_id, was_merged, closed_at, merged_at in closings:
+        closer_id = get_id(closer.login, closer.id)
+        if author_id is None: continue
 
-    # --- A: Processamento de Issues (Fechamento) ---
-    for issue in issues:
-        author = issue.user
-        closer = issue.closed_by
-        if author is None or closer is None: continue
+        closed_authors.append(author_id)
+        closers.append(closer_id)
+        merged.append(was_merged)
+        closed_dates.append(closed_at)
+        merged_dates.append(merged_at)
 
-        author_id = user_mapper.get_id(author.login)
-        closer_id = user_mapper.get_id(closer.login)
+    # Quem fechou -> Autor. Todo merge repete o par (u, v) de um fechamento anterior, então
+    # acrescentar os merges ao final não altera a ordem de primeira ocorrência das arestas
+    merged_mask = np.asarray(merged, dtype=bool)
+    tables.append(InteractionTable.build(closers, closed_authors, CLOSE, parse_times(closed_dates)))
+    tables.append(InteractionTable.build(np.asarray(closers)[merged_mask], np.asarray(closed_authors)[merged_mask], MERGE,
+                                         parse_times(merged_dates)[merged_mask]))
 
-        if author_id != closer_id:
-            # Quem fechou -> Autor
-            add_interaction(graph, closer_id, author_id)
+    return InteractionTable.concat(tables)
 
-    return graph
 
+def comment_graph(user_mapper: UserMapper, issue_comments: Iterable[IssueComment], pulls_comments: Iterable[PullComment],
+                  issue_authors: dict[int, int]) -> AbstractGraph:
+    layers = build_layers(user_mapper, (), issue_comments, pulls_comments, (), issue_authors)
+    return layers.toGraph(COMMENT_SCHEME)
 
-# noinspection DuplicatedCode
-def prs_graph(user_mapper: UserMapper, issues: list[Issue], pulls_reviews: dict[str, list[PullComment]], issue_authors: dict[int, int]) -> AbstractGraph:
-    num_users = user_mapper.count()
-    graph = AdjacencyListGraph(num_users)
 
-    # --- A: Processamento de Reviews em Pull Requests ---
-    for pr_num_str, reviews in pulls_reviews.items():
-        try:
-            pr_number = int(pr_num_str)
-        except ValueError: continue
+def closing_graph(user_mapper: UserMapper, issues: Iterable[Issue]) -> AbstractGraph:
+    layers = build_layers(user_mapper, issues, (), (), (), {})
+    return layers.toGraph(CLOSING_SCHEME)
 
-        if pr_number not in issue_authors: continue
-        author_id = issue_authors[pr_number]
 
-        for review in reviews:
-            author = review.user
-            if author is None: continue
+def prs_graph(user_mapper: UserMapper, issues: Iterable[Issue], pulls_reviews: Iterable[tuple[str, list[PullComment]]], issue_authors: dict[int, int]) -> AbstractGraph:
+    layers = build_layers(user_mapper, issues, (), (), pulls_reviews, issue_authors)
+    return layers.toGraph(PRS_SCHEME)
 
-            reviewer_id = user_mapper.get_id(author.login)
 
-            if reviewer_id != author_id:
-                add_interaction(graph, reviewer_id, author_id)
+def build_weighted_graph(
+        user_mapper: UserMapper, issues: Iterable[Issue],
+        issue_comments: Iterable[IssueComment], pulls_comments: Iterable[PullComment],
+        pulls_reviews: Iterable[tuple[str, list[PullComment]]], issue_authors: dict[int, int]
+) -> tuple[AbstractGraph, int, int, int]:
+    layers = build_layers(user_mapper, issues, issue_comments, pulls_comments, pulls_reviews, issue_authors)
+    return weighted_graph(layers)
 
-    # --- B: Processamento de Merges (baseado em Issues com PR e closed_by) ---
-    for issue in issues:
-        # Verifica se é PR e se foi mergeado
-        if issue.pull_request is None or issue.pull_request.merged_at is None: continue
-        
-        author = issue.user
-        merger = issue.closed_by # Usando closed_by como proxy para merger
-        if author is None or merger is None: continue
 
-        merger_id = user_mapper.get_id(merger.login)
-        pr_number = issue.number
+def weighted_graph(layers: MultiLayerGraph, profiler: Profiler = NULL_PROFILER) -> tuple[AbstractGraph, int, int, int]:
+    """Grafo integrado: comentários (peso 2), reviews (peso 4) e merges (peso 5)."""
+    info("Processando interações e calculando pesos das arestas...")
+    graph = derived_graph(layers, WEIGHTED_SCHEME, "weighted", profiler)
+    return graph, layers.getLayerTotal(COMMENT), layers.getLayerTotal(MERGE), layers.getLayerTotal(REVIEW)
 
-        if pr_number in issue_authors:
-            author_id = issue_authors[pr_number] # ou user_mapper.get_id(author.login)
-            if merger_id != author_id:
-                add_interaction(graph, merger_id, author_id)
 
-    return graph
+def derived_graph(layers: MultiLayerGraph, scheme: dict[int, float], name: str,
+                  profiler: Profiler = NULL_PROFILER) -> AbstractGraph:
+    with profiler.stage(f"graph:{name}", records=layers.getEdgeCount()):
+        return layers.toGraph(scheme)
 
 
-def log_graph(graph: AbstractGraph, name: str, user_mapper: UserMapper):
+def log_graph(graph: AbstractGraph, name: str, user_mapper: UserMapper, options: RunOptions):
     # Relatório de Execução
     print("-" * 40)
     info(f"Grafo [{name}] construído com sucesso!")
@@ -262,13 +711,10 @@ def log_graph(graph: AbstractGraph, name: str, user_mapper: UserMapper):
     print("-" * 40)
 
     # Exportação dos Dados
-    output_file = f"out/{name}_{repo.replace('/', '_')}.gdf"
-    info(f"Exportando para formato GDF: {output_file}...")
-
-    export_custom_gephi(graph, user_mapper, output_file)
+    export_outputs(graph, f"{name}_{options.slug}", user_mapper, options)
 
 
-def log_weighted_graph(data: tuple[AbstractGraph, int, int, int], user_mapper: UserMapper):
+def log_weighted_graph(data: tuple[AbstractGraph, int, int, int], user_mapper: UserMapper, options: RunOptions):
     graph, count_comments, count_merges, count_reviews = data
 
     # Relatório de Execução
@@ -279,156 +725,104 @@ def log_weighted_graph(data: tuple[AbstractGraph, int, int, int], user_mapper: U
     print(f"  - Interações de Comentários processadas: {count_comments}")
     print(f"  - Interações de Reviews processadas: {count_reviews}")
     print(f"  - Interações de Merges processadas: {count_merges}")
+    with options.profiler.stage("components", records=graph.getEdgeCount()):
+        _, weak_sizes = weak_components(graph)
+        _, strong_sizes = strong_components(graph)
+    print(f"  - Componentes fracamente conexas: {len(weak_sizes)} (maior: {max(weak_sizes, default=0)})")
+    print(f"  - Componentes fortemente conexas: {len(strong_sizes)} (maior: {max(strong_sizes, default=0)})")
     print("-" * 40)
 
     # Exportação dos Dados
-    output_file = f"out/weighted_{repo.replace('/', '_')}.gdf"
-    info(f"Exportando para formato GDF: {output_file}...")
+    export_outputs(graph, f"weighted_{options.slug}", user_mapper, options)
 
-    export_custom_gephi(graph, user_mapper, output_file)
 
+def log_timeline(interactions: InteractionTable, user_mapper: UserMapper, options: RunOptions):
+    """
+    Percorre o histórico em janelas de `options.window_days` dias e grava, para cada uma, o
+    número de interações, arestas e o peso total do grafo ponderado. A janela avança de
+    forma incremental (ver `temporal_graph.SlidingWindow`).
+    """
+    output_file = f"out/timeline_{options.slug}.csv"
+    size = options.window_days * DAY
+    step = (options.step_days or options.window_days) * DAY
+    store = TemporalEdgeStore(user_mapper.count(), interactions)
+    if len(store) == 0:
+        warn("Nenhuma interação com data registrada; linha do tempo não gerada.")
+        return
 
-# noinspection DuplicatedCode
-def build_weighted_graph(
-        user_mapper: UserMapper, issues: list[Issue],
-        issue_comments: list[IssueComment], pulls_comments: list[PullComment],
-        pulls_reviews: dict[str, list[PullComment]], issue_authors: dict[int, int]
-) -> tuple[AbstractGraph, int, int, int]:
-    num_users = user_mapper.count()
-
-    # Construção do Grafo
-    graph = AdjacencyListGraph(num_users)
+    info(f"Gerando linha do tempo em janelas de {options.window_days} dias: {output_file}...")
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    with options.profiler.stage("timeline", records=len(store)), \
+            open(output_file, 'w', encoding='utf-8') as f:
+        f.write("start,end,interactions,edges," + ",".join(LAYER_NAMES) + ",weight\n")
+        windows = 0
+        for window in store.windows(size, step):
+            layers = window.layers
+            totals = [layers.getLayerTotal(layer) for layer in range(len(LAYER_NAMES))]
+            weight = sum(totals[layer] * w for layer, w in WEIGHTED_SCHEME.items())
+            f.write(f"{iso_date(window.start)},{iso_date(window.end)},{len(window)},{layers.getEdgeCount()},"
+                    f"{','.join(map(str, totals))},{weight}\n")
+            windows += 1
+    info(f"Janelas geradas: {windows}")
+
+
+def log_ranking(graph: AbstractGraph, user_mapper: UserMapper, k: int, profiler: Profiler = NULL_PROFILER):
+    with profiler.stage("ranking", records=graph.getEdgeCount()):
+        ranks = pagerank(graph)
+        hubs, authorities = hits(graph)
 
-    info("Processando interações e calculando pesos das arestas...")
-
-    # --- A: Processamento de Comentários em Issues (Peso 2) ---
-    count_comments = 0
-    for comment in issue_comments:
-        user_obj = comment.user
-        if user_obj is None: continue
+    print("-" * 40)
+    info(f"Top {k} usuários por PageRank ponderado:")
+    for position, (v, score) in enumerate(top_k(ranks, k), start=1):
+        print(f"  {position:>3}. {user_mapper.get_name(v)} ({score:.5f})"
+              f" - hub {hubs[v]:.5f}, authority {authorities[v]:.5f}")
+    print("-" * 40)
 
-        commenter_id = user_mapper.get_id(user_obj.login)
-        issue_url = comment.issue_url
 
-        try:
-            issue_number = int(issue_url.split('/')[-1])
-        except ValueError:
-            continue
+def log_betweenness(graph: AbstractGraph, user_mapper: UserMapper, k: int, sample: int | None,
+                    profiler: Profiler = NULL_PROFILER):
+    info("Calculando centralidade de intermediação" + (f" (amostra de {sample} origens)..." if sample else "..."))
+    with profiler.stage("betweenness", records=graph.getEdgeCount()):
+        centrality = np.array(betweenness_centrality(graph, k=sample))
 
-        if issue_number in issue_authors:
-            author_id = issue_authors[issue_number]
-            if commenter_id != author_id:
-                add_interaction(graph, commenter_id, author_id, 2.0)
-                count_comments += 1
-
-    # --- B: Processamento de Comentários em Pull Requests (Peso 2) ---
-    for comment in pulls_comments:
-        user_obj = comment.user
-        if user_obj is None: continue
+    print("-" * 40)
+    info(f"Top {k} usuários por betweenness:")
+    for position, (v, score) in enumerate(top_k(centrality, k), start=1):
+        print(f"  {position:>3}. {user_mapper.get_name(v)} ({score:.5f})")
+    print("-" * 40)
 
-        commenter_id = user_mapper.get_id(user_obj.login)
-        pr_url = comment.pull_request_url
 
-        try:
-            pr_number = int(pr_url.split('/')[-1])
-        except ValueError:
+def export_outputs(graph: AbstractGraph, name: str, user_mapper: UserMapper, options: RunOptions):
+    """Exporta o grafo em `out/` em cada um dos formatos selecionados (`options.export_formats`)."""
+    for fmt in options.export_formats:
+        output_file = f"out/{name}.{fmt}"
+        if fmt == MAPPED_FORMAT:
+            # Binário para mmap: não é compactado, para poder ser mapeado diretamente
+            info(f"Exportando grafo binário (mmap): {output_file}...")
+            with options.profiler.stage(f"export:{name}.{fmt}", records=graph.getEdgeCount()):
+                write_mapped(output_file, graph, user_mapper)
             continue
-
-        if pr_number in issue_authors:
-            author_id = issue_authors[pr_number]
-            if commenter_id != author_id:
-                add_interaction(graph, commenter_id, author_id, 2.0)
-                count_comments += 1
-
-    # --- C: Processamento de Code Reviews (Peso 4) ---
-    count_reviews = 0
-    for pr_num_str, reviews in pulls_reviews.items():
-        try:
-            pr_number = int(pr_num_str)
-        except ValueError: continue
-
-        if pr_number not in issue_authors: continue
-        author_id = issue_authors[pr_number]
-
-        for review in reviews:
-            user_obj = review.user
-            if user_obj is None: continue
-
-            reviewer_id = user_mapper.get_id(user_obj.login)
-
-            if reviewer_id != author_id:
-                add_interaction(graph, reviewer_id, author_id, 4.0)
-                count_reviews += 1
-
-    # --- D: Processamento de Merges (Peso 5) ---
-    count_merges = 0
-    for issue in issues:
-        if (issue.pull_request is not None
-                and issue.pull_request.merged_at is not None
-                and issue.closed_by is not None
-        ):
-            merger_id = user_mapper.get_id(issue.closed_by.login)
-            author_id = issue_authors.get(issue.number)
-
-            if author_id is not None and merger_id != author_id:
-                add_interaction(graph, merger_id, author_id, 5.0)
-                count_merges += 1
-
-    return graph, count_comments, count_merges, count_reviews
+        info(f"Exportando para formato {fmt.upper()}: {output_file}{'.gz' if options.compress_output else ''}...")
+        with options.profiler.stage(f"export:{name}.{fmt}", records=graph.getEdgeCount()):
+            export_graph(graph, user_mapper, output_file, fmt, options.compress_output)
 
 
 def add_interaction(graph, u: int, v: int, weight: float = 0):
     """
     Registra uma interação entre dois usuários no grafo.
     Se a aresta já existe, soma o peso. Se não, cria com o peso informado (ou 0 se não informado e depois soma).
+
+    Para muitas interações, prefira acumular as triplas (u, v, peso) e chamar
+    `graph.accumulateEdges` uma única vez.
     """
-    # Garante a existência da aresta
-    if not graph.hasEdge(u, v):
-        graph.addEdge(u, v)
-        # Se addEdge não inicializar peso, definimos explicitamente como 0 antes de somar
-        if hasattr(graph, 'setEdgeWeight'):
-            graph.setEdgeWeight(u, v, 0.0)
-            
-    current_weight = graph.getEdgeWeight(u, v)
-    graph.setEdgeWeight(u, v, current_weight + weight)
+    graph.accumulateEdges([(u, v, weight)])
 
 
 def export_custom_gephi(graph, mapper, path):
     """
     Exporta a estrutura do grafo para o formato GDF.
     """
-    file = Path(path)
-    file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write("nodedef>name VARCHAR,label VARCHAR\n")
-        num_v = graph.getVertexCount()
-
-        for i in range(num_v):
-            login = mapper.get_name(i)
-            f.write(f"{login},{login}\n")
-
-        f.write("edgedef>node1 VARCHAR,node2 VARCHAR,weight DOUBLE,directed BOOLEAN\n")
-        for u in range(num_v):
-            if hasattr(graph, 'adj'):
-                # Otimização para Lista de Adjacência
-                for v, w in graph.adj[u].items():
-                    u_name = mapper.get_name(u)
-                    v_name = mapper.get_name(v)
-                    f.write(f"{u_name},{v_name},{w},true\n")
-            else:
-                # Fallback para Matriz
-                for v in range(num_v):
-                    if graph.hasEdge(u, v):
-                        w = graph.getEdgeWeight(u, v)
-                        u_name = mapper.get_name(u)
-                        v_name = mapper.get_name(v)
-                        f.write(f"{u_name},{v_name},{w},true\n")
-
-
-T = TypeVar('T')
-K = TypeVar('K')
-V = TypeVar('V')
+    export_graph(graph, mapper, path, "gdf")
 
 
 def or_default(value: T | None, default: T) -> T:
@@ -436,20 +830,76 @@ def or_default(value: T | None, default: T) -> T:
     return value
 
 
-def process_list(cls: Type[T], data: list) -> list[T]:
-    return [from_dict(data_class=cls, data=item, config=DACITE_CONFIG) for item in data]
+def record_parser(cls: Type[T], validate: bool = False) -> Callable[[dict], T]:
+    """
+    Decodificador de registros usado pelo pipeline: por padrão, as classes enxutas de
+    `records` (apenas os campos usados); com --validate, a validação completa do dacite.
+    """
+    if validate:
+        return lambda item: from_dict(data_class=cls, data=item, config=DACITE_CONFIG)
+    return record_decoder(cls)
+
+
+def process_list(cls: Type[T], data: list, validate: bool = False) -> list[T]:
+    parse = record_parser(cls, validate)
+    return [parse(item) for item in data]
 
 
-def process_dict(cls: Type[T], data: dict[K, list[V]]) -> dict[K, list[V]]:
+def process_dict(cls: Type[T], data: dict[K, list[V]], validate: bool = False) -> dict[K, list[V]]:
     new_dict: dict[K, list[V]] = {}
     for key in data:
-        new_dict[key] = process_list(cls, data[key])
+        new_dict[key] = process_list(cls, data[key], validate)
     return new_dict
 
 
-def read(file):
+def stream_list(cls: Type[T], repo: str, file: str, validate: bool = False) -> Iterator[T]:
+    """Versão incremental de `process_list(cls, read(repo, file))`: produz um registro por vez."""
+    info(f"Lendo {repo}/{file}.json (streaming)")
+    parse = record_parser(cls, validate)
+    for item in iter_array(data_path(repo, file)):
+        yield parse(item)
+
+
+def stream_dict(cls: Type[T], repo: str, file: str, validate: bool = False) -> Iterator[tuple[str, list[T]]]:
+    """Versão incremental de `process_dict(cls, read(repo, file))`: produz um par (chave, lista) por vez."""
+    info(f"Lendo {repo}/{file}.json (streaming)")
+    for key, items in iter_object(data_path(repo, file)):
+        yield key, process_list(cls, items, validate)
+
+
+def data_path(repo: str, file: str) -> str:
+    return f"{DOWNLOADS_DIR}/{repo}/{file}.json"
+
+
+def cache_path(repo: str) -> str:
+    return f"{DOWNLOADS_DIR}/{repo}/parsed.cache"
+
+
+def users_path(repo: str) -> str:
+    return f"{DOWNLOADS_DIR}/{repo}/users.map"
+
+
+def state_path(repo: str) -> str:
+    return f"{DOWNLOADS_DIR}/{repo}/graph.state"
+
+
+def profile_path(repo: str) -> str:
+    return f"out/profile_{repo.replace('/', '_')}"
+
+
+def iso_date(instant: int) -> str:
+    return time.strftime("%Y-%m-%d", time.gmtime(instant))
+
+
+def record_count(raw: list | dict) -> int:
+    if isinstance(raw, dict):
+        return sum(len(items) for items in raw.values())
+    return len(raw)
+
+
+def read(repo: str, file: str):
     info(f"Lendo {repo}/{file}.json")
-    with open(f"downloader/downloads/{repo}/{file}.json", 'r', encoding='utf-8') as file_content:
+    with open(data_path(repo, file), 'r', encoding='utf-8') as file_content:
         return json.load(file_content)
 
 
@@ -0,0 +1,272 @@
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from graph_lib import AbstractGraph
+from link_analysis import edge_arrays
+
+"""
+Formato binário de grafos para leitura via `mmap`.
+
+O arquivo guarda um cabeçalho e, em seções contíguas alinhadas em 8 bytes, os offsets e
+destinos das arestas (CSR, destinos ordenados em cada faixa), os pesos das arestas, o
+índice reverso (offsets e origens de cada vértice de destino), os pesos dos vértices e a
+tabela de logins (offsets + buffer UTF-8, como no UserMapper). `MappedGraph` abre o
+arquivo sem parse: cada seção é um `memoryview` sobre as páginas mapeadas, e graus e
+vizinhos são lidos diretamente delas. Só as páginas consultadas são carregadas pelo
+sistema operacional, e várias análises podem compartilhar o mesmo arquivo em cache.
+
+Os atributos seguem os nomes do CSRGraph (`offsets`, `targets`, `weights`), de forma que
+a análise de links lê os buffers diretamente, sem cópia.
+"""
+
+MAGIC = b"TPGM"
+VERSION = 1
+# magic, versão, número de vértices, número de arestas, tamanho do buffer de logins
+_HEADER = struct.Struct("<4sIQQQ")
+
+
+def _layout(num_vertices: int, num_edges: int, names_len: int) -> list[tuple[str, str, int, int]]:
+    # (nome, tipo do memoryview, posição, quantidade) de cada seção, na ordem do arquivo
+    sections = [
+        ("offsets", 'q', num_vertices + 1),
+        ("targets", 'i', num_edges),
+        ("weights", 'd', num_edges),
+        ("in_offsets", 'q', num_vertices + 1),
+        ("in_sources", 'i', num_edges),
+        ("vertex_weights", 'd', num_vertices),
+        ("name_offsets", 'q', num_vertices + 1),
+        ("names", 'B', names_len),
+    ]
+    layout, position = [], _HEADER.size
+    for name, fmt, count in sections:
+        layout.append((name, fmt, position, count))
+        position += -(-count * struct.calcsize(fmt) // 8) * 8
+    return layout
+
+
+def write_mapped(path: str, graph: AbstractGraph, mapper) -> None:
+    """
+    Grava o grafo em `path` de forma atômica (arquivo temporário + rename). `mapper`
+    fornece o login de cada vértice via `get_name`.
+    """
+    n = graph.getVertexCount()
+    src, dst, weights = edge_arrays(graph)
+
+    order = np.lexsort((dst, src))
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(src, minlength=n)))).astype(np.int64)
+    in_order = np.lexsort((src, dst))
+    in_offsets = np.concatenate(([0], np.cumsum(np.bincount(dst, minlength=n)))).astype(np.int64)
+
+    encoded = [mapper.get_name(v).encode('utf-8') for v in range(n)]
+    name_offsets = np.concatenate(([0], np.cumsum([len(name) for name in encoded]))).astype(np.int64)
+    names = b"".join(encoded)
+
+    columns = {
+        "offsets": offsets,
+        "targets": dst[order].astype(np.int32),
+        "weights": weights[order].astype(np.float64),
+        "in_offsets": in_offsets,
+        "in_sources": src[in_order].astype(np.int32),
+        "vertex_weights": np.fromiter((graph.getVertexWeight(v) for v in range(n)), dtype=np.float64, count=n),
+        "name_offsets": name_offsets,
+        "names": np.frombuffer(names, dtype=np.uint8),
+    }
+
+    file = Path(path)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = file.with_name(file.name + ".tmp")
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, n, len(src), len(names)))
+        for name, _, position, _ in _layout(n, len(src), len(names)):
+            f.write(bytes(position - f.tell()))
+            columns[name].tofile(f)
+        f.write(bytes(-f.tell() % 8))
+    os.replace(tmp, file)
+
+
+class MappedGraph(AbstractGraph):
+    """
+    Grafo somente leitura sobre um arquivo gravado por `write_mapped`. Também responde
+    `get_name`, podendo ser usado como mapper na exportação. Feche com `close()` (ou use
+    como gerenciador de contexto) para liberar o mapeamento.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = self._mmap[:_HEADER.size]
+        magic, version = (None, None) if len(header) != _HEADER.size else _HEADER.unpack(header)[:2]
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} não é um grafo mapeado (versão {VERSION}).")
+        _, _, self.num_vertices, self.num_edges, names_len = _HEADER.unpack(header)
+
+        layout = _layout(self.num_vertices, self.num_edges, names_len)
+        end = layout[-1][2] + layout[-1][3]
+        if len(self._mmap) < end:
+            self._mmap.close()
+            raise ValueError(f"{path} está truncado: {len(self._mmap)} bytes, esperados {end}.")
+
+        self._views: list[memoryview] = [memoryview(self._mmap)]
+        for name, fmt, position, count in layout:
+            view = self._views[0][position:position + count * struct.calcsize(fmt)].cast(fmt)
+            self._views.append(view)
+            setattr(self, name, view)
+        self._name_index: dict[str, int] | None = None
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedGraph":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _validate_index(self, v: int):
+        if v < 0 or v >= self.num_vertices:
+            raise ValueError(f"Vértice {v} inválido. Deve estar entre 0 e {self.num_vertices - 1}.")
+
+    def _read_only(self):
+        raise TypeError("Grafos mapeados são somente leitura; use CSRGraph.fromGraph() para obter uma cópia editável.")
+
+    def _find(self, u: int, v: int) -> int:
+        # Posição de v na faixa ordenada de u, ou -1 se a aresta não existir
+        start, end = self.offsets[u], self.offsets[u + 1]
+        i = bisect_left(self.targets, v, start, end)
+        if i < end and self.targets[i] == v:
+            return i
+        return -1
+
+    def get_name(self, v: int) -> str:
+        """Login do vértice v (como `UserMapper.get_name`)."""
+        if 0 <= v < self.num_vertices:
+            return bytes(self.names[self.name_offsets[v]:self.name_offsets[v + 1]]).decode('utf-8')
+        return "Unknown"
+
+    def find_vertex(self, login: str) -> int:
+        """Índice do vértice com o login dado, ou -1. O índice por login é montado na primeira consulta."""
+        if self._name_index is None:
+            self._name_index = {self.get_name(v): v for v in range(self.num_vertices)}
+        return self._name_index.get(login, -1)
+
+    def iterSuccessors(self, u: int) -> Iterator[tuple[int, float]]:
+        # Lidos diretamente da faixa de u
+        self._validate_index(u)
+        start, end = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def iterPredecessors(self, v: int) -> Iterator[tuple[int, float]]:
+        # Índice reverso; o peso vem da faixa de cada predecessor (busca binária)
+        self._validate_index(v)
+        sources = self.in_sources[self.in_offsets[v]:self.in_offsets[v + 1]]
+        return ((u, self.weights[self._find(u, v)]) for u in sources)
+
+    def iterEdges(self) -> Iterator[tuple[int, int, float]]:
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for u in range(self.num_vertices):
+            for i in range(offsets[u], offsets[u + 1]):
+                yield u, targets[i], weights[i]
+
+    def getVertexCount(self) -> int:
+        return self.num_vertices
+
+    def getEdgeCount(self) -> int:
+        return self.num_edges
+
+    def hasEdge(self, u: int, v: int) -> bool:
+        self._validate_index(u)
+        self._validate_index(v)
+        return self._find(u, v) != -1
+
+    def addEdge(self, u: int, v: int) -> None:
+        self._read_only()
+
+    def removeEdge(self, u: int, v: int) -> None:
+        self._read_only()
+
+    def accumulateEdges(self, edges: Iterable[tuple[int, int, float]]) -> None:
+        self._read_only()
+
+    def isSucessor(self, u: int, v: int) -> bool:
+        return self.hasEdge(u, v)
+
+    def isPredessor(self, u: int, v: int) -> bool:
+        return self.hasEdge(v, u)
+
+    def isDivergent(self, u1: int, v1: int, u2: int, v2: int) -> bool:
+        if not (self.hasEdge(u1, v1) and self.hasEdge(u2, v2)):
+            return False
+        return u1 == u2 and v1 != v2
+
+    def isConvergent(self, u1: int, v1: int, u2: int, v2: int) -> bool:
+        if not (self.hasEdge(u1, v1) and self.hasEdge(u2, v2)):
+            return False
+        return v1 == v2 and u1 != u2
+
+    def isIncident(self, u: int, v: int, x: int) -> bool:
+        if not self.hasEdge(u, v):
+            return False
+        return x == u or x == v
+
+    def getVertexInDegree(self, u: int) -> int:
+        self._validate_index(u)
+        return self.in_offsets[u + 1] - self.in_offsets[u]
+
+    def getVertexOutDegree(self, u: int) -> int:
+        self._validate_index(u)
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def setVertexWeight(self, v: int, w: float) -> None:
+        self._read_only()
+
+    def getVertexWeight(self, v: int) -> float:
+        self._validate_index(v)
+        return self.vertex_weights[v]
+
+    def setEdgeWeight(self, u: int, v: int, w: float) -> None:
+        self._read_only()
+
+    def getEdgeWeight(self, u: int, v: int) -> float:
+        self._validate_index(u)
+        self._validate_index(v)
+        i = self._find(u, v)
+        return self.weights[i] if i != -1 else 0.0
+
+    def isConnected(self) -> bool:
+        if self.num_vertices == 0: return False
+
+        # BFS ignorando a direção: faixas de saída (CSR) e de entrada (índice reverso)
+        visited = bytearray(self.num_vertices)
+        visited[0] = 1
+        queue = deque([0])
+        count = 0
+        while queue:
+            u = queue.popleft()
+            count += 1
+            for neighbors in (self.targets[self.offsets[u]:self.offsets[u + 1]],
+                              self.in_sources[self.in_offsets[u]:self.in_offsets[u + 1]]):
+                for v in neighbors:
+                    if not visited[v]:
+                        visited[v] = 1
+                        queue.append(v)
+
+        return count == self.num_vertices
+
+    def isEmptyGraph(self) -> bool:
+        return self.num_edges == 0
+
+    def isCompleteGraph(self) -> bool:
+        max_edges = self.num_vertices * (self.num_vertices - 1)
+        return self.num_edges == max_edges
@@ -1,9 +1,27 @@
+from array import array
+from collections import deque
+from typing import Iterable, Iterator
+
 from graph_lib import AbstractGraph
 
 class AdjacencyMatrixGraph(AbstractGraph):
-    def __init__(self, numVertices: int):
+    """
+    Matriz de adjacência em buffers contíguos: a existência das arestas fica em bitsets
+    (um por linha e outro transposto, por coluna) e os pesos em um único `array` de V*V
+    floats ('d' = float64 ou 'f' = float32). Graus e a BFS de conectividade operam sobre
+    linhas inteiras do bitset, convertidas em inteiros do Python.
+    """
+
+    def __init__(self, numVertices: int, weightType: str = 'd'):
+        if weightType not in ('d', 'f'):
+            raise ValueError("weightType deve ser 'd' (float64) ou 'f' (float32).")
+
         self.num_vertices = numVertices
-        self.matrix = [[0.0 for _ in range(numVertices)] for _ in range(numVertices)]
+        # Bytes por linha de bitset
+        self.stride = (numVertices + 7) // 8
+        self.out_bits = bytearray(numVertices * self.stride)
+        self.in_bits = bytearray(numVertices * self.stride)
+        self.weights = array(weightType, [0.0]) * (numVertices * numVertices)
         self.vertex_weights = [1.0] * numVertices
         self.num_edges = 0
 
@@ -11,6 +29,22 @@ class AdjacencyMatrixGraph(AbstractGraph):
         if v < 0 or v >= self.num_vertices:
             raise ValueError(f"Vértice {v} inválido. Deve estar entre 0 e {self.num_vertices - 1}.")
 
+    def _row_mask(self, bits: bytearray, u: int) -> int:
+        # Linha u do bitset como inteiro: o bit v indica a presença da aresta
+        start = u * self.stride
+        return int.from_bytes(bits[start:start + self.stride], 'little')
+
+    def _has(self, u: int, v: int) -> bool:
+        return self.out_bits[u * self.stride + (v >> 3)] >> (v & 7) & 1 == 1
+
+    def _set(self, u: int, v: int) -> None:
+        self.out_bits[u * self.stride + (v >> 3)] |= 1 << (v & 7)
+        self.in_bits[v * self.stride + (u >> 3)] |= 1 << (u & 7)
+
+    def _clear(self, u: int, v: int) -> None:
+        self.out_bits[u * self.stride + (v >> 3)] &= ~(1 << (v & 7)) & 0xFF
+        self.in_bits[v * self.stride + (u >> 3)] &= ~(1 << (u & 7)) & 0xFF
+
     def getVertexCount(self) -> int:
         return self.num_vertices
 
@@ -20,7 +54,7 @@ class AdjacencyMatrixGraph(AbstractGraph):
     def hasEdge(self, u: int, v: int) -> bool:
         self._validate_index(u)
         self._validate_index(v)
-        return self.matrix[u][v] != 0.0
+        return self._has(u, v)
 
     def addEdge(self, u: int, v: int) -> None:
         self._validate_index(u)
@@ -29,17 +63,54 @@ class AdjacencyMatrixGraph(AbstractGraph):
         if u == v:
             raise ValueError("Laços (self-loops) não são permitidos.")
 
-        if not self.hasEdge(u, v):
-            self.matrix[u][v] = 1.0
+        if not self._has(u, v):
+            self._set(u, v)
+            self.weights[u * self.num_vertices + v] = 1.0
             self.num_edges += 1
 
     def removeEdge(self, u: int, v: int) -> None:
         self._validate_index(u)
         self._validate_index(v)
-        if self.hasEdge(u, v):
-            self.matrix[u][v] = 0.0
+        if self._has(u, v):
+            self._clear(u, v)
+            self.weights[u * self.num_vertices + v] = 0.0
             self.num_edges -= 1
 
+    def accumulateEdges(self, edges: Iterable[tuple[int, int, float]]) -> None:
+        edges = self._validate_edges(edges)
+        n, weights = self.num_vertices, self.weights
+
+        for u, v, w in edges:
+            if not self._has(u, v):
+                self._set(u, v)
+                self.num_edges += 1
+            weights[u * n + v] += w
+
+    def _iter_bits(self, mask: int) -> Iterator[int]:
+        # Índices dos bits ligados de uma linha do bitset, em ordem crescente
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def iterSuccessors(self, u: int) -> Iterator[tuple[int, float]]:
+        self._validate_index(u)
+        weights, row = self.weights, u * self.num_vertices
+        return ((v, weights[row + v]) for v in self._iter_bits(self._row_mask(self.out_bits, u)))
+
+    def iterPredecessors(self, v: int) -> Iterator[tuple[int, float]]:
+        self._validate_index(v)
+        weights, n = self.weights, self.num_vertices
+        return ((u, weights[u * n + v]) for u in self._iter_bits(self._row_mask(self.in_bits, v)))
+
+    def iterEdges(self) -> Iterator[tuple[int, int, float]]:
+        # Percorre apenas os bits ligados de cada linha do bitset
+        weights, n = self.weights, self.num_vertices
+        for u in range(n):
+            row = u * n
+            for v in self._iter_bits(self._row_mask(self.out_bits, u)):
+                yield u, v, weights[row + v]
+
     def isSucessor(self, u: int, v: int) -> bool:
         return self.hasEdge(u, v)
 
@@ -63,19 +134,11 @@ class AdjacencyMatrixGraph(AbstractGraph):
 
     def getVertexInDegree(self, u: int) -> int:
         self._validate_index(u)
-        degree = 0
-        for i in range(self.num_vertices):
-            if self.matrix[i][u] != 0.0:
-                degree += 1
-        return degree
+        return self._row_mask(self.in_bits, u).bit_count()
 
     def getVertexOutDegree(self, u: int) -> int:
         self._validate_index(u)
-        degree = 0
-        for j in range(self.num_vertices):
-            if self.matrix[u][j] != 0.0:
-                degree += 1
-        return degree
+        return self._row_mask(self.out_bits, u).bit_count()
 
     def setVertexWeight(self, v: int, w: float) -> None:
         self._validate_index(v)
@@ -88,35 +151,33 @@ class AdjacencyMatrixGraph(AbstractGraph):
     def setEdgeWeight(self, u: int, v: int, w: float) -> None:
         self._validate_index(u)
         self._validate_index(v)
-        if self.hasEdge(u, v):
-            self.matrix[u][v] = w
+        if self._has(u, v):
+            self.weights[u * self.num_vertices + v] = w
 
     def getEdgeWeight(self, u: int, v: int) -> float:
         self._validate_index(u)
         self._validate_index(v)
-        return self.matrix[u][v]
+        return self.weights[u * self.num_vertices + v]
 
     def isConnected(self) -> bool:
         if self.num_vertices == 0: return False
         
-        visited = set()
-        queue = [0]
-        visited.add(0)
+        # Conjunto de visitados como bitmask; cada passo processa a linha inteira de u
+        visited = 1
+        queue = deque([0])
         
-        count = 0
         while queue:
-            u = queue.pop(0)
-            count += 1
+            u = queue.popleft()
             
-            # Percorre todos os possíveis vizinhos (O(N))
-            for v in range(self.num_vertices):
-                # Verifica conexões de ida e volta (grafo fracamente conexo)
-                if (self.matrix[u][v] != 0.0 or self.matrix[v][u] != 0.0):
-                    if v not in visited:
-                        visited.add(v)
-                        queue.append(v)
+            # Conexões de ida e volta (grafo fracamente conexo) ainda não visitadas
+            new = (self._row_mask(self.out_bits, u) | self._row_mask(self.in_bits, u)) & ~visited
+            visited |= new
+            while new:
+                low = new & -new
+                queue.append(low.bit_length() - 1)
+                new ^= low
         
-        return count == self.num_vertices
+        return visited == (1 << self.num_vertices) - 1
 
     def isEmptyGraph(self) -> bool:
         return self.num_edges == 0
@@ -134,6 +195,6 @@ class AdjacencyMatrixGraph(AbstractGraph):
             f.write("edgedef>node1 VARCHAR,node2 VARCHAR,weight DOUBLE,directed BOOLEAN\n")
             for u in range(self.num_vertices):
                 for v in range(self.num_vertices):
-                    if self.matrix[u][v] != 0.0:
-                        f.write(f"v{u},v{v},{self.matrix[u][v]},true\n")
+                    if self._has(u, v):
+                        f.write(f"v{u},v{v},{self.weights[u * self.num_vertices + v]},true\n")
         print(f"Grafo (Matriz) exportado para {path}")
\ No newline at end of file
@@ -0,0 +1,186 @@
+from itertools import chain
+from operator import add, sub
+from typing import Iterable, Type
+
+import numpy as np
+
+from graph_lib import AbstractGraph
+from interaction_table import InteractionTable
+from list_graph import AdjacencyListGraph
+
+# Camadas de interação: cada aresta guarda uma contagem por camada
+COMMENT, CLOSE, REVIEW, MERGE = range(4)
+LAYER_NAMES = ("comment", "close", "review", "merge")
+
+
+class MultiLayerGraph:
+    """
+    Grafo direcionado de interações com múltiplas camadas.
+
+    Cada aresta u -> v guarda quantas interações de cada tipo (comentário, fechamento,
+    review e merge) ocorreram de u para v. Ele é construído uma única vez a partir dos
+    dados brutos; os grafos ponderados são derivados dele com `toGraph`, aplicando um
+    peso por camada, sem reler nem reprocessar os registros.
+    """
+
+    def __init__(self, numVertices: int):
+        self.num_vertices = numVertices
+        self.adj: list[dict[int, list[int]]] = [{} for _ in range(numVertices)]
+        self.layer_totals = [0] * len(LAYER_NAMES)
+        self.num_edges = 0
+
+    def _validate_index(self, v: int):
+        if v < 0 or v >= self.num_vertices:
+            raise ValueError(f"Vértice {v} inválido. Deve estar entre 0 e {self.num_vertices - 1}.")
+
+    def getVertexCount(self) -> int:
+        return self.num_vertices
+
+    def getEdgeCount(self) -> int:
+        return self.num_edges
+
+    def addVertex(self) -> int:
+        """Acrescenta um vértice sem arestas e retorna seu índice."""
+        self.adj.append({})
+        self.num_vertices += 1
+        return self.num_vertices - 1
+
+    def addInteraction(self, u: int, v: int, layer: int, count: int = 1) -> None:
+        self.accumulateInteractions([(u, v, layer)] * count)
+
+    def accumulateInteractions(self, interactions: Iterable[tuple[int, int, int]]) -> None:
+        """Registra um lote de interações (u, v, camada), validando todo o lote antes de alterar o grafo."""
+        columns = np.array(interactions if isinstance(interactions, list) else list(interactions),
+                           dtype=np.int64).reshape(-1, 3)
+        self.accumulateTable(InteractionTable(columns[:, 0], columns[:, 1], columns[:, 2]))
+
+    def accumulateTable(self, table: InteractionTable) -> None:
+        """
+        Registra as interações de uma tabela colunar. Os pares (u, v) repetidos são agregados
+        de forma vetorizada, e o grafo é atualizado uma única vez por aresta distinta.
+        """
+        if len(table) == 0:
+            return
+
+        us, vs, counts = self._aggregate(table)
+        adj = self.adj
+        for u, v, edge_counts in zip(us.tolist(), vs.tolist(), counts.tolist()):
+            row = adj[u]
+            existing = row.get(v)
+            if existing is None:
+                row[v] = edge_counts
+                self.num_edges += 1
+            else:
+                row[v] = list(map(add, existing, edge_counts))
+
+        for layer, count in enumerate(counts.sum(axis=0).tolist()):
+            self.layer_totals[layer] += count
+
+    def expireTable(self, table: InteractionTable) -> None:
+        """
+        Desfaz o registro das interações de uma tabela (ex.: as que saíram de uma janela de
+        tempo). As arestas que ficam sem nenhuma interação são removidas. Todo o lote é
+        validado antes: remover interações que não estão no grafo gera ValueError.
+        """
+        if len(table) == 0:
+            return
+
+        us, vs, counts = self._aggregate(table)
+        adj = self.adj
+        updates = []
+        for u, v, edge_counts in zip(us.tolist(), vs.tolist(), counts.tolist()):
+            row = adj[u]
+            existing = row.get(v)
+            remaining = None if existing is None else list(map(sub, existing, edge_counts))
+            if remaining is None or min(remaining) < 0:
+                raise ValueError(f"Interações de {u} para {v} não estão registradas no grafo.")
+            updates.append((row, v, remaining))
+
+        for row, v, remaining in updates:
+            if any(remaining):
+                row[v] = remaining
+            else:
+                del row[v]
+                self.num_edges -= 1
+
+        for layer, count in enumerate(counts.sum(axis=0).tolist()):
+            self.layer_totals[layer] -= count
+
+    def _aggregate(self, table: InteractionTable) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Valida todo o lote (vértices, laços e camadas) e agrega as interações por aresta
+        n, num_layers = self.num_vertices, len(LAYER_NAMES)
+        sources, targets, layers = table.sources, table.targets, table.layers
+        for column in (sources, targets):
+            low, high = int(column.min()), int(column.max())
+            if low < 0 or high >= n:
+                self._validate_index(low if low < 0 else high)
+        if np.any(sources == targets):
+            raise ValueError("Laços (self-loops) não são permitidos.")
+        low, high = int(layers.min()), int(layers.max())
+        if low < 0 or high >= num_layers:
+            raise ValueError(f"Camada {low if low < 0 else high} inválida. Deve estar entre 0 e {num_layers - 1}.")
+        return table.aggregate(n, num_layers)
+
+    def merge(self, other: "MultiLayerGraph", mapping: list[int]) -> None:
+        """
+        Soma as contagens de `other` a este grafo. `mapping[v]` é o índice, neste grafo, do
+        vértice v de `other` (ex.: o mesmo login em repositórios diferentes).
+        """
+        if len(mapping) != other.num_vertices:
+            raise ValueError(f"Mapeamento com {len(mapping)} vértices; esperado {other.num_vertices}.")
+        for v in set(mapping):
+            self._validate_index(v)
+        if len(set(mapping)) != len(mapping):
+            raise ValueError("O mapeamento deve associar vértices distintos a índices distintos.")
+
+        adj, totals = self.adj, self.layer_totals
+        for u, edges in enumerate(other.adj):
+            row = adj[mapping[u]]
+            for v, other_counts in edges.items():
+                counts = row.get(mapping[v])
+                if counts is None:
+                    row[mapping[v]] = list(other_counts)
+                    self.num_edges += 1
+                else:
+                    for layer, count in enumerate(other_counts):
+                        counts[layer] += count
+        for layer, count in enumerate(other.layer_totals):
+            totals[layer] += count
+
+    def getCount(self, u: int, v: int, layer: int) -> int:
+        self._validate_index(u)
+        self._validate_index(v)
+        counts = self.adj[u].get(v)
+        return counts[layer] if counts is not None else 0
+
+    def getLayerTotal(self, layer: int) -> int:
+        """Total de interações registradas na camada, somando todas as arestas."""
+        return self.layer_totals[layer]
+
+    def edgeColumns(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Arestas em formato colunar: `(u, v, counts)`, com `counts[i, camada]`, na ordem de `adj`."""
+        adj, num_layers = self.adj, len(LAYER_NAMES)
+        degrees = np.fromiter(map(len, adj), dtype=np.int64, count=self.num_vertices)
+        us = np.repeat(np.arange(self.num_vertices, dtype=np.int64), degrees)
+        vs = np.fromiter(chain.from_iterable(adj), dtype=np.int64, count=self.num_edges)
+        counts = np.fromiter(chain.from_iterable(chain.from_iterable(row.values() for row in adj)),
+                             dtype=np.int64, count=self.num_edges * num_layers)
+        return us, vs, counts.reshape(self.num_edges, num_layers)
+
+    def toGraph(self, weights: dict[int, float], graph_cls: Type[AbstractGraph] = AdjacencyListGraph) -> AbstractGraph:
+        """
+        Deriva um grafo ponderado considerando apenas as camadas em `weights`.
+
+        Uma aresta u -> v existe se houver ao menos uma interação nas camadas escolhidas, e
+        seu peso é a soma de contagem * peso da camada. Com pesos 0 obtém-se o grafo
+        "não ponderado" daquelas camadas.
+        """
+        us, vs, counts = self.edgeColumns()
+        selected = counts[:, list(weights)]
+        keep = selected.any(axis=1)
+        edge_weights = selected[keep] @ np.array(list(weights.values()), dtype=np.float64)
+        edges = list(zip(us[keep].tolist(), vs[keep].tolist(), edge_weights.tolist()))
+
+        graph = graph_cls(self.num_vertices)
+        graph.accumulateEdges(edges)
+        return graph
@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import struct
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from interaction_table import InteractionTable
+from user_mapper import UserMapper
+
+"""
+Cache em disco dos dados de interação já decodificados.
+
+Depois do parse dos JSONs, tudo o que o pipeline precisa é a tabela de usuários (com os
+IDs do GitHub e os apelidos de logins renomeados), o autor de cada issue e a lista de interações (origem, destino, camada e data). Esses dados são
+gravados em formato binário colunar (um `array` por coluna) e ficam associados à impressão
+digital (tamanho, mtime e hash) de cada arquivo de origem; enquanto os arquivos não
+mudarem, as execuções seguintes carregam o cache sem tocar nos JSONs.
+"""
+
+MAGIC = b"TPGC"
+VERSION = 3
+_HEADER = struct.Struct("<4sIQ")
+
+
+@dataclass
+class ParsedData:
+    users: UserMapper = field(default_factory=UserMapper)
+    issue_numbers: array = field(default_factory=lambda: array('q'))
+    issue_author_ids: array = field(default_factory=lambda: array('i'))
+    sources: array = field(default_factory=lambda: array('i'))
+    targets: array = field(default_factory=lambda: array('i'))
+    layers: array = field(default_factory=lambda: array('b'))
+    times: array = field(default_factory=lambda: array('q'))
+
+    @property
+    def logins(self) -> list[str]:
+        return self.users.id_to_user
+
+    def issue_authors(self) -> dict[int, int]:
+        return dict(zip(self.issue_numbers, self.issue_author_ids))
+
+    def interactions(self) -> list[tuple[int, int, int]]:
+        return list(zip(self.sources, self.targets, self.layers))
+
+    def table(self) -> InteractionTable:
+        """As colunas de interação como tabela NumPy, sem cópia."""
+        return InteractionTable(np.frombuffer(self.sources, dtype=np.int32),
+                                np.frombuffer(self.targets, dtype=np.int32),
+                                np.frombuffer(self.layers, dtype=np.int8),
+                                np.frombuffer(self.times, dtype=np.int64))
+
+    def _columns(self) -> tuple[array, ...]:
+        return self.issue_numbers, self.issue_author_ids, self.sources, self.targets, self.layers, self.times
+
+
+def file_hash(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()
+
+
+def fingerprint(path: str) -> dict:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": file_hash(path)}
+
+
+def fingerprints(source_files: list[str]) -> dict[str, dict]:
+    """
+    Impressões digitais dos arquivos de origem. Devem ser tiradas antes de ler os arquivos,
+    para que uma alteração durante o parse invalide o cache em vez de ser associada a ele.
+    """
+    return {name: fingerprint(name) for name in source_files}
+
+
+def is_fresh(path: str, cached: dict) -> bool:
+    """Indica se o arquivo ainda corresponde à impressão digital `cached` (ver `fingerprint`)."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+
+    if stat.st_size != cached["size"]:
+        return False
+    if stat.st_mtime_ns == cached["mtime_ns"]:
+        return True
+    # Mesmo tamanho mas mtime diferente (ex.: arquivo baixado de novo): decide pelo conteúdo
+    return file_hash(path) == cached["hash"]
+
+
+def save(cache_path: str, source_fingerprints: dict[str, dict], data: ParsedData) -> None:
+    """
+    Grava o cache de forma atômica (arquivo temporário + rename), associado às impressões
+    digitais tiradas antes do parse (ver `fingerprints`).
+    """
+    meta = {
+        "fingerprints": source_fingerprints,
+        "lengths": [len(column) for column in data._columns()],
+    }
+    meta_bytes = json.dumps(meta).encode('utf-8')
+
+    path = Path(cache_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(meta_bytes)))
+        f.write(meta_bytes)
+        for column in data._columns():
+            column.tofile(f)
+        data.users.write(f)
+    os.replace(tmp, path)
+
+
+def load(cache_path: str, source_files: list[str]) -> ParsedData | None:
+    """
+    Carrega o cache se ele existir, for da versão atual e todos os arquivos de origem
+    ainda corresponderem às impressões digitais gravadas. Caso contrário, retorna None.
+    """
+    try:
+        f = open(cache_path, 'rb')
+    except FileNotFoundError:
+        return None
+
+    with f:
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            return None
+        magic, version, meta_len = _HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            return None
+
+        meta = json.loads(f.read(meta_len).decode('utf-8'))
+        fingerprints = meta["fingerprints"]
+        if sorted(fingerprints) != sorted(source_files):
+            return None
+        if not all(is_fresh(name, fingerprints[name]) for name in source_files):
+            return None
+
+        data = ParsedData()
+        try:
+            for column, length in zip(data._columns(), meta["lengths"]):
+                column.fromfile(f, length)
+        except EOFError:
+            return None
+        data.users = UserMapper.read(f)
+        if data.users is None:
+            return None
+
+    return data
@@ -0,0 +1,111 @@
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator
+
+"""
+Instrumentação das etapas do pipeline.
+
+Cada etapa (`with profiler.stage("nome"):`) registra tempo de parede, tempo de CPU, número
+de registros processados, registros por segundo e o pico de memória alocada (tracemalloc),
+e opcionalmente grava um dump do cProfile por etapa. Desativado, `stage` não mede nada e o
+custo é desprezível. As etapas não devem ser aninhadas: o pico do tracemalloc e o cProfile
+são globais ao processo.
+"""
+
+# Variável de ambiente que ativa o perfil sem a opção --profile ("1" ou "cprofile")
+ENV_VAR = "GRAPH_PROFILE"
+
+
+@dataclass
+class StageStats:
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    records: int | None = None
+    records_per_sec: float | None = None
+    peak_memory_mb: float | None = None
+
+
+class Stage:
+    """Etapa em andamento; o código medido informa quantos registros processou em `records`."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.records: int | None = None
+
+
+class Profiler:
+    def __init__(self, enabled: bool = False, cprofile_dir: str | None = None):
+        self.enabled = enabled
+        self.cprofile_dir = cprofile_dir
+        self.stages: list[StageStats] = []
+
+    @classmethod
+    def from_env(cls, enabled: bool = False, cprofile: bool = False, cprofile_dir: str | None = None) -> "Profiler":
+        """Combina as opções de linha de comando com a variável de ambiente `GRAPH_PROFILE`."""
+        value = os.environ.get(ENV_VAR, "").strip().lower()
+        enabled = enabled or value not in ("", "0", "false")
+        cprofile = cprofile or value == "cprofile"
+        return cls(enabled, cprofile_dir if enabled and cprofile else None)
+
+    @contextmanager
+    def stage(self, name: str, records: int | None = None) -> Iterator[Stage]:
+        current = Stage(name)
+        current.records = records
+        if not self.enabled:
+            yield current
+            return
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        profile = cProfile.Profile() if self.cprofile_dir else None
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profile: profile.enable()
+        try:
+            yield current
+        finally:
+            if profile: profile.disable()
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+
+            stats = StageStats(name, wall, cpu, current.records, peak_memory_mb=peak / 2 ** 20)
+            if current.records is not None and wall > 0:
+                stats.records_per_sec = current.records / wall
+            self.stages.append(stats)
+
+            if profile:
+                Path(self.cprofile_dir).mkdir(parents=True, exist_ok=True)
+                profile.dump_stats(os.path.join(self.cprofile_dir, f"{_file_name(name)}.prof"))
+
+    def report(self) -> dict:
+        return {
+            "total_wall_seconds": sum(s.wall_seconds for s in self.stages),
+            "total_cpu_seconds": sum(s.cpu_seconds for s in self.stages),
+            "stages": [asdict(s) for s in self.stages],
+        }
+
+    def save(self, path: str) -> None:
+        file = Path(path)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        with open(file, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+            f.write("\n")
+
+
+# Instância desativada, usada como padrão por funções que aceitam um profiler opcional
+NULL_PROFILER = Profiler()
+
+
+def _file_name(stage: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in stage)
@@ -0,0 +1,118 @@
+import dataclasses
+import types
+import typing
+from typing import Any, Callable, Type, TypeVar
+
+from data_format import Issue, IssueComment, IssuePullRequest, PullComment, User
+
+"""
+Decodificação rápida dos registros do GitHub.
+
+`dacite.from_dict` valida recursivamente todos os campos de todos os registros, mas o
+pipeline só lê alguns deles. Aqui são geradas, para cada classe de `data_format`, uma
+classe enxuta com `__slots__` contendo apenas os campos usados pelos construtores de
+grafos, e uma função de decodificação especializada (sem introspecção em tempo de
+execução). A validação completa continua disponível via dacite em `main`.
+"""
+
+T = TypeVar('T')
+
+# Campos mantidos de cada tipo; os demais são descartados na decodificação
+SLIM_FIELDS: dict[type, tuple[str, ...]] = {
+    User: ("login", "id"),
+    IssuePullRequest: ("merged_at",),
+    Issue: ("user", "number", "closed_at", "pull_request", "closed_by"),
+    IssueComment: ("id", "user", "issue_url", "created_at"),
+    PullComment: ("id", "user", "pull_request_url", "created_at", "submitted_at"),
+}
+
+_slim_classes: dict[type, type] = {}
+_decoders: dict[type, Callable[[dict], Any]] = {}
+
+
+def _unwrap_optional(hint) -> tuple[Any, bool]:
+    # Optional[X] -> (X, True); X -> (X, False)
+    if typing.get_origin(hint) in (typing.Union, types.UnionType):
+        args = [a for a in typing.get_args(hint) if a is not type(None)]
+        if len(args) == 1 and len(typing.get_args(hint)) == 2:
+            return args[0], True
+    return hint, False
+
+
+def slim_class(cls: Type[T]) -> type:
+    """Retorna (gerando na primeira chamada) a classe enxuta correspondente a `cls`."""
+    if cls in _slim_classes:
+        return _slim_classes[cls]
+
+    fields = SLIM_FIELDS[cls]
+    declared = {f.name for f in dataclasses.fields(cls)}
+    unknown = [f for f in fields if f not in declared]
+    if unknown:
+        raise ValueError(f"Campos {unknown} não existem em {cls.__name__}")
+
+    args = ", ".join(fields)
+    body = "".join(f"    self.{f} = {f}\n" for f in fields) or "    pass\n"
+    namespace: dict[str, Any] = {}
+    exec(f"def __init__(self, {args}):\n{body}", namespace)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{f}={getattr(self, f)!r}" for f in fields)
+        return f"{cls.__name__}({values})"
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in fields)
+
+    slim = type(f"Slim{cls.__name__}", (), {
+        "__slots__": fields,
+        "__init__": namespace["__init__"],
+        "__repr__": __repr__,
+        "__eq__": __eq__,
+        "__hash__": None,
+        "__module__": __name__,
+    })
+    # Exposto no módulo para que os registros possam ser serializados com pickle
+    globals()[slim.__name__] = slim
+    _slim_classes[cls] = slim
+    return slim
+
+
+def record_decoder(cls: Type[T]) -> Callable[[dict], T]:
+    """
+    Retorna uma função `dict -> registro` especializada para `cls`.
+
+    Campos obrigatórios ausentes geram KeyError; campos opcionais ausentes viram None.
+    Campos cujo tipo também está em SLIM_FIELDS são decodificados recursivamente.
+    """
+    if cls in _decoders:
+        return _decoders[cls]
+
+    slim = slim_class(cls)
+    hints = typing.get_type_hints(cls)
+    namespace: dict[str, Any] = {"_cls": slim}
+
+    exprs = []
+    for field in SLIM_FIELDS[cls]:
+        inner, optional = _unwrap_optional(hints[field])
+        if inner in SLIM_FIELDS:
+            namespace[f"_dec_{field}"] = record_decoder(inner)
+            if optional:
+                exprs.append(f"None if (v := d.get({field!r})) is None else _dec_{field}(v)")
+            else:
+                exprs.append(f"_dec_{field}(d[{field!r}])")
+        elif optional:
+            exprs.append(f"d.get({field!r})")
+        else:
+            exprs.append(f"d[{field!r}]")
+
+    source = "def decode(d):\n    return _cls(" + ", ".join(exprs) + ")\n"
+    exec(source, namespace)
+
+    decoder = namespace["decode"]
+    _decoders[cls] = decoder
+    return decoder
+
+
+for _cls in SLIM_FIELDS:
+    record_decoder(_cls)
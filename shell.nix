@@ -6,6 +6,7 @@ in pkgs.mkShell {
     pkgs.python311
     (pkgs.python3.withPackages (python-pkgs: [
       python-pkgs.dacite
+      python-pkgs.numpy
     ]))
   ];
   shellHook = ''
@@ -0,0 +1,221 @@
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappop, heappush
+from typing import Callable, Iterable
+
+from csr_graph import CSRGraph
+from graph_lib import AbstractGraph
+
+"""
+Caminhos mínimos ponderados e centralidade de intermediação (betweenness).
+
+Os pesos das arestas representam intensidade de colaboração, então são convertidos em
+distâncias por uma função (por padrão o inverso do peso: colaboração mais forte, caminho
+mais curto). O grafo é convertido uma única vez para listas em formato CSR, sobre as quais
+rodam Dijkstra com heap binário e o algoritmo de Brandes, este último distribuindo os
+vértices de origem entre processos.
+"""
+
+INF = math.inf
+
+
+def inverse_weight(w: float) -> float:
+    """Distância = 1 / peso. Arestas com peso <= 0 são ignoradas."""
+    return 1.0 / w if w > 0 else INF
+
+
+def unit_distance(w: float) -> float:
+    """Toda aresta tem distância 1 (caminhos mínimos em número de saltos)."""
+    return 1.0
+
+
+def _prepare(graph: AbstractGraph, distance: Callable[[float], float]) -> tuple[list[int], list[int], list[float]]:
+    # Listas CSR (offsets, targets, comprimentos), descartando arestas de distância infinita
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.fromGraph(graph)
+    offsets, targets, lengths = [0], [], []
+
+    for u in range(csr.num_vertices):
+        for i in range(csr.offsets[u], csr.offsets[u + 1]):
+            length = distance(csr.weights[i])
+            if length < 0:
+                raise ValueError("Distâncias negativas não são suportadas por Dijkstra.")
+            if length != INF:
+                targets.append(csr.targets[i])
+                lengths.append(length)
+        offsets.append(len(targets))
+
+    return offsets, targets, lengths
+
+
+def _dijkstra(offsets: list[int], targets: list[int], lengths: list[float],
+              sources: Iterable[int]) -> tuple[list[float], list[int], list[int]]:
+    n = len(offsets) - 1
+    dist = [INF] * n
+    parent = [-1] * n
+    origin = [-1] * n
+    heap: list[tuple[float, int]] = []
+
+    for s in sources:
+        dist[s] = 0.0
+        origin[s] = s
+        heappush(heap, (0.0, s))
+
+    while heap:
+        d, u = heappop(heap)
+        if d > dist[u]:
+            continue
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            new = d + lengths[i]
+            if new < dist[v]:
+                dist[v] = new
+                parent[v] = u
+                origin[v] = origin[u]
+                heappush(heap, (new, v))
+
+    return dist, parent, origin
+
+
+def dijkstra(graph: AbstractGraph, source: int,
+             distance: Callable[[float], float] = inverse_weight) -> tuple[list[float], list[int]]:
+    """
+    Distâncias mínimas a partir de `source`. Retorna `(dist, parent)`: `dist[v]` é infinito
+    para vértices inalcançáveis e `parent[v]` é o antecessor de v no caminho mínimo (-1 na raiz).
+    """
+    if source < 0 or source >= graph.getVertexCount():
+        raise ValueError(f"Vértice {source} inválido. Deve estar entre 0 e {graph.getVertexCount() - 1}.")
+    dist, parent, _ = _dijkstra(*_prepare(graph, distance), [source])
+    return dist, parent
+
+
+def multi_source_dijkstra(graph: AbstractGraph, sources: Iterable[int],
+                          distance: Callable[[float], float] = inverse_weight) -> tuple[list[float], list[int]]:
+    """
+    Distância de cada vértice à origem mais próxima dentre `sources`. Retorna `(dist, origin)`,
+    onde `origin[v]` é a origem que alcança v (-1 se nenhuma alcançar).
+    """
+    n = graph.getVertexCount()
+    sources = list(sources)
+    for s in sources:
+        if s < 0 or s >= n:
+            raise ValueError(f"Vértice {s} inválido. Deve estar entre 0 e {n - 1}.")
+    dist, _, origin = _dijkstra(*_prepare(graph, distance), sources)
+    return dist, origin
+
+
+def shortest_path(graph: AbstractGraph, source: int, target: int,
+                  distance: Callable[[float], float] = inverse_weight) -> list[int]:
+    """Vértices do caminho mínimo de `source` até `target` (lista vazia se inalcançável)."""
+    if target < 0 or target >= graph.getVertexCount():
+        raise ValueError(f"Vértice {target} inválido. Deve estar entre 0 e {graph.getVertexCount() - 1}.")
+    dist, parent = dijkstra(graph, source, distance)
+    if dist[target] == INF:
+        return []
+
+    path = [target]
+    while path[-1] != source:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+
+def _brandes(offsets: list[int], targets: list[int], lengths: list[float], sources: Iterable[int]) -> list[float]:
+    # Acumula a dependência de cada origem (Brandes, 2001) para caminhos ponderados
+    n = len(offsets) - 1
+    centrality = [0.0] * n
+
+    for s in sources:
+        order: list[int] = []
+        preds: list[list[int]] = [[] for _ in range(n)]
+        sigma = [0] * n
+        sigma[s] = 1
+        dist = [INF] * n
+        dist[s] = 0.0
+        done = bytearray(n)
+        heap = [(0.0, s)]
+
+        while heap:
+            d, u = heappop(heap)
+            if done[u]:
+                continue
+            done[u] = 1
+            order.append(u)
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                if done[v]:
+                    continue
+                new = d + lengths[i]
+                if new < dist[v]:
+                    dist[v] = new
+                    sigma[v] = sigma[u]
+                    preds[v] = [u]
+                    heappush(heap, (new, v))
+                elif new == dist[v]:
+                    sigma[v] += sigma[u]
+                    preds[v].append(u)
+
+        delta = [0.0] * n
+        for w in reversed(order):
+            coefficient = (1.0 + delta[w]) / sigma[w]
+            for v in preds[w]:
+                delta[v] += sigma[v] * coefficient
+            if w != s:
+                centrality[w] += delta[w]
+
+    return centrality
+
+
+_worker_graph: tuple[list[int], list[int], list[float]] | None = None
+
+
+def _init_worker(offsets: list[int], targets: list[int], lengths: list[float]) -> None:
+    # O grafo é enviado uma única vez para cada processo, e não a cada lote de origens
+    global _worker_graph
+    _worker_graph = (offsets, targets, lengths)
+
+
+def _brandes_worker(sources: list[int]) -> list[float]:
+    return _brandes(*_worker_graph, sources)
+
+
+def betweenness_centrality(graph: AbstractGraph, k: int | None = None, normalized: bool = True,
+                           distance: Callable[[float], float] = inverse_weight,
+                           processes: int | None = None, seed: int | None = None) -> list[float]:
+    """
+    Centralidade de intermediação ponderada (Brandes), para grafos direcionados.
+
+    Com `k`, usa apenas k origens sorteadas e extrapola o resultado (aproximação). As origens
+    são divididas entre `processes` processos (padrão: número de CPUs); com `processes=1`
+    o cálculo é feito no processo atual.
+    """
+    n = graph.getVertexCount()
+    offsets, targets, lengths = _prepare(graph, distance)
+
+    sources = list(range(n))
+    if k is not None and k < n:
+        sources = random.Random(seed).sample(sources, k)
+
+    processes = processes or os.cpu_count() or 1
+    processes = min(processes, len(sources))
+    if processes <= 1:
+        centrality = _brandes(offsets, targets, lengths, sources)
+    else:
+        # Lotes menores que a divisão exata equilibram a carga entre os processos
+        chunk = max(1, len(sources) // (processes * 4))
+        batches = [sources[i:i + chunk] for i in range(0, len(sources), chunk)]
+        centrality = [0.0] * n
+        with ProcessPoolExecutor(processes, initializer=_init_worker,
+                                 initargs=(offsets, targets, lengths)) as pool:
+            for partial in pool.map(_brandes_worker, batches):
+                for v, value in enumerate(partial):
+                    centrality[v] += value
+
+    scale = 1.0
+    if sources and len(sources) < n:
+        scale = n / len(sources)
+    if normalized and n > 2:
+        scale /= (n - 1) * (n - 2)
+
+    return [value * scale for value in centrality]
@@ -0,0 +1,146 @@
+import gc
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Type
+
+import numpy as np
+
+from graph_lib import AbstractGraph
+from interaction_table import NO_TIME, InteractionTable
+from list_graph import AdjacencyListGraph
+from multilayer_graph import MultiLayerGraph
+
+"""
+Evolução temporal das interações.
+
+`TemporalEdgeStore` guarda as interações ordenadas pela data (interações sem data são
+descartadas) e responde por janelas [início, fim) com duas buscas binárias. Um
+`SlidingWindow` mantém o grafo multicamada de uma janela e avança de forma incremental:
+a cada passo apenas as interações que entram são acrescentadas e as que saem são
+expiradas (`MultiLayerGraph.expireTable`), sem reconstruir a janela inteira.
+
+Os instantes são segundos desde a época (UTC), como em `interaction_table.parse_times`.
+"""
+
+DAY = 86400
+
+
+# A pausa do coletor vale para o processo todo: um contador de profundidade (protegido por
+# lock) faz com que passos aninhados ou de outras threads não o religuem antes da hora, e só
+# o último a sair o religa, e apenas se ele estava ligado quando o primeiro entrou
+_gc_lock = threading.Lock()
+_gc_depth = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def _paused_gc() -> Iterator[None]:
+    # Cada passo cria milhares de listas de contagens (sem ciclos); sem pausar o coletor,
+    # as coletas geracionais percorrem repetidamente todo o grafo da janela
+    global _gc_depth, _gc_was_enabled
+    with _gc_lock:
+        if _gc_depth == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_depth += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_depth -= 1
+            if _gc_depth == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+class TemporalEdgeStore:
+    def __init__(self, num_vertices: int, table: InteractionTable):
+        self.num_vertices = num_vertices
+        known = np.flatnonzero(table.times != NO_TIME)
+        order = known[np.argsort(table.times[known], kind='stable')]
+        self.table = table.select(order)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def span(self) -> tuple[int, int] | None:
+        """Primeiro e último instante registrados, ou None se não houver interações datadas."""
+        if len(self) == 0:
+            return None
+        return int(self.table.times[0]), int(self.table.times[-1])
+
+    def position(self, instant: int) -> int:
+        """Índice da primeira interação com data >= `instant`."""
+        return int(np.searchsorted(self.table.times, instant, side='left'))
+
+    def interactions(self, start: int, end: int) -> InteractionTable:
+        """Interações ocorridas em [start, end)."""
+        return self.table.select(slice(self.position(start), self.position(end)))
+
+    def snapshot(self, start: int, end: int) -> MultiLayerGraph:
+        """Grafo multicamada das interações ocorridas em [start, end)."""
+        layers = MultiLayerGraph(self.num_vertices)
+        layers.accumulateTable(self.interactions(start, end))
+        return layers
+
+    def weighted_snapshot(self, start: int, end: int, weights: dict[int, float],
+                          graph_cls: Type[AbstractGraph] = AdjacencyListGraph) -> AbstractGraph:
+        """Grafo ponderado (ver `MultiLayerGraph.toGraph`) da janela [start, end)."""
+        return self.snapshot(start, end).toGraph(weights, graph_cls)
+
+    def window(self, start: int, size: int) -> "SlidingWindow":
+        return SlidingWindow(self, start, size)
+
+    def windows(self, size: int, step: int | None = None,
+                start: int | None = None, end: int | None = None) -> Iterator["SlidingWindow"]:
+        """
+        Percorre janelas de `size` segundos avançando `step` (padrão: `size`) a partir de
+        `start` (padrão: o dia da primeira interação) até cobrir `end` (padrão: a última).
+        A mesma janela é reaproveitada e avançada a cada iteração.
+        """
+        span = self.span()
+        if span is None:
+            return
+        if size <= 0 or (step is not None and step <= 0):
+            raise ValueError("O tamanho e o passo da janela devem ser positivos.")
+        step = step or size
+        start = span[0] - span[0] % DAY if start is None else start
+        end = span[1] + 1 if end is None else end
+
+        current = self.window(start, size)
+        while current.start < end:
+            yield current
+            current.advance(step)
+
+
+class SlidingWindow:
+    """Janela [start, end) sobre um `TemporalEdgeStore`, com o grafo multicamada correspondente."""
+
+    def __init__(self, store: TemporalEdgeStore, start: int, size: int):
+        self.store = store
+        self.start, self.end = start, start + size
+        self.low, self.high = store.position(self.start), store.position(self.end)
+        self.layers = MultiLayerGraph(store.num_vertices)
+        self.layers.accumulateTable(store.table.select(slice(self.low, self.high)))
+
+    def __len__(self) -> int:
+        """Número de interações dentro da janela."""
+        return self.high - self.low
+
+    def advance(self, step: int) -> None:
+        """Avança a janela `step` segundos, expirando as interações antigas e acrescentando as novas."""
+        if step <= 0:
+            raise ValueError("O tamanho e o passo da janela devem ser positivos.")
+        store = self.store
+        self.start += step
+        self.end += step
+        low, high = store.position(self.start), store.position(self.end)
+
+        # Primeiro expira (só o que estava na janela), depois acrescenta (só o que ainda não estava)
+        with _paused_gc():
+            self.layers.expireTable(store.table.select(slice(self.low, min(low, self.high))))
+            self.layers.accumulateTable(store.table.select(slice(max(self.high, low), high)))
+        self.low, self.high = low, high
+
+    def graph(self, weights: dict[int, float], graph_cls: Type[AbstractGraph] = AdjacencyListGraph) -> AbstractGraph:
+        """Grafo ponderado da janela atual."""
+        return self.layers.toGraph(weights, graph_cls)
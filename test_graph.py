@@ -1,4 +1,26 @@
+import asyncio
+import gzip
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmark import run_benchmarks, synthetic_interactions
+from components import largest_component, strong_components, weak_components
+from csr_graph import CSRGraph
+from exporters import export_graph
+from gdf_reader import load_gdf
+from graph_lib import AbstractGraph
+from graph_client import GraphClient
+import graph_server
+from graph_server import GraphServer
+from graph_view import SubgraphView, induced_subgraph, largest_component_view, weight_at_least
+from link_analysis import hits, pagerank, top_k, weighted_degree
 from list_graph import AdjacencyListGraph
+from mapped_graph import MappedGraph, write_mapped
+from matrix_graph import AdjacencyMatrixGraph
+from shortest_paths import betweenness_centrality, dijkstra, multi_source_dijkstra, shortest_path, unit_distance
+from user_mapper import UserMapper
 
 def teste_rapido():
     print("--- Iniciando Teste da Lista de Adjacência ---")
@@ -24,5 +46,458 @@ def teste_rapido():
     
     print("--- Teste Concluído ---")
 
+def teste_csr_equivale_lista():
+    g = AdjacencyListGraph(5)
+    for u, v, w in [(0, 1, 2.0), (0, 3, 1.5), (2, 1, 4.0), (3, 4, 1.0), (4, 0, 5.0)]:
+        g.addEdge(u, v)
+        g.setEdgeWeight(u, v, w)
+
+    csr = CSRGraph.fromListGraph(g)
+    assert csr.getEdgeCount() == g.getEdgeCount()
+    for u in range(5):
+        assert csr.getVertexOutDegree(u) == g.getVertexOutDegree(u)
+        assert csr.getVertexInDegree(u) == g.getVertexInDegree(u)
+        for v in range(5):
+            assert csr.hasEdge(u, v) == g.hasEdge(u, v)
+            assert csr.getEdgeWeight(u, v) == g.getEdgeWeight(u, v)
+    assert csr.isConnected() == g.isConnected()
+
+    csr.addEdge(1, 2)
+    csr.removeEdge(0, 3)
+    assert csr.hasEdge(1, 2) and not csr.hasEdge(0, 3)
+    assert csr.getVertexInDegree(3) == 0
+
+    dup = CSRGraph.fromEdges(3, [(0, 1, 1.0), (1, 2, 2.0), (0, 1, 3.0)])
+    assert dup.getEdgeCount() == 2
+    assert dup.getEdgeWeight(0, 1) == 4.0
+
+
+def teste_indice_reverso_lista():
+    g = AdjacencyListGraph(4)
+    g.addEdge(0, 2)
+    g.addEdge(1, 2)
+    g.addEdge(3, 2)
+    assert g.getVertexInDegree(2) == 3
+    assert g.pred[2] == {0, 1, 3}
+    assert g.isConnected()
+
+    g.removeEdge(3, 2)
+    assert g.getVertexInDegree(2) == 2
+    assert g.getVertexOutDegree(3) == 0
+    assert not g.isConnected()
+
+
+def teste_iteradores_de_vizinhos():
+    lote = [(0, 2, 1.0), (0, 1, 2.0), (1, 2, 3.0), (3, 0, 4.0), (2, 0, 5.0)]
+    grafos = []
+    for cls in (AdjacencyListGraph, AdjacencyMatrixGraph, CSRGraph):
+        g = cls(4)
+        g.accumulateEdges(lote)
+        grafos.append(g)
+
+    for g in grafos:
+        assert sorted(g.iterSuccessors(0)) == [(1, 2.0), (2, 1.0)]
+        assert sorted(g.iterPredecessors(0)) == [(2, 5.0), (3, 4.0)]
+        assert list(g.iterSuccessors(3)) == [(0, 4.0)]
+        assert list(g.iterPredecessors(3)) == []
+        assert sorted(g.iterEdges()) == sorted(lote)
+
+    # A lista preserva a ordem de inserção, e a implementação genérica equivale às otimizadas
+    assert list(grafos[0].iterEdges()) == [(0, 2, 1.0), (0, 1, 2.0), (1, 2, 3.0), (2, 0, 5.0), (3, 0, 4.0)]
+    generico = grafos[1]
+    for v in range(4):
+        assert list(AbstractGraph.iterSuccessors(generico, v)) == list(generico.iterSuccessors(v))
+        assert list(AbstractGraph.iterPredecessors(generico, v)) == list(generico.iterPredecessors(v))
+
+    try:
+        grafos[0].iterSuccessors(4)
+        assert False
+    except ValueError:
+        pass
+
+
+def teste_acumula_arestas():
+    lote = [(0, 1, 2.0), (1, 2, 4.0), (0, 1, 5.0), (2, 0, 2.0)]
+    for cls in (AdjacencyListGraph, AdjacencyMatrixGraph, CSRGraph):
+        g = cls(3)
+        g.accumulateEdges(lote)
+        g.accumulateEdges([(1, 2, 1.0)])
+        assert g.getEdgeCount() == 3
+        assert g.getEdgeWeight(0, 1) == 7.0
+        assert g.getEdgeWeight(1, 2) == 5.0
+        assert g.getVertexInDegree(0) == 1
+
+        try:
+            g.accumulateEdges([(0, 2, 1.0), (1, 1, 1.0)])
+            assert False, "laço deveria ser rejeitado"
+        except ValueError:
+            pass
+        assert not g.hasEdge(0, 2)
+
+
+def teste_csr_lotes_e_indice_reverso():
+    import random
+    sorteio = random.Random(3)
+    lista, csr = AdjacencyListGraph(30), CSRGraph(30)
+    for _ in range(6):
+        lote = [(u, v, float(sorteio.randint(0, 3))) for u, v in
+                ((sorteio.randrange(30), sorteio.randrange(30)) for _ in range(80)) if u != v]
+        lista.accumulateEdges(lote)
+        csr.accumulateEdges(lote)
+        assert csr.getEdgeCount() == lista.getEdgeCount()
+        assert sorted(csr.iterEdges()) == sorted(lista.iterEdges())
+        for v in range(30):
+            assert list(csr.iterPredecessors(v)) == sorted(lista.iterPredecessors(v))
+            assert csr.getVertexInDegree(v) == lista.getVertexInDegree(v)
+        assert list(csr.targets) == [v for u in range(30) for v in sorted(lista.adj[u])]
+
+    # O índice reverso acompanha pesos e é refeito após mudanças estruturais
+    u, v = next((u, v) for u in range(30) for v in range(30) if u != v and not csr.hasEdge(u, v))
+    csr.addEdge(u, v)
+    assert (u, 1.0) in csr.iterPredecessors(v)
+    csr.setEdgeWeight(u, v, 9.0)
+    assert (u, 9.0) in csr.iterPredecessors(v)
+    csr.removeEdge(u, v)
+    assert u not in dict(csr.iterPredecessors(v))
+    csr.accumulateEdges([(u, v, 2.0)])
+    assert (u, 2.0) in csr.iterPredecessors(v)
+
+
+class NomesFixos:
+    def get_name(self, i: int) -> str:
+        return ["ana", "bia", "caio"][i]
+
+
+def teste_exporta_formatos(tmp_path):
+    lote = [(0, 1, 2.0), (1, 2, 4.0), (2, 0, 1.5)]
+    saidas = []
+    for cls in (AdjacencyListGraph, AdjacencyMatrixGraph, CSRGraph):
+        g = cls(3)
+        g.accumulateEdges(lote)
+        caminho = export_graph(g, NomesFixos(), str(tmp_path / f"{cls.__name__}.gdf"))
+        saidas.append(open(caminho, encoding="utf-8").read())
+
+    assert saidas[0] == saidas[1] == saidas[2]
+    assert "bia,caio,4.0,true\n" in saidas[0]
+
+    caminho = export_graph(g, NomesFixos(), str(tmp_path / "g.edges"), compress=True)
+    assert caminho.endswith(".edges.gz")
+    with gzip.open(caminho, "rt", encoding="utf-8") as f:
+        assert f.read().splitlines() == ["ana\tbia\t2.0", "bia\tcaio\t4.0", "caio\tana\t1.5"]
+
+
+def teste_le_gdf(tmp_path):
+    g = AdjacencyListGraph(3)
+    g.accumulateEdges([(0, 1, 2.0), (1, 2, 4.0), (2, 0, 1.5)])
+    caminho = export_graph(g, NomesFixos(), str(tmp_path / "g.gdf"), compress=True)
+
+    lido, mapper = load_gdf(caminho, AdjacencyMatrixGraph)
+    assert [mapper.get_name(i) for i in range(3)] == ["ana", "bia", "caio"]
+    assert lido.getEdgeCount() == 3
+    assert lido.getEdgeWeight(1, 2) == 4.0
+
+    svelte, mapper = load_gdf("sveltejs_svelte.gdf")
+    assert svelte.getVertexCount() == 6412
+    assert svelte.getEdgeCount() == 12656
+    assert svelte.getEdgeWeight(mapper.get_id("Rich-Harris"), mapper.get_id("zcei")) == 4.0
+
+
+def teste_matriz_compacta():
+    for tipo in ("d", "f"):
+        g = AdjacencyMatrixGraph(20, tipo)
+        for u in range(19):
+            g.addEdge(u, u + 1)
+        g.addEdge(19, 9)
+        g.accumulateEdges([(3, 17, 0.0), (3, 12, 2.5)])
+
+        assert g.getEdgeCount() == 22
+        assert g.hasEdge(3, 17) and g.getEdgeWeight(3, 17) == 0.0
+        assert g.getVertexOutDegree(3) == 3
+        assert g.getVertexInDegree(9) == 2
+        assert g.isConnected()
+
+        g.removeEdge(9, 10)
+        assert not g.hasEdge(9, 10) and g.getVertexInDegree(10) == 0
+        assert g.isConnected()
+        g.removeEdge(3, 12)
+        g.removeEdge(11, 12)
+        assert not g.isConnected()
+
+
+def teste_pagerank_hits():
+    lote = [(1, 0, 5.0), (2, 0, 1.0), (3, 0, 1.0), (3, 1, 1.0), (0, 4, 1.0)]
+    for cls in (AdjacencyListGraph, CSRGraph):
+        g = cls(5)
+        g.accumulateEdges(lote)
+
+        assert list(weighted_degree(g, "in")) == [7.0, 1.0, 0.0, 0.0, 1.0]
+        ranks = pagerank(g)
+        assert abs(ranks.sum() - 1.0) < 1e-9
+        assert {v for v, _ in top_k(ranks, 2)} == {0, 4}
+
+        # Referência sem NumPy: mesma iteração de potência, aresta por aresta
+        ref = [0.2] * 5
+        saida = [sum(w for u, _, w in lote if u == x) for x in range(5)]
+        for _ in range(100):
+            pendente = sum(ref[x] for x in range(5) if saida[x] == 0)
+            novo = [0.15 / 5 + 0.85 * pendente / 5] * 5
+            for u, v, w in lote:
+                novo[v] += 0.85 * ref[u] * w / saida[u]
+            ref = novo
+        assert max(abs(a - b) for a, b in zip(ranks, ref)) < 1e-6
+        assert max(abs(a - b) for a, b in zip(pagerank(g, tol=1e-12), ref)) < 1e-9
+
+        hubs, authorities = hits(g)
+        assert top_k(authorities, 1)[0][0] == 0
+        assert top_k(hubs, 1)[0][0] == 1
+
+    # Um atributo `offsets` qualquer não faz o grafo ser lido como CSR
+    g = AdjacencyListGraph(5)
+    g.accumulateEdges(lote)
+    g.offsets = [0] * 6
+    assert list(weighted_degree(g, "in")) == [7.0, 1.0, 0.0, 0.0, 1.0]
+
+
+def teste_ranking_sem_convergencia(caplog):
+    # Ciclo 0 -> 1 -> 2 -> 0 alimentado por 3: com damping alto o score oscila entre o ciclo
+    ciclo = AdjacencyListGraph(4)
+    ciclo.accumulateEdges([(0, 1, 1.0), (1, 2, 1.0), (2, 0, 1.0), (3, 0, 1.0)])
+    with caplog.at_level(logging.WARNING, logger="link_analysis"):
+        ranks = pagerank(ciclo, damping=0.99, max_iter=20)
+    assert "PageRank não convergiu em 20 iterações" in caplog.text
+    assert abs(ranks.sum() - 1.0) < 1e-9 and ranks[3] == ranks.min()
+
+    # Duas estrelas quase iguais: o hub dominante se separa devagar (razão ~1.0002 por iteração)
+    estrelas = AdjacencyListGraph(8)
+    estrelas.accumulateEdges([(0, v, 1.0) for v in (1, 2, 3)] + [(4, v, 1.0001) for v in (5, 6, 7)])
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="link_analysis"):
+        hubs, authorities = hits(estrelas)
+    assert "HITS não convergiu em 100 iterações" in caplog.text
+    assert abs(hubs.sum() - 1.0) < 1e-9 and abs(authorities.sum() - 1.0) < 1e-9
+    assert top_k(hubs, 1)[0][0] == 4
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="link_analysis"):
+        pagerank(ciclo)
+    assert caplog.text == ""
+
+
+def teste_componentes():
+    # 0 <-> 1 -> 2 <-> 3, 4 -> 5, 6 isolado
+    lote = [(0, 1, 1.0), (1, 0, 1.0), (1, 2, 1.0), (2, 3, 1.0), (3, 2, 1.0), (4, 5, 1.0)]
+    for cls in (AdjacencyListGraph, AdjacencyMatrixGraph, CSRGraph):
+        g = cls(7)
+        g.accumulateEdges(lote)
+
+        labels, sizes = weak_components(g)
+        assert sizes == [4, 2, 1]
+        assert labels == [0, 0, 0, 0, 1, 1, 2]
+        assert largest_component(labels, sizes) == [0, 1, 2, 3]
+
+        labels, sizes = strong_components(g)
+        assert sorted(sizes) == [1, 1, 1, 2, 2]
+        assert labels[0] == labels[1] != labels[2] == labels[3]
+        assert len({labels[4], labels[5], labels[6]}) == 3
+
+
+def teste_visoes_preguicosas():
+    lote = [(0, 1, 3.0), (1, 0, 1.0), (1, 2, 5.0), (2, 3, 2.0), (3, 1, 4.0), (4, 5, 6.0)]
+    for cls in (AdjacencyListGraph, AdjacencyMatrixGraph, CSRGraph):
+        g = cls(6)
+        g.accumulateEdges(lote)
+
+        fortes = weight_at_least(g, 3.0)
+        assert fortes.getVertexCount() == 6 and fortes.getEdgeCount() == 4
+        assert fortes.hasEdge(0, 1) and not fortes.hasEdge(1, 0)
+        assert fortes.getEdgeWeight(2, 3) == 0.0
+        assert fortes.getVertexInDegree(1) == 2 and fortes.getVertexOutDegree(2) == 0
+
+        # Visões empilhadas: mantenedores {0, 1, 2} sobre as arestas fortes
+        nucleo = SubgraphView(fortes, [0, 1, 2])
+        assert list(nucleo.iterEdges()) == [(0, 1, 3.0), (1, 2, 5.0)]
+        assert nucleo.isConnected() and not nucleo.isCompleteGraph()
+        assert not induced_subgraph(g, [0, 4]).isConnected()
+
+        copia = nucleo.materialize()
+        assert isinstance(copia, AdjacencyListGraph) and copia.getEdgeCount() == 2
+        copia.addEdge(2, 0)
+        assert not nucleo.hasEdge(2, 0)
+        try:
+            nucleo.addEdge(2, 0)
+            assert False, "visão deveria ser somente leitura"
+        except TypeError:
+            pass
+
+        maior = largest_component_view(g)
+        assert list(maior.vertices()) == [0, 1, 2, 3]
+        assert weak_components(maior.materialize(CSRGraph))[1] == [4, 1, 1]
+
+
+def teste_grafo_mapeado(tmp_path):
+    nomes = UserMapper()
+    for login in ("ana", "bia", "çédric", "davi", "eva"):
+        nomes.get_id(login)
+    g = AdjacencyListGraph(5)
+    g.accumulateEdges([(3, 1, 2.0), (0, 1, 4.0), (0, 3, 1.5), (1, 2, 5.0), (2, 0, 1.0), (3, 0, 6.0)])
+    g.setVertexWeight(2, 7.0)
+    write_mapped(str(tmp_path / "g.graph"), g, nomes)
+
+    with MappedGraph(str(tmp_path / "g.graph")) as m:
+        assert (m.getVertexCount(), m.getEdgeCount()) == (5, 6)
+        for u in range(5):
+            assert m.getVertexOutDegree(u) == g.getVertexOutDegree(u)
+            assert m.getVertexInDegree(u) == g.getVertexInDegree(u)
+            assert m.getVertexWeight(u) == g.getVertexWeight(u)
+            for v in range(5):
+                assert m.hasEdge(u, v) == g.hasEdge(u, v)
+                assert m.getEdgeWeight(u, v) == g.getEdgeWeight(u, v)
+        assert list(m.iterSuccessors(0)) == [(1, 4.0), (3, 1.5)]
+        assert sorted(m.iterPredecessors(0)) == [(2, 1.0), (3, 6.0)]
+        assert m.get_name(2) == "çédric" and m.find_vertex("davi") == 3 and m.find_vertex("zé") == -1
+        assert not m.isConnected() and m.getVertexInDegree(4) == 0
+
+        # Os caminhos rápidos de CSR valem para o grafo mapeado
+        assert weak_components(m) == weak_components(g)
+        assert pagerank(m).tolist() == pagerank(CSRGraph.fromGraph(g)).tolist()
+        export_graph(m, m, str(tmp_path / "m.gdf"))
+        recarregado, _ = load_gdf(str(tmp_path / "m.gdf"))
+        assert recarregado.getEdgeWeight(3, 0) == 6.0
+
+        try:
+            m.addEdge(4, 0)
+            assert False, "grafo mapeado deveria ser somente leitura"
+        except TypeError:
+            pass
+
+    (tmp_path / "ruim.graph").write_bytes(b"TPGC" + bytes(60))
+    try:
+        MappedGraph(str(tmp_path / "ruim.graph"))
+        assert False, "formato inválido deveria falhar"
+    except ValueError:
+        pass
+
+
+def teste_servidor_de_consultas(tmp_path, monkeypatch):
+    nomes = UserMapper()
+    for login in ("ana", "bia", "caio", "davi", "eva"):
+        nomes.get_id(login)
+    g = AdjacencyListGraph(5)
+    g.accumulateEdges([(3, 1, 2.0), (0, 1, 4.0), (0, 3, 1.5), (1, 2, 5.0), (2, 0, 1.0), (3, 0, 6.0)])
+    write_mapped(str(tmp_path / "pesos.graph"), g, nomes)
+
+    servidor = GraphServer.open([str(tmp_path / "pesos.graph")])
+    caminho = str(tmp_path / "g.sock")
+    loop = asyncio.new_event_loop()
+    listener = loop.run_until_complete(servidor.start(caminho))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        with GraphClient(caminho) as cliente:
+            assert cliente.graphs() == {"pesos": {"vertices": 5, "edges": 6}}
+            assert cliente.hasEdge("pesos", "ana", "bia") and not cliente.hasEdge("pesos", 1, 0)
+            assert cliente.degrees("pesos", "ana") == {"in": 2, "out": 2}
+            assert cliente.neighbors("pesos", "ana") == [("bia", 4.0), ("davi", 1.5)]
+            assert sorted(cliente.neighbors("pesos", "ana", "in")) == [("caio", 1.0), ("davi", 6.0)]
+            assert cliente.weight("pesos", "davi", "ana") == 6.0
+            assert cliente.top("pesos", 1, "in") == [("ana", 7.0)]
+            assert cliente.top("pesos", 2)[0][0] == nomes.get_name(int(pagerank(g).argmax()))
+            assert cliente.component("pesos", "eva") == {"size": 1, "members": ["eva"]}
+            assert cliente.component("pesos", 0, limit=2) == {"size": 4, "members": ["ana", "bia"]}
+            for erro in ({"op": "degrees", "graph": "pesos", "v": "zé"}, {"op": "degrees", "graph": "pesos", "v": 9},
+                         {"op": "voar", "graph": "pesos"}, {"op": "weight", "graph": "outro", "u": 0, "v": 1},
+                         {"op": "weight", "graph": "pesos", "u": 0}):
+                assert cliente.batch([erro])[0]["ok"] is False
+
+            # Lotes maiores que os buffers do socket não bloqueiam cliente nem servidor
+            respostas = cliente.batch({"op": "neighbors", "graph": "pesos", "v": "ana"} for _ in range(20000))
+            assert len(respostas) == 20000 and respostas[-1]["result"] == [["bia", 4.0], ["davi", 1.5]]
+
+        # Vários clientes simultâneos, cada um com as requisições enviadas em lote
+        def consulta(i: int) -> list[dict]:
+            with GraphClient(caminho) as cliente:
+                return cliente.batch({"op": "weight", "graph": "pesos", "u": "davi", "v": i % 5, "id": j}
+                                     for j in range(200))
+
+        with ThreadPoolExecutor(8) as pool:
+            for i, respostas in enumerate(pool.map(consulta, range(8))):
+                assert [r["id"] for r in respostas] == list(range(200))
+                assert all(r["result"] == g.getEdgeWeight(3, i % 5) for r in respostas)
+
+        # Primeiras consultas simultâneas calculam o PageRank uma única vez; falhas inesperadas
+        # do cálculo viram respostas de erro, sem derrubar a conexão
+        chamadas = []
+
+        def pagerank_lento(grafo):
+            chamadas.append(grafo)
+            time.sleep(0.05)
+            return pagerank(grafo)
+
+        def falha(*_):
+            raise RuntimeError("não convergiu")
+
+        def primeiro(_) -> list[tuple[str, float]]:
+            with GraphClient(caminho) as cliente:
+                return cliente.top("pesos", 1)
+
+        monkeypatch.setattr(graph_server, "pagerank", pagerank_lento)
+        servidor.graphs["pesos"]._scores.clear()
+        with ThreadPoolExecutor(4) as pool:
+            tops = list(pool.map(primeiro, range(4)))
+        assert len(chamadas) == 1 and tops.count(tops[0]) == 4
+
+        monkeypatch.setattr(graph_server, "weighted_degree", falha)
+        with GraphClient(caminho) as cliente:
+            resposta = cliente.batch([{"op": "top", "graph": "pesos", "metric": "all"}])[0]
+            assert resposta == {"ok": False, "error": "Erro interno: RuntimeError: não convergiu"}
+            assert cliente.hasEdge("pesos", "ana", "bia")
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        listener.close()
+        loop.run_until_complete(listener.wait_closed())
+        loop.close()
+        servidor.close()
+
+
+def teste_caminhos_e_betweenness():
+    # Colaboração forte (peso 4) encurta o caminho 0 -> 1 -> 3 em relação a 0 -> 2 -> 3
+    g = AdjacencyListGraph(5)
+    g.accumulateEdges([(0, 1, 4.0), (1, 3, 4.0), (0, 2, 1.0), (2, 3, 1.0), (3, 4, 2.0)])
+
+    dist, _ = dijkstra(g, 0)
+    assert dist[3] == 0.5 and dist[4] == 1.0
+    assert shortest_path(g, 0, 4) == [0, 1, 3, 4]
+    assert shortest_path(g, 4, 0) == []
+    for destino in (-1, 5):
+        try:
+            shortest_path(g, 0, destino)
+            assert False, "destino inválido deveria falhar"
+        except ValueError:
+            pass
+    assert dijkstra(g, 0, unit_distance)[0][4] == 3.0
+
+    dist, origem = multi_source_dijkstra(g, [2, 1])
+    assert origem[3] == 1 and origem[0] == -1
+
+    serial = betweenness_centrality(g, normalized=False, processes=1)
+    assert serial == [0.0, 2.0, 0.0, 3.0, 0.0]
+    assert betweenness_centrality(g, normalized=False, processes=2) == serial
+    assert len(betweenness_centrality(g, k=2, seed=1)) == 5
+
+
+def teste_benchmark_sintetico():
+    import random
+    arestas = synthetic_interactions(100, 1000, random.Random(0))
+    assert arestas and all(u != v for u, v, _ in arestas)
+
+    relatorio = run_benchmarks([60], edges_per_user=4, num_ops=20, matrix_limit=50)
+    resultado = relatorio["results"][0]
+    assert "skipped" in resultado["implementations"]["matrix"]
+    lista = resultado["implementations"]["list"]
+    assert lista["hasEdge"]["ops"] == 20 and lista["hasEdge"]["p50_us"] <= lista["hasEdge"]["p99_us"]
+    assert resultado["pipeline"]["edges"] > 0
+
+
 if __name__ == "__main__":
     teste_rapido()
\ No newline at end of file
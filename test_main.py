@@ -0,0 +1,431 @@
+import gc
+import json
+import sys
+import threading
+
+import main
+import parse_cache
+import temporal_graph
+from data_format import Issue, IssueComment, PullComment
+from gdf_reader import load_gdf
+from graph_state import GraphState
+from interaction_table import MISSING, NO_TIME, InteractionTable, author_index, join_authors, parse_times
+from json_stream import iter_array, iter_object
+from multilayer_graph import CLOSE, COMMENT, MERGE, REVIEW
+from profiling import Profiler
+from records import SLIM_FIELDS
+from temporal_graph import DAY, TemporalEdgeStore
+from user_mapper import UserMapper
+
+
+def usuario(login: str, user_id: int) -> dict:
+    return {"login": login, "id": user_id, "node_id": f"U_{user_id}", "type": "User"}
+
+
+def issue(number: int, autor: dict, fechou: dict | None = None, merged_at: str | None = None) -> dict:
+    return {
+        "id": 1000 + number, "node_id": f"I_{number}", "user": autor, "number": number,
+        "title": f"Issue {number}", "state": "closed" if fechou else "open", "comments": 0,
+        "closed_at": "2024-01-02T00:00:00Z" if fechou else None,
+        "pull_request": {"merged_at": merged_at} if merged_at else None,
+        "closed_by": fechou,
+    }
+
+
+def comentario(comment_id: int, autor: dict, url: str, campo: str) -> dict:
+    return {"id": comment_id, "node_id": f"C_{comment_id}", "user": autor, campo: url}
+
+
+def escreve_repo(base, nome: str = "dono/projeto"):
+    """Cria um dump mínimo do downloader em `base/downloader/downloads/<nome>`."""
+    ana, bia, caio, davi = usuario("ana", 1), usuario("bia", 2), usuario("caio", 3), usuario("davi", 4)
+    url = "https://api.github.com/repos/dono/projeto"
+
+    dados = {
+        "issues": [
+            issue(1, ana, fechou=bia),
+            issue(2, bia),
+            issue(3, caio, fechou=ana, merged_at="2024-01-02T00:00:00Z"),
+        ],
+        "issues_comments": [
+            comentario(1, bia, f"{url}/issues/1", "issue_url"),
+            comentario(2, caio, f"{url}/issues/1", "issue_url"),
+            comentario(3, ana, f"{url}/issues/2", "issue_url"),
+            comentario(4, None, f"{url}/issues/2", "issue_url"),
+        ],
+        "pulls_comments": [
+            comentario(5, davi, f"{url}/pulls/3", "pull_request_url"),
+        ],
+        "pulls_reviews": {
+            "3": [comentario(6, ana, f"{url}/pulls/3", "pull_request_url"),
+                  comentario(7, davi, f"{url}/pulls/3", "pull_request_url")],
+        },
+    }
+
+    pasta = base / "downloader" / "downloads" / nome
+    pasta.mkdir(parents=True)
+    for arquivo, conteudo in dados.items():
+        (pasta / f"{arquivo}.json").write_text(json.dumps(conteudo), encoding="utf-8")
+    return pasta
+
+
+def teste_iter_json_em_pedacos(tmp_path):
+    array = [{"a": i, "texto": "x" * (i * 7), "n": [1.5, None, True]} for i in range(50)]
+    objeto = {str(i): [{"v": i}] * (i % 4) for i in range(30)}
+    (tmp_path / "a.json").write_text(json.dumps(array, indent=1))
+    (tmp_path / "o.json").write_text(json.dumps(objeto))
+    (tmp_path / "n.json").write_text("[1234567, 89, 10]")
+
+    for chunk in (1, 3, 64, 1 << 20):
+        assert list(iter_array(str(tmp_path / "a.json"), chunk)) == array
+        assert dict(iter_object(str(tmp_path / "o.json"), chunk)) == objeto
+        assert list(iter_array(str(tmp_path / "n.json"), chunk)) == [1234567, 89, 10]
+
+
+def teste_modo_streaming_equivale(tmp_path, monkeypatch):
+    escreve_repo(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    grafos = []
+    for stream in (False, True):
+        data = main.RepoData(main.RunOptions("dono/projeto", stream=stream))
+        mapper = main.UserMapper()
+        authors = {i.number: mapper.get_id(i.user.login) for i in data.issues()}
+        for c in data.issue_comments():
+            if c.user is not None: mapper.get_id(c.user.login)
+        for c in data.pulls_comments():
+            mapper.get_id(c.user.login)
+
+        graph, comments, merges, reviews = main.build_weighted_graph(
+            mapper, data.issues(), data.issue_comments(), data.pulls_comments(), data.pulls_reviews(), authors)
+        grafos.append(({(mapper.get_name(u), mapper.get_name(v)): graph.getEdgeWeight(u, v)
+                        for u in range(graph.getVertexCount()) for v in graph.adj[u]},
+                       comments, merges, reviews))
+
+    assert grafos[0] == grafos[1]
+    arestas, comments, merges, reviews = grafos[0]
+    assert (comments, merges, reviews) == (4, 1, 2)
+    assert arestas[("bia", "ana")] == 2.0
+    assert arestas[("davi", "caio")] == 6.0
+    assert arestas[("ana", "caio")] == 9.0
+
+
+def teste_decodificador_rapido_equivale_dacite(tmp_path, monkeypatch):
+    escreve_repo(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    opcoes = main.RunOptions("dono/projeto")
+
+    for cls, arquivo in ((Issue, "issues"), (IssueComment, "issues_comments"), (PullComment, "pulls_comments")):
+        rapidos = main.process_list(cls, main.read(opcoes.repo, arquivo))
+        validados = main.process_list(cls, main.read(opcoes.repo, arquivo), validate=True)
+
+        assert len(rapidos) == len(validados)
+        for r, v in zip(rapidos, validados):
+            for campo in SLIM_FIELDS[cls]:
+                a, b = getattr(r, campo), getattr(v, campo)
+                if hasattr(b, "login"):
+                    a, b = (a.login, a.id), (b.login, b.id)
+                elif hasattr(b, "merged_at"):
+                    a, b = a.merged_at, b.merged_at
+                assert a == b
+
+
+def teste_camadas_derivam_grafos(tmp_path, monkeypatch):
+    escreve_repo(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    opcoes = main.RunOptions("dono/projeto")
+
+    data = main.RepoData(opcoes)
+    mapper = main.UserMapper()
+    authors = {i.number: mapper.get_id(i.user.login) for i in data.issues()}
+    mapper.get_id("davi")
+    layers = main.build_layers(mapper, data.issues(), data.issue_comments(), data.pulls_comments(),
+                               data.pulls_reviews(), authors)
+
+    ana, bia, caio, davi = (mapper.get_id(n) for n in ("ana", "bia", "caio", "davi"))
+    assert layers.getCount(ana, caio, MERGE) == 1
+    assert layers.getCount(ana, caio, REVIEW) == 1
+    assert layers.getCount(bia, ana, CLOSE) == 1
+    assert layers.getLayerTotal(COMMENT) == 4
+
+    fechamento = layers.toGraph(main.CLOSING_SCHEME)
+    assert fechamento.getEdgeCount() == 2
+    assert fechamento.hasEdge(bia, ana) and fechamento.hasEdge(ana, caio)
+
+    prs = layers.toGraph(main.PRS_SCHEME)
+    assert {(u, v) for u in range(4) for v in prs.adj[u]} == {(ana, caio), (davi, caio)}
+
+    ponderado = layers.toGraph({COMMENT: 1.0, CLOSE: 10.0})
+    assert ponderado.getEdgeWeight(bia, ana) == 11.0
+
+
+def teste_cache_de_dados(tmp_path, monkeypatch):
+    pasta = escreve_repo(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    opcoes = main.RunOptions("dono/projeto")
+
+    fontes = [main.data_path(opcoes.repo, f) for f in main.DATA_FILES]
+    impressoes = parse_cache.fingerprints(fontes)
+    parsed = main.parse_repo(main.RepoData(opcoes))
+    parse_cache.save(main.cache_path(opcoes.repo), impressoes, parsed)
+
+    carregado = parse_cache.load(main.cache_path(opcoes.repo), fontes)
+    assert carregado is not None
+    assert carregado.logins == parsed.logins
+    assert carregado.issue_authors() == parsed.issue_authors()
+    assert carregado.interactions() == parsed.interactions()
+    assert carregado.users.matches(parsed.users) and list(carregado.users.github_ids) == [1, 2, 3, 4]
+
+    # Com users.map divergente, o cache restaura a tabela completa (IDs do GitHub inclusive)
+    main.load_full(opcoes, fontes)
+    avulso = UserMapper()
+    for login in reversed(parsed.logins):
+        avulso.get_id(login)
+    avulso.save(main.users_path(opcoes.repo))
+    mapper, _, _ = main.load_full(opcoes, fontes)
+    assert mapper.id_to_user == parsed.logins and mapper.get_id("zeca", 2) == mapper.get_id("bia")
+    assert UserMapper.load(main.users_path(opcoes.repo)).matches(parsed.users)
+
+    (pasta / "issues.json").write_text("[]", encoding="utf-8")
+    assert parse_cache.load(main.cache_path(opcoes.repo), fontes) is None
+
+    # Um arquivo reescrito durante o parse não fica associado aos dados antigos
+    parse_cache.save(main.cache_path(opcoes.repo), impressoes, parsed)
+    assert parse_cache.load(main.cache_path(opcoes.repo), fontes) is None
+
+
+def teste_atualizacao_incremental(tmp_path, monkeypatch):
+    pasta = escreve_repo(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    opcoes = main.RunOptions("dono/projeto")
+    fontes = [main.data_path(opcoes.repo, f) for f in main.DATA_FILES]
+
+    completo = {f: json.loads((pasta / f"{f}.json").read_text()) for f in main.DATA_FILES}
+
+    # Primeira execução: issue 2 ainda não baixada (o comentário nela fica pendente), issue 3
+    # ainda aberta, sem o último comentário nem a última review
+    parcial = json.loads(json.dumps(completo))
+    parcial["issues"][2].update(closed_by=None, pull_request={"merged_at": None})
+    parcial["issues"].pop(1)
+    parcial["issues_comments"].pop()
+    parcial["pulls_reviews"]["3"].pop()
+    for f, conteudo in parcial.items():
+        (pasta / f"{f}.json").write_text(json.dumps(conteudo))
+
+    estado = GraphState()
+    main.update_state(estado, main.RepoData(opcoes))
+    estado.save(main.state_path(opcoes.repo), parse_cache.fingerprints(fontes))
+    assert estado.is_current(fontes)
+    assert list(estado.pending_numbers) == [2]
+
+    for f, conteudo in completo.items():
+        (pasta / f"{f}.json").write_text(json.dumps(conteudo))
+    estado = GraphState.load(main.state_path(opcoes.repo))
+    assert not estado.is_current(fontes)
+    novas = main.update_state(estado, main.RepoData(opcoes))
+    assert novas == 4
+    assert len(estado.pending_numbers) == 0
+
+    # Reaplicar os mesmos dados não altera nada
+    assert main.update_state(estado, main.RepoData(opcoes)) == 0
+
+    data = main.RepoData(opcoes)
+    referencia = main.build_layers(estado.mapper, data.issues(), data.issue_comments(), data.pulls_comments(),
+                                   data.pulls_reviews(), estado.issue_authors)
+    assert estado.layers.adj == referencia.adj
+    assert estado.layers.layer_totals == referencia.layer_totals
+
+
+def teste_perfil_por_etapa(tmp_path, monkeypatch):
+    escreve_repo(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    opcoes = main.RunOptions("dono/projeto")
+    monkeypatch.setenv("GRAPH_PROFILE", "cprofile")
+    perfil = opcoes.profiler = Profiler.from_env(cprofile_dir=str(tmp_path / "prof"))
+
+    main.parse_repo(main.RepoData(opcoes))
+    etapas = {e.name: e for e in perfil.stages}
+    assert etapas["read:issues"].records == 3
+    assert etapas["decode:pulls_reviews"].records == 2
+    assert "index_users" not in etapas and etapas["collect_interactions"].records == 9
+    assert all(e.wall_seconds >= 0 and e.peak_memory_mb is not None for e in perfil.stages)
+    assert (tmp_path / "prof" / "collect_interactions.prof").exists()
+
+    perfil.save(str(tmp_path / "perfil.json"))
+    relatorio = json.loads((tmp_path / "perfil.json").read_text())
+    assert [e["name"] for e in relatorio["stages"]] == [e.name for e in perfil.stages]
+
+    monkeypatch.delenv("GRAPH_PROFILE")
+    assert not Profiler.from_env().enabled
+
+    # Uma única passada sobre cada arquivo, também no modo streaming
+    lidos = []
+    stream_list = main.stream_list
+    monkeypatch.setattr(main, "stream_list", lambda cls, repo, nome, validate=False:
+                        lidos.append(nome) or stream_list(cls, repo, nome, validate))
+    parsed = main.parse_repo(main.RepoData(main.RunOptions("dono/projeto", stream=True)))
+    assert sorted(lidos) == ["issues", "issues_comments", "pulls_comments"]
+    assert len(parsed.sources) == 9
+
+
+def teste_lote_isola_falhas_e_combina(tmp_path, monkeypatch):
+    escreve_repo(tmp_path, "dono/projeto")
+    escreve_repo(tmp_path, "outro/projeto")
+    quebrado = escreve_repo(tmp_path, "quebrado/projeto")
+    (quebrado / "issues.json").write_text("[{", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    repos = main.discover_repos()
+    assert repos == ["dono/projeto", "outro/projeto", "quebrado/projeto"]
+
+    resultados = main.run_batch([main.RunOptions(r, use_cache=False) for r in repos], workers=2, merge=True)
+    status = {r.repo: r.ok for r in resultados}
+    assert status == {"dono/projeto": True, "outro/projeto": True, "quebrado/projeto": False}
+    assert (tmp_path / "out" / "weighted_dono_projeto.gdf").exists()
+    assert "Traceback" in (tmp_path / "out" / "logs" / "quebrado_projeto.log").read_text()
+
+    # Os dois repositórios válidos têm os mesmos usuários: o grafo combinado dobra os pesos
+    individual, nomes = load_gdf(str(tmp_path / "out" / "weighted_dono_projeto.gdf"))
+    combinado, nomes_comb = load_gdf(str(tmp_path / "out" / "weighted_merged.gdf"))
+    assert combinado.getEdgeCount() == individual.getEdgeCount()
+    ana, caio = nomes.get_id("ana"), nomes.get_id("caio")
+    assert combinado.getEdgeWeight(nomes_comb.get_id("ana"), nomes_comb.get_id("caio")) == \
+        2 * individual.getEdgeWeight(ana, caio)
+
+
+def teste_tabela_de_interacoes():
+    indice = author_index({7: 0, 3: 2, 12: 1})
+    assert join_authors([3, 5, 12, 7, 99], indice).tolist() == [2, MISSING, 1, 0, MISSING]
+    assert join_authors([1], author_index({})).tolist() == [MISSING]
+
+    # Destinos ausentes e laços são descartados na construção
+    tabela = InteractionTable.build([1, 0, 2, 1], [0, MISSING, 2, 2], COMMENT)
+    assert (tabela.sources.tolist(), tabela.targets.tolist()) == ([1, 1], [0, 2])
+
+    tabela = InteractionTable.concat([
+        InteractionTable.build([2, 0, 2], [1, 1, 1], COMMENT),
+        InteractionTable.build([0, 2], [1, 0], REVIEW),
+    ])
+    u, v, contagens = tabela.aggregate(3, 4)
+    assert list(zip(u.tolist(), v.tolist())) == [(2, 1), (0, 1), (2, 0)]
+    assert contagens[:, COMMENT].tolist() == [2, 1, 0]
+    assert contagens[:, REVIEW].tolist() == [0, 1, 1]
+
+
+def teste_usuarios_de_registros_descartados(tmp_path, monkeypatch):
+    # Sem a varredura prévia, quem só aparece em registros descartados continua virando vértice
+    pasta = escreve_repo(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    revisoes = json.loads((pasta / "pulls_reviews.json").read_text())
+    revisoes["sem-numero"] = [comentario(8, usuario("eva", 5), "", "pull_request_url")]
+    (pasta / "pulls_reviews.json").write_text(json.dumps(revisoes))
+
+    parsed = main.parse_repo(main.RepoData(main.RunOptions("dono/projeto")))
+    assert parsed.logins == ["ana", "bia", "caio", "davi", "eva"]
+    assert len(parsed.sources) == 9
+
+
+def teste_janelas_de_tempo(tmp_path, monkeypatch, capsys):
+    # Interações nos dias 0, 1, 1, 3 e 6; a última não tem data e fica fora das janelas
+    dias = ["2024-01-01T10:00:00Z", "2024-01-02T00:00:00Z", "2024-01-02T23:59:59Z",
+            "2024-01-04T12:00:00Z", "2024-01-07T08:00:00Z", None]
+    tempos = parse_times(dias)
+    assert tempos[-1] == NO_TIME
+    tabela = InteractionTable.concat([
+        InteractionTable.build([0, 1, 0, 2, 0, 1], [1, 0, 1, 0, 2, 2], COMMENT, tempos),
+        InteractionTable.build([0], [1], MERGE, parse_times(["2024-01-02T12:00:00Z"])),
+    ])
+    loja = TemporalEdgeStore(3, tabela)
+    assert len(loja) == 6
+    inicio = loja.span()[0] - loja.span()[0] % DAY
+
+    janela = loja.snapshot(inicio + DAY, inicio + 2 * DAY)
+    assert janela.getCount(0, 1, COMMENT) == 1 and janela.getCount(0, 1, MERGE) == 1
+    assert janela.getCount(1, 0, COMMENT) == 1 and janela.getEdgeCount() == 2
+    assert loja.weighted_snapshot(inicio, inicio + 2 * DAY, main.WEIGHTED_SCHEME).getEdgeWeight(0, 1) == 9.0
+
+    # A janela deslizante incremental equivale a reconstruir cada janela do zero
+    contagens = []
+    for janela in loja.windows(2 * DAY, DAY):
+        novo = loja.snapshot(janela.start, janela.end)
+        assert janela.layers.adj == novo.adj and janela.layers.layer_totals == novo.layer_totals
+        contagens.append(len(janela))
+    assert contagens == [4, 3, 1, 1, 0, 1, 1]
+
+    # Fechamentos e merges do dump levam a data de closed_at/merged_at
+    escreve_repo(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    main.run_repo(main.RunOptions("dono/projeto", use_cache=False, window_days=1))
+    linhas = (tmp_path / "out" / "timeline_dono_projeto.csv").read_text().splitlines()
+    assert linhas == ["start,end,interactions,edges,comment,close,review,merge,weight",
+                      "2024-01-02,2024-01-03,3,2,0,2,0,1,5.0"]
+
+    # Tamanhos de janela e passo não positivos são erros de uso, não exceções no meio da execução
+    for argumentos in (["--window", "-3"], ["--window", "7", "--step", "0"], ["--step", "x"]):
+        monkeypatch.setattr(sys, "argv", ["main.py", "dono/projeto", *argumentos])
+        try:
+            main.main()
+            assert False, "argumento deveria ser rejeitado"
+        except SystemExit as saida:
+            assert saida.code == 2
+    assert "deve ser maior que zero" in capsys.readouterr().err
+
+
+def teste_pausa_do_coletor():
+    assert gc.isenabled()
+    # Aninhada: só a saída mais externa religa o coletor
+    with temporal_graph._paused_gc():
+        with temporal_graph._paused_gc():
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+    # Entre threads: quem sai primeiro não religa o coletor enquanto a outra ainda pausa
+    dentro, sair = threading.Event(), threading.Event()
+
+    def passo():
+        with temporal_graph._paused_gc():
+            dentro.set()
+            sair.wait()
+
+    thread = threading.Thread(target=passo)
+    with temporal_graph._paused_gc():
+        thread.start()
+        dentro.wait()
+    assert not gc.isenabled()
+    sair.set()
+    thread.join()
+    assert gc.isenabled()
+
+    # Um coletor já desligado continua desligado
+    gc.disable()
+    try:
+        with temporal_graph._paused_gc():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def teste_mapper_compacto_persistente(tmp_path):
+    mapper = UserMapper()
+    assert [mapper.get_id(n, i) for n, i in (("ana", 1), ("bia", 2), ("ana", 1))] == [0, 1, 0]
+    # Login renomeado: mesmo ID do GitHub, mesmo vértice
+    assert mapper.get_id("ana-nova", 1) == 0
+    assert mapper.get_id("çédric") == 2
+    assert mapper.get_name(0) == "ana" and mapper.get_name(9) == "Unknown"
+    assert mapper.count() == 3
+
+    mapper.save(str(tmp_path / "users.map"))
+    carregado = UserMapper.load(str(tmp_path / "users.map"))
+    assert carregado.id_to_user == ["ana", "bia", "çédric"]
+    assert carregado.user_to_id == mapper.user_to_id
+    assert carregado.get_id("ana-nova") == 0 and carregado.get_id("x", 2) == 1
+    assert carregado.get_id("caio", 3) == 3
+    assert UserMapper.load(str(tmp_path / "nada.map")) is None
+
+    muitos = UserMapper()
+    for i in range(50000):
+        muitos.get_id(f"user{i}", i + 1)
+    muitos.save(str(tmp_path / "muitos.map"))
+    assert UserMapper.load(str(tmp_path / "muitos.map")).user_to_id == muitos.user_to_id
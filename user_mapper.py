@@ -0,0 +1,183 @@
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import BinaryIO
+
+MAGIC = b"TPGU"
+VERSION = 1
+# magic, versão, número de entradas (logins), número de vértices, tamanho do buffer de logins
+_HEADER = struct.Struct("<4sIQQQ")
+
+
+class UserMapper:
+    """
+    Classe utilitária responsável pelo mapeamento bidirecional entre identificadores
+    de usuários (strings/login do GitHub) e índices numéricos (inteiros).
+
+    Necessária pois a implementação do Grafo (AdjacencyListGraph) opera sobre
+    índices inteiros para otimização de memória, enquanto os dados brutos utilizam
+    strings.
+
+    Os logins ficam em uma tabela compacta: um único buffer UTF-8 contíguo com um vetor
+    de offsets, mais um índice hash (login -> ID) e uma lista para a consulta reversa.
+    Opcionalmente, cada vértice é associado ao ID numérico do usuário no GitHub, de
+    forma que um login renomeado continue no mesmo vértice (o novo login vira um apelido).
+    A tabela pode ser gravada e recarregada (`save`/`load`), o que mantém os IDs dos
+    vértices estáveis entre execuções.
+    """
+
+    def __init__(self):
+        self._user_to_id: dict[str, int] | None = {}
+        self.id_to_user: list[str] = []
+        self._github_to_id: dict[int, int] | None = {}
+        # ID do GitHub de cada vértice (0 se desconhecido)
+        self.github_ids = array('q')
+        # Tabela de logins: o login da entrada i é buffer[offsets[i]:offsets[i + 1]] e
+        # pertence ao vértice entry_ids[i] (um vértice tem mais de uma entrada se foi renomeado)
+        self.buffer = bytearray()
+        self.offsets = array('q', [0])
+        self.entry_ids = array('i')
+
+    @property
+    def counter(self) -> int:
+        return len(self.id_to_user)
+
+    @property
+    def user_to_id(self) -> dict[str, int]:
+        # Depois de `load`, os índices hash só são montados na primeira consulta: quem apenas
+        # traduz IDs em logins (ex.: exportação) não paga por eles
+        if self._user_to_id is None:
+            if len(self.entry_ids) == len(self.id_to_user):
+                self._user_to_id = dict(zip(self.id_to_user, range(len(self.id_to_user))))
+            else:
+                self._user_to_id = dict(zip(self._entry_names(), self.entry_ids))
+        return self._user_to_id
+
+    @property
+    def github_to_id(self) -> dict[int, int]:
+        if self._github_to_id is None:
+            self._github_to_id = dict(zip(self.github_ids, range(len(self.github_ids))))
+            self._github_to_id.pop(0, None)
+        return self._github_to_id
+
+    def get_id(self, username: str, github_id: int | None = None) -> int:
+        """
+        Recupera o ID numérico de um usuário. Se o usuário não existir,
+        gera um novo ID incremental e o registra.
+
+        Com `github_id`, um login ainda desconhecido cujo ID do GitHub já está associado
+        a um vértice (usuário renomeado) é registrado como apelido desse vértice.
+        """
+        index = self._user_to_id if self._user_to_id is not None else self.user_to_id
+        user_id = index.get(username)
+        if user_id is not None:
+            if github_id and not self.github_ids[user_id] and github_id not in self.github_to_id:
+                self.github_ids[user_id] = github_id
+                self.github_to_id[github_id] = user_id
+            return user_id
+
+        if github_id:
+            user_id = self.github_to_id.get(github_id)
+            if user_id is not None:
+                self._add_entry(username, user_id)
+                return user_id
+
+        user_id = len(self.id_to_user)
+        self.id_to_user.append(username)
+        self.github_ids.append(github_id or 0)
+        if github_id:
+            self.github_to_id[github_id] = user_id
+        self._add_entry(username, user_id)
+        return user_id
+
+    def _add_entry(self, username: str, user_id: int) -> None:
+        self.user_to_id[username] = user_id
+        self.buffer += username.encode('utf-8')
+        self.offsets.append(len(self.buffer))
+        self.entry_ids.append(user_id)
+
+    def get_name(self, user_id: int) -> str:
+        """Retorna o login original do GitHub associado a um ID numérico (o primeiro login visto)."""
+        if 0 <= user_id < len(self.id_to_user):
+            return self.id_to_user[user_id]
+        return "Unknown"
+
+    def count(self) -> int:
+        """Retorna o número total de usuários únicos mapeados."""
+        return len(self.id_to_user)
+
+    def matches(self, other: "UserMapper") -> bool:
+        """Indica se as duas tabelas têm os mesmos vértices, IDs do GitHub e apelidos."""
+        return (self.id_to_user == other.id_to_user and self.github_ids == other.github_ids
+                and self.entry_ids == other.entry_ids and self.buffer == other.buffer)
+
+    def write(self, f: BinaryIO) -> None:
+        """Grava a tabela em um arquivo binário aberto (usado também dentro de outros formatos)."""
+        f.write(_HEADER.pack(MAGIC, VERSION, len(self.entry_ids), len(self.id_to_user), len(self.buffer)))
+        self.offsets.tofile(f)
+        self.entry_ids.tofile(f)
+        self.github_ids.tofile(f)
+        f.write(self.buffer)
+
+    @classmethod
+    def read(cls, f: BinaryIO) -> "UserMapper | None":
+        """Lê uma tabela gravada por `write`; retorna None se o formato ou a versão não conferem."""
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            return None
+        magic, version, num_entries, num_users, buffer_len = _HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            return None
+
+        mapper = cls()
+        mapper.offsets = array('q')
+        try:
+            mapper.offsets.fromfile(f, num_entries + 1)
+            mapper.entry_ids.fromfile(f, num_entries)
+            mapper.github_ids.fromfile(f, num_users)
+        except EOFError:
+            return None
+        mapper.buffer = bytearray(f.read(buffer_len))
+        if len(mapper.buffer) != buffer_len:
+            return None
+
+        names = mapper._entry_names()
+        if num_entries == num_users:
+            # Sem apelidos: a entrada i é o vértice i
+            mapper.id_to_user = names
+        else:
+            # O primeiro login de cada vértice é o nome dele; os seguintes são apelidos
+            for name, user_id in zip(names, mapper.entry_ids):
+                if user_id == len(mapper.id_to_user):
+                    mapper.id_to_user.append(name)
+        mapper._user_to_id = mapper._github_to_id = None
+        return mapper
+
+    def _entry_names(self) -> list[str]:
+        starts, ends = self.offsets[:-1], self.offsets[1:]
+        text = self.buffer.decode('utf-8')
+        if len(text) == len(self.buffer):
+            # Somente ASCII (caso de todo login do GitHub): offsets em bytes valem para a string
+            return [text[a:b] for a, b in zip(starts, ends)]
+        data = bytes(self.buffer)
+        return [data[a:b].decode('utf-8') for a, b in zip(starts, ends)]
+
+    def save(self, path: str) -> None:
+        """Grava a tabela de forma atômica (arquivo temporário + rename)."""
+        file = Path(path)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = file.with_name(file.name + ".tmp")
+        with open(tmp, 'wb') as f:
+            self.write(f)
+        os.replace(tmp, file)
+
+    @classmethod
+    def load(cls, path: str) -> "UserMapper | None":
+        """Carrega a tabela gravada em `path`, ou None se não existir ou for de outra versão."""
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+        with f:
+            return cls.read(f)